@@ -99,3 +99,14 @@ def args_to_native(*args: Iterable[Any], **kwargs: Dict[str, Any])\
     native_args = ivy.nested_map(args, _to_native)
     native_kwargs = ivy.nested_map(kwargs, _to_native)
     return native_args, native_kwargs
+
+
+def _native_transform(transform, fn):
+    """
+    Apply a framework function transform, such as jax.vmap or jax.checkpoint, which only accepts native arrays. The
+    nested arrays, including those in containers, are converted to native arrays on the way in to fn and to the
+    transformed function, and the outputs are returned as ivy arrays.
+    """
+    transformed = transform(lambda *a: ivy.nested_map(fn(*a), to_native, include_derived=True))
+    return lambda *args: ivy.nested_map(
+        transformed(*ivy.nested_map(list(args), to_native, include_derived=True)), to_ivy, include_derived=True)
@@ -5,6 +5,7 @@ Base Container Object
 # global
 import re
 import copy
+import os as _os
 import termcolor
 import numpy as _np
 import json as _json
@@ -15,6 +16,7 @@ except ModuleNotFoundError:
     _h5py = None
 import pickle as _pickle
 import random as _random
+import threading as _threading
 from operator import lt as _lt
 from operator import le as _le
 from operator import eq as _eq
@@ -25,6 +27,9 @@ from operator import mul as _mul
 from operator import pow as _pow
 from operator import not_ as _not
 from functools import reduce as _reduce
+from collections import deque as _deque
+from concurrent.futures import Future as _Future
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 from typing import Union, Iterable, Dict
 from operator import truediv as _truediv
 from operator import floordiv as _floordiv
@@ -56,7 +61,8 @@ class Container(dict):
     def __init__(self, dict_in=None, queues=None, queue_load_sizes=None, container_combine_method='list_join',
                  queue_timeout=None, print_limit=10, key_length_limit=None, print_indent=4, print_line_spacing=0,
                  ivyh=None, default_key_color='green', keyword_color_dict=None, rebuild_child_containers=False,
-                 types_to_iteratively_nest=None, alphabetical_keys=True, **kwargs):
+                 types_to_iteratively_nest=None, alphabetical_keys=True, queue_prefetch=None, queue_dev=None,
+                 **kwargs):
         """
         Initialize container object from input dict representation.
 
@@ -97,6 +103,15 @@ class Container(dict):
         :param alphabetical_keys: Whether to sort the container keys alphabetically, or preserve the dict order.
                                   Default is True.
         :type alphabetical_keys: bool, optional
+        :param queue_prefetch: The number of containers to load ahead from the queues in a background thread, which
+                               starts as soon as the container is created. Containers from queues before the earliest
+                               queried index are released once loaded, so the queues should be consumed in order.
+                               Default is None, in which case each queue is only read when first indexed, and all
+                               loaded containers are kept.
+        :type queue_prefetch: int, optional
+        :param queue_dev: The device to move the containers loaded from the queues to, in the background thread if
+                          queue_prefetch is set. Default is None, in which case the containers are not moved.
+        :type queue_dev: ivy.Device, optional
         :param kwargs: keyword arguments for dict creation. Default is None.
         :type kwargs: keyword arguments.
         """
@@ -110,6 +125,13 @@ class Container(dict):
             self._loaded_containers_from_queues = dict()
             self._queue_load_sizes_cum = _np.cumsum(queue_load_sizes)
             self._queue_timeout = ivy.default(queue_timeout, ivy.queue_timeout())
+            self._queue_prefetch = queue_prefetch
+            self._queue_dev = queue_dev
+            if ivy.exists(self._queue_prefetch):
+                self._queue_cond = _threading.Condition()
+                self._queue_requested_max = -1
+                self._queue_released_max = -1
+                self._queue_prefetch_exception = None
         if dict_in is None:
             if kwargs:
                 dict_in = dict(**kwargs)
@@ -125,10 +147,40 @@ class Container(dict):
             types_to_iteratively_nest=types_to_iteratively_nest, alphabetical_keys=alphabetical_keys)
         self._config = dict()
         self.inplace_update(dict_in, **self._config_in)
+        if ivy.exists(self._queues) and ivy.exists(self._queue_prefetch):
+            # started last, as the containers loaded from the queues are built with the config of this container
+            self._queue_prefetch_thread = _threading.Thread(target=self._prefetch_from_queues, daemon=True)
+            self._queue_prefetch_thread.start()
 
     # Class Methods #
     # --------------#
 
+    @staticmethod
+    def _from_trusted(dict_in, config):
+        """
+        Construct a container without sorting the keys or re-checking the values, for use by methods which build a new
+        container from the entries of an existing one. The keys of dict_in must already be in the desired order, and
+        config must be the full config of an existing container. If any value is a dict which is not yet a container,
+        or is of a type to nest iteratively, this falls back to the standard constructor.
+
+        :param dict_in: The dict of keys and values for the new container, with the keys in order.
+        :type dict_in: dict
+        :param config: The full config of an existing container.
+        :type config: dict
+        :return: Container wrapping the entries of dict_in.
+        """
+        types_to_nest = config['types_to_iteratively_nest']
+        for value in dict_in.values():
+            if (isinstance(value, dict) and not isinstance(value, Container)) or \
+                    (types_to_nest and isinstance(value, types_to_nest)):
+                return Container(dict_in, **config)
+        config = dict(config)
+        cont = dict.__new__(Container)
+        cont.__dict__.update({'_local_ivy' if k == 'ivyh' else '_' + k: v for k, v in config.items()})
+        cont.__dict__.update(_queues=None, _container_combine_method='list_join', _config_in=config, _config=config)
+        dict.update(cont, dict_in)
+        return cont
+
     @staticmethod
     def list_join(containers, config=None):
         """
@@ -720,9 +772,9 @@ class Container(dict):
         items = sorted(h5_obj.items()) if alphabetical_keys else h5_obj.items()
         for key, value in items:
             if isinstance(value, _h5py.Group):
-                container_dict[key] = Container.from_disk_as_hdf5(value, slice_obj, ivyh)
+                container_dict[key] = Container.from_disk_as_hdf5(value, slice_obj, alphabetical_keys, ivyh)
             elif isinstance(value, _h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(list(value[slice_obj]))
+                container_dict[key] = ivy.default(ivyh, ivy).array(value[slice_obj])
             else:
                 raise Exception('Item found inside h5_obj which was neither a Group nor a Dataset.')
         return Container(container_dict, ivyh=ivyh)
@@ -756,6 +808,51 @@ class Container(dict):
         with open(json_filepath) as json_data_file:
             return Container(_json.load(json_data_file), ivyh=ivyh)
 
+    @staticmethod
+    def from_disk_as_memmap(dirpath, slice_obj=None, mmap=True, alphabetical_keys=True, ivyh=None):
+        """
+        Load container object from disk at the specified directory, saved via ivy.Container.to_disk_as_memmap.
+        The arrays are memory-mapped, such that only the bytes of the requested slices are read from disk.
+
+        :param dirpath: Directory where the container object is saved to disk.
+        :type dirpath: str
+        :param slice_obj: slice object to slice all arrays along the leading dimensions. Default is None, in which case
+                          the full arrays are loaded.
+        :type slice_obj: slice or sequence of slices, optional
+        :param mmap: Whether to leave the arrays memory-mapped, in which case they are only read from disk when first
+                     accessed. Memory-mapped arrays are only returned directly with the numpy backend, and are
+                     otherwise copied into arrays of the current framework. Default is True.
+        :type mmap: bool, optional
+        :param alphabetical_keys: Whether to sort the container keys alphabetically, or preserve the saved order.
+                                  Default is True.
+        :type alphabetical_keys: bool, optional
+        :param ivyh: Handle to ivy module to use for the calculations. Default is None, which results in the global ivy.
+        :type ivyh: handle to ivy module, optional
+        :return: Container loaded from disk
+        """
+        ivyh_ = ivy.default(ivyh, ivy)
+        with open(_os.path.join(dirpath, 'manifest.json')) as manifest_file:
+            manifest = _json.load(manifest_file)
+        return_as_memmap = mmap and ivyh_.current_framework_str() == 'numpy'
+        container_dict = dict()
+        for kc, entry in manifest['leaves']:
+            if entry['type'] == 'array':
+                value = _np.load(_os.path.join(dirpath, entry['file']), mmap_mode='r' if mmap else None)
+                if ivy.exists(slice_obj):
+                    value = value[slice_obj]
+                if not return_as_memmap:
+                    value = ivyh_.array(_np.asarray(value))
+            elif entry['type'] == 'empty':
+                value = dict()
+            else:
+                value = entry['value']
+            keys = kc.split('/')
+            sub_dict = container_dict
+            for key in keys[:-1]:
+                sub_dict = sub_dict.setdefault(key, dict())
+            sub_dict[keys[-1]] = value
+        return Container(container_dict, alphabetical_keys=alphabetical_keys, ivyh=ivyh)
+
     @staticmethod
     def h5_file_size(h5_obj_or_filepath):
         """
@@ -787,7 +884,7 @@ class Container(dict):
         return size, batch_size
 
     @staticmethod
-    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0):
+    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0, block_size=None):
         """
         Shuffle entries in all datasets of h5 file, such that they are still aligned along axis 0.
 
@@ -795,6 +892,11 @@ class Container(dict):
         :type h5_obj_or_filepath: str or h5 obj
         :param seed_value: random seed to use for array shuffling
         :type seed_value: int
+        :param block_size: The number of rows to permute in memory at once. If specified, each dataset is rewritten
+                           block by block into a new dataset with the same chunking, compression and attributes, using
+                           a single permutation drawn from a local random generator seeded with seed_value. Default is
+                           None, in which case the rows of each dataset are shuffled inplace, one at a time.
+        :type block_size: int, optional
         """
         if not ivy.exists(_h5py):
             raise Exception('You must install python package h5py in order to shuffle hdf5 files on disk.')
@@ -805,9 +907,29 @@ class Container(dict):
         else:
             h5_obj = h5_obj_or_filepath
 
-        for key, value in h5_obj.items():
+        for key, value in list(h5_obj.items()):
             if isinstance(value, _h5py.Group):
-                Container.shuffle_h5_file(value, seed_value)
+                Container.shuffle_h5_file(value, seed_value, block_size)
+            elif isinstance(value, _h5py.Dataset) and ivy.exists(block_size):
+                perm = _np.random.RandomState(seed_value).permutation(value.shape[0])
+                tmp_key = key + '_shuffled'
+                # the new dataset keeps the storage layout, filters and attributes of the one it replaces
+                shuffled = h5_obj.create_dataset(
+                    tmp_key, value.shape, dtype=value.dtype, maxshape=value.maxshape, chunks=value.chunks,
+                    compression=value.compression, compression_opts=value.compression_opts, shuffle=value.shuffle,
+                    fletcher32=value.fletcher32, scaleoffset=value.scaleoffset, fillvalue=value.fillvalue)
+                for attr_key, attr_value in value.attrs.items():
+                    shuffled.attrs[attr_key] = attr_value
+                for start in range(0, value.shape[0], block_size):
+                    block_perm = perm[start:start + block_size]
+                    # h5py requires increasing indices, so read sorted rows and reorder in memory
+                    sort_idxs = _np.argsort(block_perm)
+                    block = value[block_perm[sort_idxs]]
+                    block_out = _np.empty_like(block)
+                    block_out[sort_idxs] = block
+                    shuffled[start:start + len(block_perm)] = block_out
+                del h5_obj[key]
+                h5_obj.move(tmp_key, key)
             elif isinstance(value, _h5py.Dataset):
                 _random.seed(seed_value)
                 # noinspection PyTypeChecker
@@ -817,6 +939,92 @@ class Container(dict):
         if isinstance(h5_obj, _h5py.File):
             h5_obj.close()
 
+    @staticmethod
+    def iter_hdf5(h5_obj_or_filepath, batch_size, shuffle=False, seed_value=0, drop_last=False, num_workers=1,
+                  prefetch=2, alphabetical_keys=True, ivyh=None):
+        """
+        Iterate over an hdf5 file batch by batch, yielding a container for each batch. Each batch is read as one
+        contiguous slice of every dataset, and the next batches are read in background threads while the current batch
+        is being used. Shuffling permutes the order of the batches and the rows within each batch, without rewriting
+        the file.
+
+        :param h5_obj_or_filepath: Filepath where the container object is saved to disk, or h5 object.
+        :type h5_obj_or_filepath: str or h5 obj
+        :param batch_size: The number of rows to read for each batch.
+        :type batch_size: int
+        :param shuffle: Whether to shuffle the order of the batches, and the rows within each batch. Default is False.
+        :type shuffle: bool, optional
+        :param seed_value: random seed to use for the shuffling. Default is 0.
+        :type seed_value: int, optional
+        :param drop_last: Whether to drop the final batch, if it is smaller than batch_size. Default is False.
+        :type drop_last: bool, optional
+        :param num_workers: The number of background threads reading from the file. Default is 1.
+        :type num_workers: int, optional
+        :param prefetch: The number of batches to read ahead of the current batch. Default is 2.
+        :type prefetch: int, optional
+        :param alphabetical_keys: Whether to sort the container keys alphabetically, or preserve the dict order.
+                                  Default is True.
+        :type alphabetical_keys: bool, optional
+        :param ivyh: Handle to ivy module to use for the calculations. Default is None, which results in the global ivy.
+        :type ivyh: handle to ivy module, optional
+        :return: Generator of containers, one for each batch.
+        """
+        if not ivy.exists(_h5py):
+            raise Exception('You must install python package h5py in order to iterate over hdf5 files.')
+        ivyh_ = ivy.default(ivyh, ivy)
+        if type(h5_obj_or_filepath) is str:
+            h5_obj = _h5py.File(h5_obj_or_filepath, 'r')
+        else:
+            h5_obj = h5_obj_or_filepath
+        datasets = list()
+
+        def _collect_datasets(group, key_chain):
+            items = sorted(group.items()) if alphabetical_keys else group.items()
+            for key, value in items:
+                kc = key_chain + '/' + key if key_chain != '' else key
+                if isinstance(value, _h5py.Group):
+                    _collect_datasets(value, kc)
+                elif isinstance(value, _h5py.Dataset):
+                    datasets.append((kc.split('/'), value))
+                else:
+                    raise Exception('Item found inside h5_obj which was neither a Group nor a Dataset.')
+
+        _collect_datasets(h5_obj, '')
+        num_rows = min([dataset.shape[0] for _, dataset in datasets]) if datasets else 0
+        num_batches = num_rows // batch_size if drop_last else -(-num_rows // batch_size)
+        batch_idxs = _np.random.RandomState(seed_value).permutation(num_batches) if shuffle else range(num_batches)
+
+        def _read_batch(i, batch_seed):
+            start = i * batch_size
+            end = min(start + batch_size, num_rows)
+            row_perm = _np.random.RandomState(batch_seed).permutation(end - start) if shuffle else None
+            container_dict = dict()
+            for keys, dataset in datasets:
+                value = dataset[start:end]
+                if row_perm is not None:
+                    value = value[row_perm]
+                sub_dict = container_dict
+                for key in keys[:-1]:
+                    sub_dict = sub_dict.setdefault(key, dict())
+                sub_dict[keys[-1]] = ivyh_.array(value)
+            return Container(container_dict, alphabetical_keys=alphabetical_keys, ivyh=ivyh)
+
+        pool = _ThreadPoolExecutor(max(num_workers, 1))
+        futures = _deque()
+        try:
+            for count, i in enumerate(batch_idxs):
+                futures.append(pool.submit(_read_batch, i, seed_value + count))
+                if len(futures) > prefetch:
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+        finally:
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=True)
+            if isinstance(h5_obj_or_filepath, str):
+                h5_obj.close()
+
     @staticmethod
     def reduce(containers, reduction, config=None):
         """
@@ -831,6 +1039,7 @@ class Container(dict):
         :return: reduced containers
         """
         container0 = containers[0]
+        trusted_config = not ivy.exists(config)
         if not ivy.exists(config):
             config = container0.config if isinstance(container0, Container) else {}
 
@@ -838,6 +1047,8 @@ class Container(dict):
             return_dict = dict()
             for key in container0.keys():
                 return_dict[key] = Container.reduce([container[key] for container in containers], reduction)
+            if trusted_config:
+                return Container._from_trusted(return_dict, config)
             return Container(return_dict, **config)
         else:
             # noinspection PyBroadException
@@ -1404,7 +1615,8 @@ class Container(dict):
                     'but found {} of type {}'.format(p, type(p)))
             return sum([v for k, v in
                         self.map(lambda x, kc: self._ivy.reduce_sum(x ** p)).to_iterator()]) ** (1/p)
-        return self.map(lambda x, kc: self._ivy.vector_norm(x, p[kc] if p_is_container else p, axis, keepdims)
+        return self.map(lambda x, kc: self._ivy.vector_norm(x, axis=axis, keepdims=keepdims,
+                                                            ord=p[kc] if p_is_container else p)
                         if self._ivy.is_array(x) else x, key_chains, to_apply, prune_unapplied, map_sequences)
 
     def matrix_norm(self, p=2, axis=None, keepdims=False, key_chains=None, to_apply=True, prune_unapplied=False,
@@ -1457,7 +1669,7 @@ class Container(dict):
                         key_chains, to_apply, prune_unapplied, map_sequences)
 
     def shuffle(self, seed_value=None, key_chains=None, to_apply=True, prune_unapplied=False, map_sequences=False,
-                key_chain=''):
+                via_permutation=False, key_chain=''):
         """
         Shuffle entries in all sub-arrays, such that they are still aligned along axis 0.
 
@@ -1472,16 +1684,23 @@ class Container(dict):
         :type prune_unapplied: bool, optional
         :param map_sequences: Whether to also map method to sequences (lists, tuples). Default is False.
         :type map_sequences: bool, optional
+        :param via_permutation: Whether to draw a single permutation from a local random generator seeded with
+                                seed_value, and gather every array with it along axis 0, rather than re-seeding the
+                                global random state and shuffling each array separately. Default is False.
+        :type via_permutation: bool, optional
         :param key_chain: Chain of keys for this dict entry
         :type key_chain: str
         """
+        if via_permutation:
+            return self._shuffle_via_permutation(seed_value, key_chains, to_apply, prune_unapplied, map_sequences)
         return_dict = dict()
         if seed_value is None:
             seed_value = self._ivy.to_numpy(self._ivy.random.randint(0, 1000, ())).item()
         for key, value in self.items():
             this_key_chain = key if key_chain == '' else (key_chain + '/' + key)
             if isinstance(value, Container):
-                ret = value.shuffle(seed_value, key_chains, to_apply, prune_unapplied, map_sequences, this_key_chain)
+                ret = value.shuffle(seed_value, key_chains, to_apply, prune_unapplied, map_sequences, via_permutation,
+                                    this_key_chain)
                 if ret:
                     return_dict[key] = ret
             elif isinstance(value, (list, tuple)) and map_sequences:
@@ -1503,6 +1722,27 @@ class Container(dict):
                 return_dict[key] = self._ivy.shuffle(value)
         return Container(return_dict, **self._config)
 
+    def _shuffle_via_permutation(self, seed_value, key_chains, to_apply, prune_unapplied, map_sequences):
+        perm_np = list()
+        perms = dict()
+
+        def _gather(x, _=None):
+            if not self._ivy.is_array(x):
+                return x
+            if not perm_np:
+                perm_np.append(_np.random.RandomState(seed_value).permutation(x.shape[0]))
+            elif x.shape[0] != perm_np[0].shape[0]:
+                raise Exception('all arrays must have the same leading dimension to be shuffled via a permutation, '
+                                'but found sizes {} and {}'.format(perm_np[0].shape[0], x.shape[0]))
+            dev = self._ivy.dev(x, as_str=True)
+            if dev not in perms:
+                # indices of shape [N, 1] gather whole rows, whatever the number of trailing dimensions, and are
+                # passed as a list, as the torch backend does not apply the dtype to numpy inputs
+                perms[dev] = self._ivy.array(_np.expand_dims(perm_np[0], -1).tolist(), 'int64', dev)
+            return self._ivy.gather_nd(x, perms[dev])
+
+        return self.map(_gather, key_chains, to_apply, prune_unapplied, map_sequences)
+
     def slice_via_key(self, slice_key):
         """
         Get slice of container, based on key.
@@ -2127,7 +2367,38 @@ class Container(dict):
             lambda x, kc: self._ivy.to_list(x) if self._ivy.is_array(x) else x, key_chains, to_apply, prune_unapplied,
             map_sequences)
 
-    def to_disk_as_hdf5(self, h5_obj_or_filepath, starting_index=0, mode='a', max_batch_size=None):
+    @staticmethod
+    def _write_to_h5(np_cont, h5_obj, starting_index, max_batch_size, chunks, compression, compression_opts):
+        for key, value in np_cont.items():
+            if isinstance(value, Container):
+                if key not in h5_obj.keys():
+                    h5_group = h5_obj.create_group(key)
+                else:
+                    h5_group = h5_obj[key]
+                Container._write_to_h5(value, h5_group, starting_index, max_batch_size, chunks, compression,
+                                       compression_opts)
+                continue
+            value_shape = value.shape
+            this_batch_size = value_shape[0]
+            leaf_max_batch_size = max_batch_size if max_batch_size else starting_index + this_batch_size
+            if key not in h5_obj.keys():
+                dataset_shape = [leaf_max_batch_size] + list(value_shape[1:])
+                maxshape = ([None for _ in dataset_shape])
+                leaf_chunks = (chunks,) if isinstance(chunks, int) and not isinstance(chunks, bool) else chunks
+                if isinstance(leaf_chunks, tuple):
+                    # the chunk sizes apply to the leading dimensions, so one shape can be used for leaves of any rank
+                    leaf_chunks = tuple([max(min(c, d), 1) for c, d in zip(leaf_chunks, dataset_shape)] +
+                                        [max(d, 1) for d in dataset_shape[len(leaf_chunks):]])
+                else:
+                    leaf_chunks = ivy.default(leaf_chunks, True)
+                h5_obj.create_dataset(key, dataset_shape, dtype=value.dtype, maxshape=maxshape, chunks=leaf_chunks,
+                                      compression=compression, compression_opts=compression_opts)
+            space_left = leaf_max_batch_size - starting_index
+            amount_to_write = min(this_batch_size, space_left)
+            h5_obj[key][starting_index:starting_index + amount_to_write] = value[0:amount_to_write]
+
+    def to_disk_as_hdf5(self, h5_obj_or_filepath, starting_index=0, mode='a', max_batch_size=None, chunks=None,
+                        compression=None, compression_opts=None):
         """
         Save container object to disk, as an h5py file, at the specified filepath.
 
@@ -2139,34 +2410,27 @@ class Container(dict):
         :type mode: str
         :param max_batch_size: Maximum batch size for the container on disk, this is useful if later appending to file.
         :type max_batch_size: int
-        :type h5_obj_or_filepath: str or h5 object
+        :param chunks: The chunking of newly created datasets, either the number of rows per chunk, the chunk sizes of
+                       the leading dimensions with any further dimensions chunked whole, or True for automatic chunking.
+                       Default is None, which uses automatic chunking.
+        :type chunks: int, tuple of ints or bool, optional
+        :param compression: The h5py compression filter for newly created datasets, such as 'gzip' or 'lzf'.
+                            Default is None.
+        :type compression: str, optional
+        :param compression_opts: The options for the compression filter. Default is None.
+        :type compression_opts: any, optional
         """
         if not ivy.exists(_h5py):
             raise Exception('You must install python package h5py in order to save containers to disk as hdf5 files.')
+        np_cont = self.map(lambda x, kc: self._ivy.to_numpy(x))
         if type(h5_obj_or_filepath) is str:
             h5_obj = _h5py.File(h5_obj_or_filepath, mode)
         else:
             h5_obj = h5_obj_or_filepath
-        for key, value in self.items():
-            if isinstance(value, Container):
-                if key not in h5_obj.keys():
-                    h5_group = h5_obj.create_group(key)
-                else:
-                    h5_group = h5_obj[key]
-                value.to_disk_as_hdf5(h5_group, starting_index, mode, max_batch_size)
-            else:
-                value_as_np = self._ivy.to_numpy(value)
-                value_shape = value_as_np.shape
-                this_batch_size = value_shape[0]
-                if not max_batch_size:
-                    max_batch_size = starting_index + this_batch_size
-                if key not in h5_obj.keys():
-                    dataset_shape = [max_batch_size] + list(value_shape[1:])
-                    maxshape = ([None for _ in dataset_shape])
-                    h5_obj.create_dataset(key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape)
-                space_left = max_batch_size - starting_index
-                amount_to_write = min(this_batch_size, space_left)
-                h5_obj[key][starting_index:starting_index + amount_to_write] = value_as_np[0:amount_to_write]
+        Container._write_to_h5(np_cont, h5_obj, starting_index, max_batch_size, chunks, compression,
+                               compression_opts)
+        if type(h5_obj_or_filepath) is str:
+            h5_obj.close()
 
     def to_disk_as_pickled(self, pickle_filepath):
         """
@@ -2202,6 +2466,31 @@ class Container(dict):
         with open(json_filepath, 'w+') as json_data_file:
             _json.dump(self.to_jsonable().to_dict(), json_data_file, indent=4)
 
+    def to_disk_as_memmap(self, dirpath):
+        """
+        Save container object to disk at the specified directory, as a json manifest of key-chains together with one
+        raw .npy file per array, which can be memory-mapped when loading via ivy.Container.from_disk_as_memmap.
+        Non-array leaves are stored in the manifest, and are converted to strings if they are not json-able.
+
+        :param dirpath: Directory for where to save the container to disk.
+        :type dirpath: str
+        """
+        _os.makedirs(dirpath, exist_ok=True)
+        leaves = list()
+        for i, (kc, value) in enumerate(self.to_iterator(include_empty=True)):
+            if self._ivy.is_array(value) or isinstance(value, _np.ndarray):
+                filename = 'array_{}.npy'.format(i)
+                value_as_np = value if isinstance(value, _np.ndarray) else self._ivy.to_numpy(value)
+                _np.save(_os.path.join(dirpath, filename), _np.ascontiguousarray(value_as_np))
+                entry = {'type': 'array', 'file': filename}
+            elif isinstance(value, Container):
+                entry = {'type': 'empty'}
+            else:
+                entry = {'type': 'value', 'value': value if _is_jsonable(value) else str(value)}
+            leaves.append([kc, entry])
+        with open(_os.path.join(dirpath, 'manifest.json'), 'w+') as manifest_file:
+            _json.dump({'leaves': leaves}, manifest_file, indent=4)
+
     def to_list(self):
         """
         Return nested list representation of container object.
@@ -2294,6 +2583,24 @@ class Container(dict):
             else:
                 yield kc
 
+    def indexed(self):
+        """
+        Return an IndexedContainer with the same entries and config, which caches a flat key-chain index, the shape
+        and the device, until an entry is set or deleted.
+
+        :return: IndexedContainer with the same entries.
+        """
+        return IndexedContainer(self, **self._config)
+
+    def pack(self):
+        """
+        Pack all array leaves into one contiguous flat buffer per (dtype, device) group, such that elementwise
+        operations and reductions can be performed with a single call per buffer.
+
+        :return: PackedContainer with the same key-chains, which can be unpacked via PackedContainer.unpack()
+        """
+        return PackedContainer.from_container(self)
+
     def to_flat_list(self):
         """
         Return flat list representation of container object.
@@ -2892,7 +3199,7 @@ class Container(dict):
         return self.map(lambda x, kc: ivy.copy_array(x) if ivy.is_array(x) else x)
 
     def map(self, func, key_chains=None, to_apply=True, prune_unapplied=False, map_sequences=False, inplace=False,
-            key_chain=''):
+            key_chain='', executor=None, num_workers=None, min_parallel_size=4096):
         """
         Apply function to all array values of container
 
@@ -2913,8 +3220,21 @@ class Container(dict):
         :type map_sequences: bool, optional
         :param key_chain: Chain of keys for this dict entry
         :type key_chain: str
+        :param executor: A concurrent.futures executor to apply the function to the leaves in parallel.
+                         Default is None.
+        :type executor: concurrent.futures.Executor, optional
+        :param num_workers: The number of threads to apply the function to the leaves in parallel, if executor is not
+                            specified. Default is None, in which case the function is applied sequentially.
+        :type num_workers: int, optional
+        :param min_parallel_size: The minimum number of elements of a leaf for it to be submitted to the executor,
+                                  smaller leaves are mapped inline. Leaves without a shape use their length, if any.
+                                  Default is 4096.
+        :type min_parallel_size: int, optional
         :return: New container following the function mapped to each sub-array.
         """
+        if ivy.exists(executor) or ivy.exists(num_workers):
+            return self._map_parallel(func, key_chains, to_apply, prune_unapplied, map_sequences, inplace, executor,
+                                      num_workers, min_parallel_size)
         return_dict = self if inplace else dict()
         for key, value in self.items():
             this_key_chain = key if key_chain == '' else (key_chain + '/' + key)
@@ -2940,7 +3260,36 @@ class Container(dict):
                 return_dict[key] = func(value, this_key_chain)
         if inplace:
             return
-        return Container(return_dict, **self._config)
+        return Container._from_trusted(return_dict, self._config)
+
+    def _map_parallel(self, func, key_chains, to_apply, prune_unapplied, map_sequences, inplace, executor,
+                      num_workers, min_parallel_size):
+        own_executor = not ivy.exists(executor)
+        if own_executor:
+            executor = _ThreadPoolExecutor(num_workers)
+
+        def _submit(x, kc):
+            if hasattr(x, 'shape'):
+                size = _reduce(_mul, x.shape, 1)
+            elif hasattr(x, '__len__'):
+                size = len(x)
+            else:
+                size = min_parallel_size
+            if size < min_parallel_size:
+                return func(x, kc)
+            return executor.submit(func, x, kc)
+
+        try:
+            ret = self.map(_submit, key_chains, to_apply, prune_unapplied, map_sequences, inplace)
+            ret = self if inplace else ret
+            ret.map(lambda x, kc: x.result() if isinstance(x, _Future) else x, map_sequences=map_sequences,
+                    inplace=True)
+        finally:
+            if own_executor:
+                executor.shutdown(wait=True)
+        if inplace:
+            return
+        return ret
 
     def map_conts(self, func, key_chains=None, to_apply=True, prune_unapplied=False, inplace=False, key_chain='',
                   include_self=True):
@@ -3363,6 +3712,49 @@ class Container(dict):
         else:
             super.__setattr__(self, name, value)
 
+    def _load_from_queue(self, i):
+        cont = Container(self._queues[i].get(timeout=self._queue_timeout), **self._config).to_ivy()
+        if ivy.exists(self._queue_dev):
+            cont = cont.to_dev(self._queue_dev)
+        return cont
+
+    def _prefetch_from_queues(self):
+        for i in range(len(self._queues)):
+            with self._queue_cond:
+                while len(self._loaded_containers_from_queues) >= self._queue_prefetch and \
+                        i > self._queue_requested_max:
+                    self._queue_cond.wait()
+            try:
+                cont = self._load_from_queue(i)
+            except Exception as e:
+                with self._queue_cond:
+                    self._queue_prefetch_exception = e
+                    self._queue_cond.notify_all()
+                return
+            with self._queue_cond:
+                if i > self._queue_released_max:
+                    self._loaded_containers_from_queues[i] = cont
+                self._queue_cond.notify_all()
+
+    def _get_prefetched_queue_containers(self, queue_idxs):
+        with self._queue_cond:
+            for i in [i for i in self._loaded_containers_from_queues if i < min(queue_idxs)]:
+                del self._loaded_containers_from_queues[i]
+            self._queue_released_max = max(self._queue_released_max, min(queue_idxs) - 1)
+            self._queue_requested_max = max(self._queue_requested_max, max(queue_idxs))
+            self._queue_cond.notify_all()
+            for i in queue_idxs:
+                if i <= self._queue_released_max:
+                    raise Exception('container from queue {} was already released, containers with queue_prefetch '
+                                    'set must be indexed in order'.format(i))
+            if not self._queue_cond.wait_for(
+                    lambda: ivy.exists(self._queue_prefetch_exception) or
+                    min([i in self._loaded_containers_from_queues for i in queue_idxs]), self._queue_timeout):
+                raise Exception('timed out waiting for containers from queues {}'.format(queue_idxs))
+            if not min([i in self._loaded_containers_from_queues for i in queue_idxs]):
+                raise self._queue_prefetch_exception
+            return [self._loaded_containers_from_queues[i] for i in queue_idxs]
+
     def _get_queue_item(self, query):
         if isinstance(query, int):
             queue_queries = [query]
@@ -3372,17 +3764,20 @@ class Container(dict):
             queue_queries = list(range(query[0].start, query[0].stop, ivy.default(query[0].step, 1)))
         else:
             raise Exception('Invalid slice type, must be one of integer, slice, or sequences of slices.')
-        queue_idxs = set([_np.sum(q >= self._queue_load_sizes_cum).item() for q in queue_queries])
-        conts = list()
-        for i in queue_idxs:
-            if i not in self._loaded_containers_from_queues:
-                cont = Container(self._queues[i].get(timeout=self._queue_timeout), **self._config).to_ivy()
-                self._loaded_containers_from_queues[i] = cont
-            else:
-                cont = self._loaded_containers_from_queues[i]
-            conts.append(cont)
+        queue_idxs = sorted(set([_np.sum(q >= self._queue_load_sizes_cum).item() for q in queue_queries]))
+        if ivy.exists(self._queue_prefetch):
+            conts = self._get_prefetched_queue_containers(queue_idxs)
+        else:
+            conts = list()
+            for i in queue_idxs:
+                if i not in self._loaded_containers_from_queues:
+                    cont = self._load_from_queue(i)
+                    self._loaded_containers_from_queues[i] = cont
+                else:
+                    cont = self._loaded_containers_from_queues[i]
+                conts.append(cont)
         combined_cont = self._container_combine_method(conts)
-        idx = list(queue_idxs)[0]
+        idx = queue_idxs[0]
         offset = 0 if idx == 0 else self._queue_load_sizes_cum[idx - 1]
         if isinstance(query, int):
             shifted_query = query - offset
@@ -3427,7 +3822,7 @@ class Container(dict):
                     return_dict[key] = value
                 else:
                     return_dict[key] = value[query]
-        ret = Container(return_dict, **self._config)
+        ret = Container._from_trusted(return_dict, self._config)
         return ret
 
     def __setitem__(self, query, val):
@@ -3670,3 +4065,524 @@ class MultiDevContainer(Container):
 
     def at_devs(self):
         return {ds: self.at_dev(ds) for ds in self._devs}
+
+
+class H5Writer:
+
+    def __init__(self, h5_obj_or_filepath, mode='a', starting_index=0, max_batch_size=None, chunks=None,
+                 compression=None, compression_opts=None, max_pending=2):
+        """
+        Writer for appending many container batches to a single open hdf5 file. The arrays of each batch are copied to
+        the host on the calling thread, while the previous batches are written to disk on a background thread.
+
+        :param h5_obj_or_filepath: Filepath for where to save the containers to disk, or h5 object.
+        :type h5_obj_or_filepath: str or h5 object
+        :param mode: H5 read/write mode for writing to disk, ['r', 'r+', 'w', 'w-', 'a'], default is 'a'.
+        :type mode: str, optional
+        :param starting_index: Batch index for which to start writing to file. Default is 0.
+        :type starting_index: int, optional
+        :param max_batch_size: Maximum batch size for the containers on disk. Default is None, in which case the
+                               datasets are sized to the first batch and grown as further batches are appended.
+        :type max_batch_size: int, optional
+        :param chunks: The chunking of newly created datasets, see ivy.Container.to_disk_as_hdf5. Default is None.
+        :type chunks: int, tuple of ints or bool, optional
+        :param compression: The h5py compression filter for newly created datasets. Default is None.
+        :type compression: str, optional
+        :param compression_opts: The options for the compression filter. Default is None.
+        :type compression_opts: any, optional
+        :param max_pending: The maximum number of batches waiting to be written, before write blocks. Default is 2.
+        :type max_pending: int, optional
+        """
+        if not ivy.exists(_h5py):
+            raise Exception('You must install python package h5py in order to save containers to disk as hdf5 files.')
+        self._owns_file = type(h5_obj_or_filepath) is str
+        self._h5_obj = _h5py.File(h5_obj_or_filepath, mode) if self._owns_file else h5_obj_or_filepath
+        self._index = starting_index
+        self._max_batch_size = max_batch_size
+        self._chunks = chunks
+        self._compression = compression
+        self._compression_opts = compression_opts
+        self._pool = _ThreadPoolExecutor(1)
+        self._pending = _deque()
+        self._max_pending = max_pending
+        self._closed = False
+
+    # Private Methods #
+    # ----------------#
+
+    def _resize(self, np_cont, h5_obj, size):
+        for key, value in np_cont.items():
+            if key not in h5_obj.keys():
+                continue
+            if isinstance(value, Container):
+                self._resize(value, h5_obj[key], size)
+            elif h5_obj[key].shape[0] < size:
+                h5_obj[key].resize(size, axis=0)
+
+    def _write(self, np_cont, starting_index, end_index):
+        if not ivy.exists(self._max_batch_size):
+            self._resize(np_cont, self._h5_obj, end_index)
+        Container._write_to_h5(np_cont, self._h5_obj, starting_index,
+                               ivy.default(self._max_batch_size, end_index), self._chunks, self._compression,
+                               self._compression_opts)
+
+    # Public Methods #
+    # ---------------#
+
+    def write(self, container):
+        """
+        Append a container batch to the file, at the index following the previously written batch.
+
+        :param container: The container batch to write, with all arrays sharing the same leading dimension.
+        :type container: ivy.Container
+        :return: The index at which the batch was written.
+        """
+        if self._closed:
+            raise Exception('cannot write to an H5Writer which has already been closed')
+        np_cont = container.to_numpy(update_backend=False)
+        batch_size = np_cont.to_iterator_values().__next__().shape[0]
+        starting_index = self._index
+        self._index += batch_size
+        while len(self._pending) >= self._max_pending:
+            self._pending.popleft().result()
+        self._pending.append(self._pool.submit(self._write, np_cont, starting_index, self._index))
+        return starting_index
+
+    def flush(self):
+        """
+        Block until all pending batches have been written to disk.
+        """
+        while self._pending:
+            self._pending.popleft().result()
+        self._h5_obj.flush()
+
+    def close(self):
+        """
+        Write all pending batches, and close the file if it was opened by the writer.
+        """
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._pool.shutdown(wait=True)
+            if self._owns_file:
+                self._h5_obj.close()
+
+    # Built-ins #
+    # ----------#
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # Getters #
+    # --------#
+
+    @property
+    def index(self):
+        return self._index
+
+
+class IndexedContainer(Container):
+
+    def __init__(self, dict_in=None, **kwargs):
+        """
+        Container which lazily builds a flat key-chain index over all of its nested entries, and caches the shape and
+        device. The index and caches are invalidated whenever an entry is set or deleted, at any depth. Child
+        containers are rebuilt as IndexedContainer instances, so mutations of the input container are not reflected.
+
+        :param dict_in: the dictionary the container should wrap around. Default is None.
+        :type dict_in: dict, optional
+        :param kwargs: The same config arguments as for ivy.Container.
+        :type kwargs: keyword arguments.
+        """
+        self._index_parent = None
+        self._kc_index = None
+        self._leaf_items = None
+        self._cached_shape = None
+        self._cached_devs = dict()
+        super().__init__(dict_in, **kwargs)
+
+    # Private Methods #
+    # ----------------#
+
+    def _invalidate_index(self):
+        cont = self
+        while cont is not None:
+            cont._kc_index = None
+            cont._leaf_items = None
+            cont._cached_shape = None
+            cont._cached_devs = dict()
+            cont = cont._index_parent
+
+    def _build_index(self):
+        kc_index = dict()
+        leaf_items = list()
+
+        def _add_entries(cont, key_chain):
+            for key, value in cont.items():
+                kc = key if key_chain == '' else key_chain + '/' + key
+                kc_index[kc] = value
+                if isinstance(value, Container) and value:
+                    _add_entries(value, kc)
+                else:
+                    leaf_items.append((kc, value))
+
+        _add_entries(self, '')
+        self._kc_index = kc_index
+        self._leaf_items = leaf_items
+
+    def _get_shape(self):
+        if self._cached_shape is None:
+            self._cached_shape = super()._get_shape()
+        return self._cached_shape
+
+    def _get_dev(self, as_str=False):
+        if as_str not in self._cached_devs:
+            self._cached_devs[as_str] = super()._get_dev(as_str)
+        return self._cached_devs[as_str]
+
+    # Public Methods #
+    # ---------------#
+
+    def inplace_update(self, dict_in, **config):
+        super().inplace_update(dict_in, **config)
+        for key, value in self.items():
+            if not isinstance(value, Container):
+                continue
+            if not isinstance(value, IndexedContainer) or \
+                    (value._index_parent is not None and value._index_parent is not self):
+                value = IndexedContainer(value, **self._config)
+                dict.__setitem__(self, key, value)
+            value._index_parent = self
+        self._invalidate_index()
+
+    def at_key_chain(self, key_chain, ignore_key_errors=False):
+        if self._kc_index is None:
+            self._build_index()
+        key_chain = key_chain.replace('.', '/')
+        if key_chain in self._kc_index:
+            return self._kc_index[key_chain]
+        if ignore_key_errors:
+            return
+        raise KeyError(key_chain)
+
+    def has_key_chain(self, key_chain):
+        if self._kc_index is None:
+            self._build_index()
+        return key_chain.replace('.', '/') in self._kc_index
+
+    def all_key_chains(self, include_empty=False):
+        if include_empty:
+            return super().all_key_chains(include_empty)
+        if self._leaf_items is None:
+            self._build_index()
+        return [kc for kc, _ in self._leaf_items]
+
+    def to_iterator(self, key_chain='', leaf_keys_only=False, include_empty=False):
+        if key_chain != '' or leaf_keys_only or include_empty:
+            yield from super().to_iterator(key_chain, leaf_keys_only, include_empty)
+            return
+        if self._leaf_items is None:
+            self._build_index()
+        yield from self._leaf_items
+
+    # Built-ins #
+    # ----------#
+
+    def __setitem__(self, query, val):
+        if isinstance(query, str) and ('/' in query or '.' in query):
+            return self.set_at_key_chain(query, val, inplace=True)
+        if isinstance(val, Container):
+            # child containers must also be indexed, so that setting entries within them invalidates this index
+            if not isinstance(val, IndexedContainer) or \
+                    (val._index_parent is not None and val._index_parent is not self):
+                val = IndexedContainer(val, **self._config)
+            val._index_parent = self
+        dict.__setitem__(self, query, val)
+        self._invalidate_index()
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._invalidate_index()
+
+
+class PackedContainer:
+
+    def __init__(self, buffers, index, others=None, config=None):
+        """
+        Container whose array leaves are packed into one contiguous flat buffer per (dtype, device) group, with an
+        index of the key-chain, group, offset, size and shape of each leaf. Elementwise operations and reductions run as
+        a single call per buffer, and leaves are retrieved as zero-copy views into the buffers.
+
+        :param buffers: Dict of flat buffers, keyed by (dtype, device) group.
+        :type buffers: dict of arrays
+        :param index: Sequence of (key_chain, group, offset, size, shape) tuples, one for each array leaf.
+        :type index: sequence of tuples
+        :param others: Dict of non-array leaves, keyed by key-chain. Default is None.
+        :type others: dict, optional
+        :param config: The config for the unpacked containers. Default is None.
+        :type config: dict, optional
+        """
+        self._buffers = buffers
+        self._index = index
+        self._others = ivy.default(others, dict())
+        self._config = ivy.default(config, dict())
+        self._leaf_index = {kc: (group, offset, size, shape) for kc, group, offset, size, shape in index}
+
+    # Class Methods #
+    # --------------#
+
+    @staticmethod
+    def from_container(container):
+        """
+        Pack the array leaves of a container into one flat buffer per (dtype, device) group.
+
+        :param container: The container to pack.
+        :type container: ivy.Container
+        :return: The packed container.
+        """
+        local_ivy = container.ivy
+        groups = dict()
+        group_sizes = dict()
+        index = list()
+        others = dict()
+        for kc, x in container.to_iterator():
+            if not local_ivy.is_array(x):
+                others[kc] = x
+                continue
+            group = (local_ivy.dtype(x, as_str=True), local_ivy.dev(x, as_str=True))
+            flat = local_ivy.reshape(x, (-1,))
+            groups.setdefault(group, list()).append(flat)
+            # running total of the sizes packed so far, which gives the offset of this leaf in its buffer
+            offset = group_sizes.get(group, 0)
+            size = int(flat.shape[0])
+            group_sizes[group] = offset + size
+            index.append((kc, group, offset, size, tuple(x.shape)))
+        buffers = {group: local_ivy.concatenate(leaves, 0) for group, leaves in groups.items()}
+        return PackedContainer(buffers, index, others, container.config)
+
+    # Private Methods #
+    # ----------------#
+
+    def _with_buffers(self, buffers):
+        return PackedContainer(buffers, self._index, self._others, self._config)
+
+    def _buffer_map(self, fn):
+        return self._with_buffers({group: fn(buf) for group, buf in self._buffers.items()})
+
+    def _binary(self, other, fn):
+        if isinstance(other, PackedContainer):
+            if other._index != self._index:
+                raise Exception('packed containers must have identical layouts for elementwise operations, but the '
+                                'key-chains, groups or shapes differ')
+            return self._with_buffers({group: fn(buf, other._buffers[group]) for group, buf in self._buffers.items()})
+        if isinstance(other, Container):
+            return self._binary(other.pack(), fn)
+        return self._buffer_map(lambda buf: fn(buf, other))
+
+    @property
+    def _ivy(self):
+        return ivy.default(self._config.get('ivyh'), ivy)
+
+    # Public Methods #
+    # ---------------#
+
+    def unpack(self):
+        """
+        Unpack into a regular container, with each array leaf a zero-copy view into the packed buffers.
+
+        :return: The unpacked container.
+        """
+        cont = Container(**self._config)
+        for kc, _, _, _, _ in self._index:
+            cont.set_at_key_chain(kc, self.at_key_chain(kc), inplace=True)
+        for kc, x in self._others.items():
+            cont.set_at_key_chain(kc, x, inplace=True)
+        return cont
+
+    def same_layout(self, container):
+        """
+        Determine whether the array leaves of a container have the same key-chains, shapes, dtypes and devices as the
+        packed leaves, in the same order, such that the container can be packed into the buffers via pack_into.
+
+        :param container: The container to compare against.
+        :type container: ivy.Container
+        :return: Boolean, whether the container has the same layout.
+        """
+        local_ivy = container.ivy
+        leaves = [(kc, (local_ivy.dtype(x, as_str=True), local_ivy.dev(x, as_str=True)), tuple(x.shape))
+                  for kc, x in container.to_iterator() if local_ivy.is_array(x)]
+        return leaves == [(kc, group, shape) for kc, group, _, _, shape in self._index]
+
+    def pack_into(self, container, check_layout=True):
+        """
+        Pack the array leaves of a container with the same layout into the existing buffers, such as the gradients of
+        the same variables on every step. The leaves are written in place if the backend supports inplace arrays,
+        which avoids allocating new buffers and rebuilding the index, and views retrieved earlier see the new values.
+        Otherwise the buffers are replaced with newly concatenated ones.
+
+        :param container: The container to pack, with the same layout as this packed container.
+        :type container: ivy.Container
+        :param check_layout: Whether to check the layout of the container first. Default is True.
+        :type check_layout: bool, optional
+        :return: This packed container, holding the leaves of the container.
+        """
+        if check_layout and not self.same_layout(container):
+            raise Exception('the container must have the same key-chains, shapes, dtypes and devices as the packed '
+                            'container in order to be packed into it')
+        local_ivy = self._ivy
+        # the layouts match, so the array leaves come in the order of the index
+        leaves = [x for _, x in container.to_iterator() if local_ivy.is_array(x)]
+        if local_ivy.inplace_arrays_supported():
+            buffers = {group: local_ivy.to_native(buffer) for group, buffer in self._buffers.items()}
+            for (_, group, offset, size, _), x in zip(self._index, leaves):
+                buffers[group][offset:offset + size] = local_ivy.to_native(x).reshape(-1)
+            return self
+        groups = dict()
+        for (_, group, _, _, _), x in zip(self._index, leaves):
+            groups.setdefault(group, list()).append(local_ivy.reshape(x, (-1,)))
+        self._buffers = {group: local_ivy.concatenate(leaves, 0) for group, leaves in groups.items()}
+        return self
+
+    def at_key_chain(self, key_chain):
+        """
+        Retrieve the array leaf at the key-chain, as a zero-copy view into the packed buffer.
+
+        :param key_chain: The key-chain of the leaf.
+        :type key_chain: str
+        :return: The array leaf.
+        """
+        if key_chain in self._others:
+            return self._others[key_chain]
+        group, offset, size, shape = self._leaf_index[key_chain]
+        return self._ivy.reshape(self._buffers[group][offset:offset + size], shape)
+
+    def key_chains(self):
+        return [kc for kc, _, _, _, _ in self._index] + list(self._others.keys())
+
+    def map_buffers(self, fn):
+        """
+        Apply an elementwise function to each flat buffer, returning a packed container with the same layout.
+
+        :param fn: The elementwise function, receiving and returning a flat buffer.
+        :type fn: callable
+        :return: The packed container with the function applied.
+        """
+        return self._buffer_map(fn)
+
+    def clip(self, clip_min, clip_max):
+        return self._buffer_map(lambda buf: self._ivy.clip(buf, clip_min, clip_max))
+
+    def minimum(self, other):
+        return self._binary(other, self._ivy.minimum)
+
+    def maximum(self, other):
+        return self._binary(other, self._ivy.maximum)
+
+    def reduce_sum(self):
+        """
+        The sum across all array leaves, computed with one reduction per buffer.
+        """
+        return sum([self._ivy.reduce_sum(buf) for buf in self._buffers.values()])
+
+    def reduce_max(self):
+        """
+        The max across all array leaves, computed with one reduction per buffer.
+        """
+        return max([self._ivy.reduce_max(buf) for buf in self._buffers.values()])
+
+    def reduce_min(self):
+        """
+        The min across all array leaves, computed with one reduction per buffer.
+        """
+        return min([self._ivy.reduce_min(buf) for buf in self._buffers.values()])
+
+    def vector_norm(self, p=2):
+        """
+        The vector p-norm across all array leaves, equivalent to Container.vector_norm with global_norm=True.
+        """
+        return sum([self._ivy.reduce_sum(self._ivy.abs(buf) ** p) for buf in self._buffers.values()]) ** (1/p)
+
+    # Built-ins #
+    # ----------#
+
+    def __getitem__(self, key_chain):
+        return self.at_key_chain(key_chain)
+
+    def __contains__(self, key_chain):
+        return key_chain in self._leaf_index or key_chain in self._others
+
+    def __len__(self):
+        return len(self._index) + len(self._others)
+
+    def __repr__(self):
+        return 'PackedContainer({} arrays in {} buffers, {} other leaves)'.format(
+            len(self._index), len(self._buffers), len(self._others))
+
+    def __neg__(self):
+        return self._buffer_map(lambda buf: -buf)
+
+    def __abs__(self):
+        return self._buffer_map(self._ivy.abs)
+
+    def __pow__(self, power):
+        return self._binary(power, lambda x, y: x ** y)
+
+    def __rpow__(self, power):
+        return self._buffer_map(lambda buf: power ** buf)
+
+    def __add__(self, other):
+        return self._binary(other, lambda x, y: x + y)
+
+    def __radd__(self, other):
+        return self._buffer_map(lambda buf: other + buf)
+
+    def __sub__(self, other):
+        return self._binary(other, lambda x, y: x - y)
+
+    def __rsub__(self, other):
+        return self._buffer_map(lambda buf: other - buf)
+
+    def __mul__(self, other):
+        return self._binary(other, lambda x, y: x * y)
+
+    def __rmul__(self, other):
+        return self._buffer_map(lambda buf: other * buf)
+
+    def __truediv__(self, other):
+        return self._binary(other, lambda x, y: x / y)
+
+    def __rtruediv__(self, other):
+        return self._buffer_map(lambda buf: other / buf)
+
+    def __lt__(self, other):
+        return self._binary(other, lambda x, y: x < y)
+
+    def __le__(self, other):
+        return self._binary(other, lambda x, y: x <= y)
+
+    def __gt__(self, other):
+        return self._binary(other, lambda x, y: x > y)
+
+    def __ge__(self, other):
+        return self._binary(other, lambda x, y: x >= y)
+
+    # Getters and Setters #
+    # --------------------#
+
+    @property
+    def buffers(self):
+        return self._buffers
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def config(self):
+        return self._config
@@ -3,6 +3,8 @@ import inspect
 import importlib
 import numpy as np
 from types import ModuleType
+# noinspection PyProtectedMember
+from ivy.array.conversions import _to_native, _to_ivy
 
 
 wrapped_modules_n_classes = []
@@ -11,12 +13,12 @@ NON_WRAPPED_METHODS = ['current_framework', 'current_framework_str', 'set_framew
                        'unset_debug_mode', 'debug_mode', 'nested_map', 'to_ivy', 'args_to_ivy', 'to_native',
                        'args_to_native', 'default', 'exists', 'set_min_base', 'get_min_base', 'set_min_denominator',
                        'get_min_denominator', 'split_func_call_across_gpus', 'cache_fn', 'split_func_call',
-                       'compile', 'compile_graph', 'dev', 'dev', 'dev_to_str', 'dev_from_str', 'memory_on_dev',
+                       'compile', 'compile_graph', 'vmap', 'dev', 'dev', 'dev_to_str', 'dev_from_str', 'memory_on_dev',
                        'gpu_is_available', 'num_gpus', 'tpu_is_available', 'dtype', 'dtype_to_str', 'cprint',
                        'to_ivy_module', 'tree_flatten', 'tree_unflatten', 'start_compiling', 'stop_compiling',
                        'get_compiled', 'index_nest', 'set_nest_at_index', 'map_nest_at_index', 'multi_index_nest',
                        'set_nest_at_indices', 'map_nest_at_indices', 'nested_indices_where', 'map',
-                       'unset_default_device', 'closest_valid_dtype', 'default_dtype', 'dtype_from_str']
+                       'unset_default_device', 'closest_valid_dtype', 'default_dtype', 'dtype_from_str', 'checkpoint']
 
 ARRAYLESS_RET_METHODS = ['to_numpy', 'to_list', 'to_scalar', 'shape', 'get_num_dims', 'is_array', 'is_variable']
 NESTED_ARRAY_RET_METHODS = ['unstack', 'split']
@@ -35,6 +37,10 @@ NATIVE_KEYS_TO_SKIP = {'numpy': [],
                        'mxnet': []}
 
 
+_NATIVE_RET_METHODS = frozenset(ARRAYLESS_RET_METHODS + NESTED_ARRAY_RET_METHODS)
+_NEST_TYPES = frozenset([tuple, list, dict])
+
+
 # Methods #
 
 def _wrap_method(fn):
@@ -45,12 +51,29 @@ def _wrap_method(fn):
     if hasattr(fn, 'wrapped') and fn.wrapped:
         return fn
 
+    native_ret = getattr(fn, '__name__', None) in _NATIVE_RET_METHODS
+
     def _method_wrapped(*args, **kwargs):
+        # fast path for flat arguments, avoiding the nested traversal
+        for a in args:
+            if type(a) in _NEST_TYPES:
+                break
+        else:
+            for v in kwargs.values():
+                if type(v) in _NEST_TYPES:
+                    break
+            else:
+                ret = fn(*[_to_native(a) for a in args], **{k: _to_native(v) for k, v in kwargs.items()})
+                if native_ret:
+                    return ret
+                if type(ret) in _NEST_TYPES:
+                    return ivy.to_ivy(ret, nested=True)
+                return _to_ivy(ret)
         native_args, native_kwargs = ivy.args_to_native(*args, **kwargs)
-        native_ret = fn(*native_args, **native_kwargs)
-        if fn.__name__ in ARRAYLESS_RET_METHODS + NESTED_ARRAY_RET_METHODS:
-            return native_ret
-        return ivy.to_ivy(native_ret, nested=True)
+        ret = fn(*native_args, **native_kwargs)
+        if native_ret:
+            return ret
+        return ivy.to_ivy(ret, nested=True)
 
     if hasattr(fn, '__name__'):
         _method_wrapped.__name__ = fn.__name__
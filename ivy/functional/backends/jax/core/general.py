@@ -19,6 +19,8 @@ from haiku._src.data_structures import FlatMapping
 import ivy
 from ivy.functional.ivy.core import default_device, default_dtype
 from ivy.functional.backends.jax.core.device import to_dev, dev as callable_dev
+# noinspection PyProtectedMember
+from ivy.functional.ivy.core.compilation import _vmap_over_array_leaves
 
 DTYPE_TO_STR = {_jnp.dtype('int8'): 'int8',
                 _jnp.dtype('int16'): 'int16',
@@ -456,6 +458,16 @@ def dtype_from_str(dtype_in):
 
 compile = lambda fn, dynamic=True, example_inputs=None, static_argnums=None, static_argnames=None: \
     _jax.jit(fn, static_argnums=static_argnums, static_argnames=static_argnames)
+
+
+def _map_with_jax_vmap(fn, arrays, axes, out_axes):
+    return _jax.vmap(lambda *slices: fn(list(slices)), tuple(axes), out_axes)(*arrays)
+
+
+def vmap(func, in_axes=0, out_axes=0):
+    return _vmap_over_array_leaves(func, in_axes, out_axes, _map_with_jax_vmap)
+
+
 current_framework_str = lambda: 'jax'
 current_framework_str.__name__ = 'current_framework_str'
 multiprocessing = lambda context=None: _multiprocessing if context is None else _multiprocessing.get_context(context)
@@ -11,6 +11,8 @@ from jaxlib.xla_extension import Buffer
 # local
 import ivy
 from ivy.container import Container
+# noinspection PyProtectedMember
+from ivy.array.conversions import _native_transform
 
 # ToDo: modify these functions to track whether variable() has been called
 variable = lambda x: x
@@ -47,3 +49,7 @@ def execute_with_gradients(func, xs, retain_grads=False):
 
 
 stop_gradient = lambda x, preserve_type=True: _jlax.stop_gradient(x)
+
+
+def checkpoint(fn, *args, **kwargs):
+    return _native_transform(_jax.checkpoint, lambda *a: fn(*a, **kwargs))(*args)
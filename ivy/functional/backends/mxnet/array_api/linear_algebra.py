@@ -8,12 +8,12 @@ from ivy import inf
 
 
 def vector_norm(x: mx.ndarray.ndarray.NDArray,
-                p: Union[int, float, Literal[inf, - inf]] = 2,
                 axis: Optional[Union[int, Tuple[int]]] = None,
-                keepdims: bool = False)\
+                keepdims: bool = False,
+                ord: Union[int, float, Literal[inf, - inf]] = 2)\
                     -> mx.ndarray.ndarray.NDArray:
 
-    return mx.np.linalg.norm(x, p, axis, keepdims)
+    return mx.np.linalg.norm(x, ord, axis, keepdims)
 
 
 def diagonal(x: mx.nd.NDArray,
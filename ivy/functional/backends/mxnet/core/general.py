@@ -16,6 +16,8 @@ import multiprocessing as _multiprocessing
 
 # local
 from ivy.functional.ivy.core import default_device, default_dtype
+# noinspection PyProtectedMember
+from ivy.functional.ivy.core.compilation import _vmap_with_loop
 from ivy.functional.backends.mxnet.core.device import _callable_dev, dev_to_str
 
 
@@ -552,6 +554,7 @@ def compile(func, dynamic=True, example_inputs=None, static_argnums=None, static
     return func
 
 
+vmap = _vmap_with_loop
 current_framework_str = lambda: 'mxnet'
 current_framework_str.__name__ = 'current_framework_str'
 multiprocessing = lambda context=None: _multiprocessing if context is None else _multiprocessing.get_context(context)
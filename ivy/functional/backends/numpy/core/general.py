@@ -13,6 +13,8 @@ import multiprocessing as _multiprocessing
 # local
 import ivy
 from ivy.functional.ivy.core import default_dtype
+# noinspection PyProtectedMember
+from ivy.functional.ivy.core.compilation import _vmap_with_loop
 from ivy.functional.backends.numpy.core.device import _dev_callable
 
 
@@ -464,6 +466,7 @@ def compile(func, dynamic=True, example_inputs=None, static_argnums=None, static
     return func
 
 
+vmap = _vmap_with_loop
 current_framework_str = lambda: 'numpy'
 current_framework_str.__name__ = 'current_framework_str'
 multiprocessing = lambda context=None: _multiprocessing if context is None else _multiprocessing.get_context(context)
@@ -37,3 +37,6 @@ def stop_gradient(x, preserve_type=True):
     logging.warning('NumPy does not support autograd, '
                     '"stop_gradient" has no effect on the array, as gradients are not supported in the first place.')
     return x
+
+
+checkpoint = lambda fn, *args, **kwargs: fn(*args, **kwargs)
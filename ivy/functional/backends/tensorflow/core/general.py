@@ -15,6 +15,8 @@ from tensorflow.python.types.core import Tensor
 
 # local
 from ivy.functional.ivy.core import default_device, default_dtype
+# noinspection PyProtectedMember
+from ivy.functional.ivy.core.compilation import _vmap_over_array_leaves
 from ivy.functional.backends.tensorflow.core.device import _dev_callable, dev_from_str
 
 DTYPE_TO_STR = {_tf.int8: 'int8',
@@ -444,6 +446,17 @@ def dtype_from_str(dtype_in):
 
 
 compile = lambda fn, dynamic=True, example_inputs=None, static_argnums=None, static_argnames=None: _tf.function(fn)
+
+
+def _map_with_vectorized_map(fn, arrays, axes, out_axes):
+    arrays = [_tf.experimental.numpy.moveaxis(x, axis, 0) for x, axis in zip(arrays, axes)]
+    return [_tf.experimental.numpy.moveaxis(o, 0, out_axes) for o in _tf.vectorized_map(fn, arrays)]
+
+
+def vmap(func, in_axes=0, out_axes=0):
+    return _vmap_over_array_leaves(func, in_axes, out_axes, _map_with_vectorized_map)
+
+
 current_framework_str = lambda: 'tensorflow'
 current_framework_str.__name__ = 'current_framework_str'
 multiprocessing = lambda context=None: _multiprocessing if context is None else _multiprocessing.get_context(context)
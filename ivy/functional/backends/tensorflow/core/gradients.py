@@ -48,3 +48,6 @@ def stop_gradient(x, preserve_type=True):
     if is_var and preserve_type:
         return variable(x)
     return x
+
+
+checkpoint = lambda fn, *args, **kwargs: fn(*args, **kwargs)
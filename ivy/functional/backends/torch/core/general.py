@@ -15,6 +15,8 @@ from typing import List, Dict, Optional, Union
 
 # local
 from ivy.functional.ivy.core import default_device, default_dtype
+# noinspection PyProtectedMember
+from ivy.functional.ivy.core.compilation import _vmap_with_loop, _vmap_over_array_leaves
 from ivy.functional.backends.torch.core.device import dev_from_str, _callable_dev
 
 # API #
@@ -662,6 +664,16 @@ def compile(fn, dynamic=True, example_inputs=None, static_argnums=None, static_a
     return _torch.jit.trace(fn, example_inputs)
 
 
+def _map_with_torch_vmap(fn, arrays, axes, out_axes):
+    return _torch.func.vmap(lambda *slices: fn(list(slices)), in_dims=tuple(axes), out_dims=out_axes)(*arrays)
+
+
+def vmap(func, in_axes=0, out_axes=0):
+    if hasattr(_torch, 'func'):
+        return _vmap_over_array_leaves(func, in_axes, out_axes, _map_with_torch_vmap)
+    return _vmap_with_loop(func, in_axes, out_axes)
+
+
 def current_framework_str():
     return 'torch'
 
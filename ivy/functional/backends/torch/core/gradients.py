@@ -6,6 +6,11 @@ Collection of PyTorch gradient functions, wrapped to fit Ivy syntax and signatur
 import ivy
 import torch as _torch
 import warnings as _warnings
+from torch.utils.checkpoint import checkpoint as _checkpoint
+
+# local
+# noinspection PyProtectedMember
+from ivy.array.conversions import _native_transform
 
 
 def variable(x):
@@ -54,3 +59,9 @@ def stop_gradient(x, preserve_type=True):
                 x.grad.data.zero_()
         return x
     return x.detach()
+
+
+def checkpoint(fn, *args, **kwargs):
+    # the non-reentrant variant is required for torch.autograd.grad, which execute_with_gradients uses
+    return _native_transform(lambda f: lambda *a: _checkpoint(f, *a, use_reentrant=False),
+                             lambda *a: fn(*a, **kwargs))(*args)
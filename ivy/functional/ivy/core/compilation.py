@@ -6,6 +6,7 @@ Collection of general Ivy compilation functions.
 from typing import Callable, Any, Union, Tuple, Iterable
 
 # local
+import ivy
 from ivy.framework_handler import current_framework as _cur_framework
 
 
@@ -31,3 +32,70 @@ def compile(func: Callable, dynamic: bool = True, example_inputs: Union[Any, Tup
     """
     return _cur_framework(example_inputs).compile(
         func, dynamic, example_inputs, static_argnums, static_argnames)
+
+
+def _vmap_over_array_leaves(func: Callable, in_axes: Union[int, Iterable[int]], out_axes: int,
+                            map_fn: Callable) -> Callable:
+    """
+    Vectorize a function over the array leaves of its nested arguments, including those in containers, for the
+    vectorizing maps of the frameworks, which only accept flat sequences of native arrays. map_fn(fn, arrays, axes,
+    out_axes) maps fn over the native arrays along their axes, with fn receiving and returning a list of native array
+    slices, and stacks the returned slices along out_axes.
+    """
+
+    def _vmapped(*args):
+        axes = list(in_axes) if isinstance(in_axes, (list, tuple)) else [in_axes] * len(args)
+        args = ivy.copy_nest(list(args), include_derived=True, to_mutable=True)
+        idxs = [idx for idx in ivy.nested_indices_where(args, ivy.is_array) if axes[idx[0]] is not None]
+        if not idxs:
+            raise Exception('vmap requires at least one array argument to map over, but none were found.')
+        ret_nest = dict()
+
+        def _fn(slices):
+            for idx, slc in zip(idxs, slices):
+                ivy.set_nest_at_index(args, idx, ivy.to_ivy(slc))
+            ret = ivy.copy_nest([func(*ivy.copy_nest(args, include_derived=True))], include_derived=True,
+                                to_mutable=True)
+            # the nest of the outputs is kept, with the array leaves replaced by the stacked outputs afterwards
+            ret_nest['ret'], ret_nest['idxs'] = ret, ivy.nested_indices_where(ret, ivy.is_array)
+            return [ivy.to_native(ivy.index_nest(ret, idx)) for idx in ret_nest['idxs']]
+
+        outs = map_fn(_fn, [ivy.to_native(ivy.index_nest(args, idx)) for idx in idxs],
+                      [axes[idx[0]] for idx in idxs], out_axes)
+        for idx, out in zip(ret_nest['idxs'], outs):
+            ivy.set_nest_at_index(ret_nest['ret'], idx, ivy.to_ivy(out))
+        return ret_nest['ret'][0]
+
+    return _vmapped
+
+
+def _map_with_loop(fn, arrays, axes, out_axes):
+    slices = [ivy.unstack(x, axis) for x, axis in zip(arrays, axes)]
+    rets = [fn(list(slcs)) for slcs in zip(*slices)]
+    return [ivy.stack(list(outs), out_axes) for outs in zip(*rets)]
+
+
+def _vmap_with_loop(func: Callable, in_axes: Union[int, Iterable[int]] = 0, out_axes: int = 0) -> Callable:
+    """
+    Fallback for frameworks without a native vmap, which unstacks the array arguments along their mapped axes, calls
+    the function once per slice, and stacks the array outputs along out_axes.
+    """
+    return _vmap_over_array_leaves(func, in_axes, out_axes, _map_with_loop)
+
+
+def vmap(func: Callable, in_axes: Union[int, Iterable[int]] = 0, out_axes: int = 0) -> Callable:
+    """
+    Vectorize a function over a leading batch axis of its array arguments, such that it is traced once for the whole
+    batch rather than once per example. The framework's native vmap is used where available, which is jax.vmap,
+    torch.func.vmap and tf.vectorized_map, and otherwise the function is called once per slice of the batch.
+
+    :param func: Function to be vectorized.
+    :type func: callable
+    :param in_axes: The axis to map over for each positional argument, applied to all arrays in nested arguments.
+                    None means the argument is broadcast to all calls. Default is 0 for all arguments.
+    :type in_axes: int or sequence of ints, optional
+    :param out_axes: The axis along which to stack the array outputs. Default is 0.
+    :type out_axes: int, optional
+    :return: The handle to the vectorized function.
+    """
+    return _cur_framework().vmap(func, in_axes, out_axes)
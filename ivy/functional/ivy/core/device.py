@@ -13,6 +13,9 @@ import psutil
 import inspect
 import logging
 import nvidia_smi
+import numpy as _np
+from multiprocessing import shared_memory as _shared_memory
+from multiprocessing import resource_tracker as _resource_tracker
 
 # noinspection PyUnresolvedReferences
 try:
@@ -386,6 +389,10 @@ def set_split_factor(factor, dev=None):
     split_factors[dev] = factor
 
 
+def _chunk_size_from_split_factor(max_chunk_size, dev=None):
+    return 1 + int(round((max_chunk_size-1) * ivy.split_factor(ivy.default_device(dev))))
+
+
 # noinspection PyShadowingNames
 def split_func_call(func: Callable, inputs: Iterable[Union[Union[ivy.Array, ivy.NativeArray], ivy.Container]],
                     mode: str, max_chunk_size: int = None, chunk_size: int = None,
@@ -428,8 +435,7 @@ def split_func_call(func: Callable, inputs: Iterable[Union[Union[ivy.Array, ivy.
         if max_dim > max_chunk_size:
             max_chunk_sizes[shape_key] = max_dim
             max_chunk_size = max_dim
-    chunk_size = ivy.default(
-        chunk_size, lambda: 1 + int(round((max_chunk_size-1) * ivy.split_factor(ivy.default_device(dev)))), True)
+    chunk_size = ivy.default(chunk_size, lambda: _chunk_size_from_split_factor(max_chunk_size, dev), True)
     dim_size = inputs[0].shape[input_axes[0]]
     if chunk_size >= dim_size:
         return func(*inputs)
@@ -896,12 +902,135 @@ def dev_unify_nest(args: Type[MultiDev], kwargs: Type[MultiDev], dev, mode, axis
     return args_uni, kwargs_uni
 
 
+# Shared Memory Transport #
+# ------------------------#
+
+class _SharedMemoryOwner:
+
+    def __init__(self, shm, shape, dtype):
+        """
+        Owner of a mapped shared memory block, which exposes the block as an array via the numpy array interface. Numpy
+        arrays created from the owner keep it as their base, so the block stays mapped for as long as any array viewing
+        it is alive, and is closed once the last of them is garbage collected.
+
+        :param shm: The shared memory block, which must stay open until the owner is deleted.
+        :type shm: multiprocessing.shared_memory.SharedMemory
+        :param shape: The shape of the array stored in the block.
+        :type shape: tuple of ints
+        :param dtype: The numpy data type of the array stored in the block.
+        :type dtype: str
+        """
+        self._shm = shm
+        # the address is read through a temporary view, which is deleted so that no buffer exports prevent closing
+        probe = _np.frombuffer(shm.buf, _np.uint8, count=1)
+        self.__array_interface__ = {'shape': tuple(shape), 'typestr': _np.dtype(dtype).str,
+                                    'data': (probe.__array_interface__['data'][0], False), 'version': 3}
+        del probe
+
+    def __del__(self):
+        self._shm.close()
+
+
+class _SharedArray:
+
+    def __init__(self, x):
+        """
+        Descriptor for an array copied into a shared memory block, which can be sent through a multiprocessing queue in
+        place of the array itself. The sender copies the array into the block once. With the numpy backend, the
+        receiver is handed a zero-copy view of the block, which stays mapped for as long as the view or any array
+        derived from it is alive. Other backends copy the view into an array of their own. The block is unlinked by
+        the process which loads the array, or via release if the descriptor is never loaded.
+
+        :param x: The array to copy into shared memory.
+        :type x: array
+        """
+        x_np = _np.ascontiguousarray(ivy.to_numpy(x))
+        shm = _shared_memory.SharedMemory(create=True, size=max(x_np.nbytes, 1))
+        _np.ndarray(x_np.shape, x_np.dtype, buffer=shm.buf)[...] = x_np
+        # the receiving process unlinks the block, so it should not be tracked by the sending process
+        # noinspection PyProtectedMember
+        _resource_tracker.unregister(shm._name, 'shared_memory')
+        shm.close()
+        self.name = shm.name
+        self.shape = x_np.shape
+        self.dtype = x_np.dtype.name
+        self.dev = dev(x, as_str=True)
+
+    def load(self):
+        shm = _shared_memory.SharedMemory(name=self.name)
+        # only the name is removed, the block itself stays mapped until the owner closes it
+        shm.unlink()
+        view = _np.asarray(_SharedMemoryOwner(shm, self.shape, self.dtype))
+        if ivy.current_framework_str() == 'numpy':
+            return view
+        return ivy.array(view, dtype=self.dtype, dev=self.dev)
+
+    def release(self):
+        try:
+            shm = _shared_memory.SharedMemory(name=self.name)
+        except FileNotFoundError:
+            return
+        shm.close()
+        shm.unlink()
+
+
+def _to_shared_memory(nest):
+    if ivy.current_framework_str() == 'torch':
+        # torch multiprocessing queues already move tensors into shared memory
+        return nest
+
+    created = list()
+
+    def _share(x):
+        if isinstance(x, ivy.Container):
+            return x.map(lambda x_, kc: _share(x_))
+        if ivy.is_array(x):
+            created.append(_SharedArray(x))
+            return created[-1]
+        return x
+
+    try:
+        return ivy.nested_map(nest, _share)
+    except Exception:
+        [x.release() for x in created]
+        raise
+
+
+def _from_shared_memory(nest):
+
+    def _load(x):
+        if isinstance(x, ivy.Container):
+            return x.map(lambda x_, kc: _load(x_))
+        if isinstance(x, _SharedArray):
+            return x.load()
+        return x
+
+    try:
+        return ivy.nested_map(nest, _load)
+    except Exception:
+        _release_shared_memory(nest)
+        raise
+
+
+def _release_shared_memory(nest):
+
+    def _release(x):
+        if isinstance(x, ivy.Container):
+            return x.map(lambda x_, kc: _release(x_))
+        if isinstance(x, _SharedArray):
+            x.release()
+        return x
+
+    ivy.nested_map(nest, _release)
+
+
 # Device Mappers #
 # ---------------#
 
 class DevMapper(abc.ABC):
 
-    def __init__(self, fn, ret_fn, queue_class, worker_class, devs, timeout=None, constant=None, unique=None):
+    def __init__(self, fn, ret_fn, queue_class, worker_class, devs, timeout=None, constant=None, unique=None,
+                 shared_memory=False):
         """
         Device Mapper base class.
 
@@ -921,12 +1050,18 @@ class DevMapper(abc.ABC):
         :type constant: dict of any, optional
         :param unique: A dict of keyword argument sequences which are unique for each process. Default is None.
         :type unique: dict of iterables of any, optional
+        :param shared_memory: Whether to send the arrays of the mapped arguments and the returns through shared memory
+                              blocks, with only small descriptors passing through the queues, rather than pickling the
+                              arrays. The sender copies each array into a block, and with numpy the receiver reads
+                              it in place without a further copy. Default is False.
+        :type shared_memory: bool, optional
         """
         constant_kwargs = ivy.default(constant, {})
         unique_kwargs = ivy.default(unique, {})
         self._fn = fn
         self._ret_fn = ret_fn
         self._devs = devs
+        self._shared_memory = shared_memory
         self._num_workers = len(devs)
         self._timeout = ivy.default(timeout, ivy.queue_timeout())
         self._workers = dict()
@@ -967,10 +1102,14 @@ class DevMapper(abc.ABC):
                 continue
             if loaded_kwargs is None:
                 return
+            if self._shared_memory:
+                loaded_kwargs = _from_shared_memory(loaded_kwargs)
             if 'split_factor' in loaded_kwargs:
                 ivy.set_split_factor(loaded_kwargs['split_factor'], dev)
                 del loaded_kwargs['split_factor']
             ret = self._fn(**loaded_kwargs, **kwargs)
+            if self._shared_memory:
+                ret = _to_shared_memory(ret)
             output_queue.put(ret)
 
     def map(self, used_devs=None, split_factors=None, **kwargs):
@@ -989,10 +1128,28 @@ class DevMapper(abc.ABC):
         if ivy.exists(split_factors):
             kwargs['split_factor'] = split_factors
         used_devs = ivy.default(used_devs, self._devs)
-        [self._input_queues[ds].put({k: v[ds] for k, v in kwargs.items()}) for ds in used_devs]
-        return self._ret_fn(
-            ivy.MultiDevIter([self._output_queues[ds].get(timeout=self._timeout) for ds in used_devs],
-                             self._num_workers))
+        if self._shared_memory:
+            for ds in used_devs:
+                shared_kwargs = _to_shared_memory({k: v[ds] for k, v in kwargs.items()})
+                try:
+                    self._input_queues[ds].put(shared_kwargs)
+                except Exception:
+                    _release_shared_memory(shared_kwargs)
+                    raise
+            rets = [_from_shared_memory(self._output_queues[ds].get(timeout=self._timeout)) for ds in used_devs]
+        else:
+            [self._input_queues[ds].put({k: v[ds] for k, v in kwargs.items()}) for ds in used_devs]
+            rets = [self._output_queues[ds].get(timeout=self._timeout) for ds in used_devs]
+        return self._ret_fn(ivy.MultiDevIter(rets, self._num_workers))
+
+    def _release_queued_shared_memory(self):
+        # blocks which were sent but never loaded, for example following a timeout, are unlinked on shutdown
+        for q in list(self._input_queues.values()) + list(self._output_queues.values()):
+            while True:
+                try:
+                    _release_shared_memory(q.get_nowait())
+                except queue.Empty:
+                    break
 
     @abc.abstractmethod
     def __del__(self):
@@ -1001,17 +1158,19 @@ class DevMapper(abc.ABC):
 
 class DevMapperMultiProc(DevMapper):
 
-    def __init__(self, fn, ret_fn, devs, timeout=None, constant=None, unique=None):
+    def __init__(self, fn, ret_fn, devs, timeout=None, constant=None, unique=None, shared_memory=False):
         multiprocessing = ivy.multiprocessing('forkserver')
         super().__init__(fn, ret_fn, multiprocessing.Queue, multiprocessing.Process, devs, timeout,
-                         constant, unique)
+                         constant, unique, shared_memory)
 
     def __del__(self):
         # noinspection PyBroadException
         try:
-            for i, w in enumerate(self._workers.values()):
-                self._input_queues[i].put(None)
+            for ds, w in self._workers.items():
+                self._input_queues[ds].put(None)
                 w.join(timeout=0.25)
+            if self._shared_memory:
+                self._release_queued_shared_memory()
             for q in self._input_queues.values():
                 q.cancel_join_thread()
                 q.close()
@@ -2,9 +2,14 @@
 Collection of gradient Ivy functions.
 """
 
+# global
+import math as _math
+
 # local
 import ivy as _ivy
 from ivy.framework_handler import current_framework as _cur_framework
+# noinspection PyProtectedMember
+from ivy.functional.ivy.core.device import _chunk_size_from_split_factor
 
 with_grads_stack = list()
 
@@ -125,6 +130,98 @@ def execute_with_gradients(func, xs, retain_grads=False):
     return _cur_framework(None).execute_with_gradients(func, xs, retain_grads)
 
 
+def checkpoint(fn, *args, **kwargs):
+    """
+    Call function fn with args and kwargs, without storing the intermediate activations of fn for the backward pass,
+    and instead recomputing them when the gradients are computed. This trades compute for memory. Only jax and torch
+    rematerialize, via jax.checkpoint and torch.utils.checkpoint. For numpy, tensorflow and mxnet, fn is simply called
+    directly, and so the activations are stored as usual and no memory is saved.
+
+    :param fn: Function to call with checkpointing.
+    :type fn: callable
+    :param args: Positional arguments to fn, which should be arrays or nests of arrays, such as containers of
+                 variables, in order for gradients to flow through them.
+    :type args: sequence of any
+    :param kwargs: Keyword arguments to fn, which are treated as constants and passed to fn on every recomputation.
+    :type kwargs: dict of any
+    :return: The output of fn.
+    """
+    return _cur_framework(None).checkpoint(fn, *args, **kwargs)
+
+
+def _zero_grads(buffer):
+    # zeros are written rather than decrementing each array by itself, which would leave nan wherever it held inf
+    return buffer.map(lambda b, kc: _ivy.inplace_update(b, _ivy.zeros_like(b)))
+
+
+def _accumulate_grads(buffer, grads, weight=1.):
+    if weight != 1.:
+        grads = grads * weight
+    if buffer is None:
+        return grads
+    if _ivy.inplace_arrays_supported():
+        _ivy.Container.multi_map(lambda b_n_g, kc: _ivy.inplace_increment(*b_n_g), [buffer, grads])
+        return buffer
+    return buffer + grads
+
+
+def accumulated_gradients(cost_fn, v, batch, chunk_size=None, max_chunk_size=None, mode='mean', axis=0, out=None,
+                          dev=None):
+    """
+    Compute the gradients of a cost with respect to the variables v, by splitting the batch into chunks along axis,
+    and accumulating the gradients of each chunk, such that the memory of only one chunk is required at a time. When
+    the chunk size is not specified, it is derived from the device split factor, in the same manner as
+    ivy.split_func_call, such that it can be tuned via ivy.set_split_factor and the device manager.
+
+    :param cost_fn: Function computing the cost from the variables and a batch chunk, cost_fn(v, batch_chunk), with
+                    the cost either returned directly or as the first of several outputs.
+    :type cost_fn: callable
+    :param v: Variables for which to compute the gradients of the cost.
+    :type v: container of variables
+    :param batch: The batch to split into chunks.
+    :type batch: array or container
+    :param chunk_size: The size of each of the chunks. Default is None, in which case it is derived from max_chunk_size
+                       and the split factor of the device.
+    :type chunk_size: int, optional
+    :param max_chunk_size: The maximum size of each of the chunks. Default is the full size of the batch.
+    :type max_chunk_size: int, optional
+    :param mode: The mode by which to unify the costs and gradients of the chunks, either mean or sum. For mean, the
+                 cost of each chunk should itself be a mean over the chunk, and chunks are weighted by their size.
+                 Default is mean.
+    :type mode: str, optional
+    :param axis: The axis along which to split the batch. Default is 0.
+    :type axis: int, optional
+    :param out: Container of preallocated gradient arrays to accumulate into, such as the gradients returned by a
+                previous call. Only used when the backend supports inplace arrays. Default is None.
+    :type out: container of arrays, optional
+    :param dev: The device to use the split factor of. Default is the default device.
+    :type dev: Device, optional
+    :return: The accumulated cost, and the accumulated gradients [dc/dw for w in v].
+    """
+    if mode not in ['mean', 'sum']:
+        raise Exception('Invalid accumulation mode {}, must be one of [ mean | sum ]'.format(mode))
+    dim_size = batch.shape[axis]
+    chunk_size = _ivy.default(
+        chunk_size, lambda: _chunk_size_from_split_factor(_ivy.default(max_chunk_size, dim_size), dev), True)
+    num_chunks_floored = _math.floor(dim_size / chunk_size)
+    chunk_sizes = [chunk_size] * num_chunks_floored
+    if dim_size != chunk_size * num_chunks_floored:
+        chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
+    batch_chunks = _ivy.split(batch, chunk_sizes, axis, True) if _ivy.is_array(batch) else \
+        batch.split(chunk_sizes, axis, True)
+    cost = None
+    grads = None
+    if _ivy.exists(out) and _ivy.inplace_arrays_supported():
+        grads = _zero_grads(out)
+    for chunk_size_, batch_chunk in zip(chunk_sizes, batch_chunks):
+        weight = chunk_size_ / dim_size if mode == 'mean' else 1.
+        ret = execute_with_gradients(lambda v_: cost_fn(v_, batch_chunk), v)
+        chunk_cost = _ivy.stop_gradient(ret[0]) * weight
+        cost = chunk_cost if cost is None else cost + chunk_cost
+        grads = _accumulate_grads(grads, ret[1], weight)
+    return cost, grads
+
+
 # Optimizer Steps #
 # ----------------#
 
@@ -139,8 +236,8 @@ def adam_step(dcdws, mw, vw, step, beta1=0.9, beta2=0.999, epsilon=1e-7):
     :type mw: container of arrays
     :param vw: running average of second moments of the gradients
     :type vw: container of arrays
-    :param step: training step
-    :type step: int
+    :param step: training step, either a python number or an array
+    :type step: int or array
     :param beta1: gradient forgetting factor
     :type beta1: float
     :param beta2: second moment of gradient forgetting factor
@@ -149,7 +246,7 @@ def adam_step(dcdws, mw, vw, step, beta1=0.9, beta2=0.999, epsilon=1e-7):
     :type epsilon: float
     :return: The adam step delta.
     """
-    step = float(_ivy.to_scalar(step))
+    step = float(step) if isinstance(step, (int, float)) else float(_ivy.to_scalar(step))
     mw = dcdws.map(lambda dcdw, kc: beta1 * mw[kc] + (1 - beta1) * dcdw)
     dcdws_sqrd = dcdws ** 2
     vw = dcdws_sqrd.map(lambda dcdw_sqrd, kc: beta2 * vw[kc] + (1 - beta2) * dcdw_sqrd)
@@ -261,8 +358,8 @@ def adam_update(ws, dcdws, lr, mw_tm1, vw_tm1, step, beta1=0.9, beta2=0.999, eps
     :type mw_tm1: container of arrays
     :param vw_tm1: running average of second moments of the gradients, from the previous time-step.
     :type vw_tm1: container of arrays
-    :param step: training step
-    :type step: int
+    :param step: training step, either a python number or an array
+    :type step: int or array
     :param beta1: gradient forgetting factor
     :type beta1: float
     :param beta2: second moment of gradient forgetting factor
@@ -298,8 +395,8 @@ def lamb_update(ws, dcdws, lr, mw_tm1, vw_tm1, step, beta1=0.9, beta2=0.999, eps
     :type mw_tm1: container of arrays
     :param vw_tm1: running average of second moments of the gradients, from the previous time-step.
     :type vw_tm1: container of arrays
-    :param step: training step
-    :type step: int
+    :param step: training step, either a python number or an array
+    :type step: int or array
     :param beta1: gradient forgetting factor
     :type beta1: float
     :param beta2: second moment of gradient forgetting factor
@@ -322,9 +419,177 @@ def lamb_update(ws, dcdws, lr, mw_tm1, vw_tm1, step, beta1=0.9, beta2=0.999, eps
     r1 = ws.vector_norm()
     eff_grads, mw, vw = adam_step(dcdws, mw_tm1, vw_tm1, step, beta1, beta2, epsilon)
     if decay_lambda > 0:
-        r2 = (eff_grads + decay_lambda*ws).norm()
+        r2 = (eff_grads + decay_lambda*ws).vector_norm()
     else:
         r2 = eff_grads.vector_norm()
     r = _ivy.stable_divide(r1, r2).minimum(max_trust_ratio)
     lr = r * lr
     return optimizer_update(ws, eff_grads, lr, inplace, stop_gradients), mw, vw
+
+
+# Fused Optimizer Updates #
+# ------------------------#
+
+def _fused_apply_deltas(ws, delta_fn, inplace, stop_gradients, other_containers=None):
+    inplace = _ivy.default(inplace, _ivy.inplace_variables_supported())
+
+    def _apply(values, kc):
+        w = values[0]
+        delta = delta_fn(w, kc, *values[1:])
+        w_new = _ivy.inplace_decrement(w, delta) if inplace else -delta + w
+        return _ivy.stop_gradient(w_new, preserve_type=True) if stop_gradients else w_new
+
+    return _ivy.Container.multi_map(_apply, [ws] + _ivy.default(other_containers, []))
+
+
+def fused_adam_step(dcdws, mw, vw, step, beta1=0.9, beta2=0.999, epsilon=1e-7):
+    """
+    Compute adam step delta, as for adam_step, but with all arrays packed into one flat buffer per dtype and device,
+    such that each stage of the update is a single call per buffer, rather than one call per array. Gradients which
+    are not already packed are packed on every call, which is a full copy of the gradients.
+
+    :param dcdws: Derivates of the cost c with respect to the weights ws, [dc/dw for w in ws].
+    :type dcdws: container of arrays or packed container
+    :param mw: running average of the gradients
+    :type mw: container of arrays or packed container
+    :param vw: running average of second moments of the gradients
+    :type vw: container of arrays or packed container
+    :param step: training step, either a python number or an array
+    :type step: int or array
+    :param beta1: gradient forgetting factor
+    :type beta1: float
+    :param beta2: second moment of gradient forgetting factor
+    :type beta2: float
+    :param epsilon: divisor during adam update, preventing division by zero
+    :type epsilon: float
+    :return: The adam step delta, mw and vw, all as packed containers.
+    """
+    step = float(step) if isinstance(step, (int, float)) else float(_ivy.to_scalar(step))
+    dcdws = dcdws if isinstance(dcdws, _ivy.PackedContainer) else dcdws.pack()
+    mw = mw if isinstance(mw, _ivy.PackedContainer) else mw.pack()
+    vw = vw if isinstance(vw, _ivy.PackedContainer) else vw.pack()
+    mw = beta1 * mw + (1 - beta1) * dcdws
+    vw = beta2 * vw + (1 - beta2) * dcdws ** 2
+    beta1_pow = beta1 ** step
+    beta2_pow = beta2 ** step
+    alpha = (1 - beta2_pow)**0.5 / (1 - beta1_pow + epsilon)
+    return alpha * mw / (vw ** 0.5 + epsilon), mw, vw
+
+
+def fused_adam_update(ws, dcdws, lr, mw_tm1, vw_tm1, step, beta1=0.9, beta2=0.999, epsilon=1e-7, inplace=None,
+                      stop_gradients=True):
+    """
+    Update weights ws using ADAM update, as for adam_update, but computing the moments on flat packed buffers via
+    fused_adam_step, and applying the weight updates in a single traversal of ws. The returned moments are packed
+    containers, which can be passed back in directly on the next step without repacking.
+
+    :param ws: Weights of the function to be updated.
+    :type ws: container of variables
+    :param dcdws: Derivates of the cost c with respect to the weights ws, [dc/dw for w in ws].
+    :type dcdws: container of arrays
+    :param lr: Learning rate(s), the rate(s) at which the weights should be updated relative to the gradient.
+    :type lr: float or container of layer-wise rates.
+    :param mw_tm1: running average of the gradients, from the previous time-step.
+    :type mw_tm1: container of arrays or packed container
+    :param vw_tm1: running average of second moments of the gradients, from the previous time-step.
+    :type vw_tm1: container of arrays or packed container
+    :param step: training step, either a python number or an array
+    :type step: int or array
+    :param beta1: gradient forgetting factor
+    :type beta1: float
+    :param beta2: second moment of gradient forgetting factor
+    :type beta2: float
+    :param epsilon: divisor during adam update, preventing division by zero
+    :type epsilon: float
+    :param inplace: Whether to perform the operation inplace, for backends which support inplace variable updates.
+                    Default is True, provided the backend framework supports it.
+    :type inplace: bool, optional
+    :param stop_gradients: Whether to stop the gradients of the variables after each gradient step. Default is True.
+    :type stop_gradients: bool, optional
+    :return: The new function weights ws_new, and also new packed mw and vw, following the adam updates.
+    """
+    effective_grads, mw, vw = fused_adam_step(dcdws, mw_tm1, vw_tm1, step, beta1, beta2, epsilon)
+    if isinstance(lr, _ivy.Container):
+        ws = _fused_apply_deltas(ws, lambda w, kc, lr_: lr_ * effective_grads.at_key_chain(kc), inplace,
+                                 stop_gradients, [lr])
+    else:
+        ws = _fused_apply_deltas(ws, lambda w, kc: lr * effective_grads.at_key_chain(kc), inplace, stop_gradients)
+    return ws, mw, vw
+
+
+def fused_lamb_update(ws, dcdws, lr, mw_tm1, vw_tm1, step, beta1=0.9, beta2=0.999, epsilon=1e-7, max_trust_ratio=10,
+                      decay_lambda=0, inplace=None, stop_gradients=True):
+    """
+    Update weights ws using LAMB method, as for lamb_update, but computing the moments on flat packed buffers via
+    fused_adam_step, and computing the layer-wise trust ratios and weight updates in a single traversal of ws.
+
+    :param ws: Weights of the function to be updated.
+    :type ws: container of variables
+    :param dcdws: Derivates of the cost c with respect to the weights ws, [dc/dw for w in ws].
+    :type dcdws: container of arrays
+    :param lr: Learning rate, the rate at which the weights should be updated relative to the gradient.
+    :type lr: float
+    :param mw_tm1: running average of the gradients, from the previous time-step.
+    :type mw_tm1: container of arrays or packed container
+    :param vw_tm1: running average of second moments of the gradients, from the previous time-step.
+    :type vw_tm1: container of arrays or packed container
+    :param step: training step, either a python number or an array
+    :type step: int or array
+    :param beta1: gradient forgetting factor
+    :type beta1: float
+    :param beta2: second moment of gradient forgetting factor
+    :type beta2: float
+    :param epsilon: divisor during adam update, preventing division by zero
+    :type epsilon: float
+    :param max_trust_ratio: The maximum value for the trust ratio. Default is 10.
+    :type max_trust_ratio: float, optional
+    :param decay_lambda: The factor used for weight decay. Default is zero.
+    :type decay_lambda: float
+    :param inplace: Whether to perform the operation inplace, for backends which support inplace variable updates.
+                    Default is True, provided the backend framework supports it.
+    :type inplace: bool, optional
+    :param stop_gradients: Whether to stop the gradients of the variables after each gradient step. Default is True.
+    :type stop_gradients: bool, optional
+    :return: The new function weights ws_new, and also new packed mw and vw, following the LAMB updates.
+    """
+    effective_grads, mw, vw = fused_adam_step(dcdws, mw_tm1, vw_tm1, step, beta1, beta2, epsilon)
+
+    def _delta(w, kc):
+        eff_grad = effective_grads.at_key_chain(kc)
+        r1 = _ivy.vector_norm(w)
+        r2 = _ivy.vector_norm(eff_grad + decay_lambda * w) if decay_lambda > 0 else _ivy.vector_norm(eff_grad)
+        r = _ivy.minimum(_ivy.stable_divide(r1, r2), max_trust_ratio)
+        return r * lr * eff_grad
+
+    return _fused_apply_deltas(ws, _delta, inplace, stop_gradients), mw, vw
+
+
+def fused_lars_update(ws, dcdws, lr, decay_lambda=0, inplace=None, stop_gradients=True):
+    """
+    Update weights ws using Layerwise Adaptive Rate Scaling (LARS), as for lars_update, but computing the layer-wise
+    rates and weight updates in a single traversal of ws and dcdws.
+
+    :param ws: Weights of the function to be updated.
+    :type ws: Ivy container
+    :param dcdws: Derivates of the cost c with respect to the weights ws, [dc/dw for w in ws].
+    :type dcdws: Ivy container
+    :param lr: Learning rate, the rate at which the weights should be updated relative to the gradient.
+    :type lr: float
+    :param decay_lambda: The factor used for weight decay. Default is zero.
+    :type decay_lambda: float
+    :param inplace: Whether to perform the operation inplace, for backends which support inplace variable updates.
+                    Default is True, provided the backend framework supports it.
+    :type inplace: bool, optional
+    :param stop_gradients: Whether to stop the gradients of the variables after each gradient step. Default is True.
+    :type stop_gradients: bool, optional
+    :return: The new function weights ws_new, following the LARS updates.
+    """
+
+    def _delta(w, kc, dcdw):
+        w_norm = _ivy.vector_norm(w)
+        layer_lr = _ivy.stable_divide(w_norm * lr, _ivy.vector_norm(dcdw))
+        if decay_lambda > 0:
+            layer_lr /= (w_norm * decay_lambda)
+        return layer_lr * dcdw
+
+    return _fused_apply_deltas(ws, _delta, inplace, stop_gradients, [dcdws])
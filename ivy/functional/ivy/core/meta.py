@@ -103,16 +103,17 @@ def _train_tasks_batched(batch, inner_batch_fn, outer_batch_fn, inner_cost_fn, o
                                            average_across_steps, inner_v, keep_innver_v, outer_v, keep_outer_v, True,
                                            num_tasks, stop_gradients)
     grads = grads.reduce_mean(0) if isinstance(grads, ivy.Container) else grads
+    # the variables are shared by all tasks, but are returned with a leading task dimension, as for the other paths
+    if return_inner_v in ['all', True]:
+        updated_ivs = ivy.Container.stack([updated_ivs] * num_tasks, 0)
+    elif return_inner_v == 'first':
+        updated_ivs = updated_ivs.expand_dims(0)
     if order == 1:
-        if return_inner_v in ['all', True]:
+        if return_inner_v:
             return cost, grads, updated_ivs
-        elif return_inner_v == 'first':
-            return cost, grads, updated_ivs[0:1]
         return cost, grads
-    if return_inner_v in ['all', True]:
+    if return_inner_v:
         return cost, updated_ivs
-    elif return_inner_v == 'first':
-        return cost, updated_ivs[0:1]
     return cost
 
 
@@ -159,9 +160,99 @@ def _train_tasks_with_for_loop(batch, inner_sub_batch_fn, outer_sub_batch_fn, in
     return total_cost / num_tasks
 
 
+def _vectorized_cost(cost_fn, batch_fn, batch, task_v):
+    def _task_cost(batch_flat, v_flat):
+        task_batch = batch.from_flat_list(batch_flat)
+        if batch_fn is not None:
+            task_batch = batch_fn(task_batch)
+        return cost_fn(task_batch, v=task_v.from_flat_list(v_flat))
+
+    # per-task costs, with the task dimension vectorized, summed such that the gradients remain per-task
+    return ivy.reduce_sum(ivy.vmap(_task_cost)(batch.to_flat_list(), task_v.to_flat_list()))
+
+
+def _vectorized_cost_and_update_grads(cost_fn, batch_fn, order, batch, task_v, average_across_steps_or_final,
+                                      all_grads):
+    if order == 1:
+        cost, grads = ivy.execute_with_gradients(
+            lambda v: _vectorized_cost(cost_fn, batch_fn, batch, v), task_v, retain_grads=False)
+        if average_across_steps_or_final:
+            all_grads.append(grads)
+    else:
+        cost = _vectorized_cost(cost_fn, batch_fn, batch, task_v)
+    return cost
+
+
+def _train_tasks_vectorized(batch, inner_batch_fn, outer_batch_fn, inner_cost_fn, outer_cost_fn, variables,
+                            inner_grad_steps, inner_learning_rate, inner_optimization_step, order, average_across_steps,
+                            inner_v, outer_v, return_inner_v, num_tasks, stop_gradients):
+    if inner_v is not None or outer_v is not None:
+        raise Exception('vectorized meta steps do not support inner_v or outer_v, but found {} and {}'.format(
+            inner_v, outer_v))
+
+    # init
+    total_cost = 0
+    all_grads = list()
+    task_v = ivy.Container.stack([variables] * num_tasks, 0)
+    final_cost_fn = inner_cost_fn if outer_cost_fn is None else outer_cost_fn
+
+    # iterate through inner loop training steps, for all tasks at once
+    for i in range(inner_grad_steps):
+
+        # compute the per-task inner gradients for updating the per-task inner variables
+        cost, inner_update_grads = ivy.execute_with_gradients(
+            lambda v: _vectorized_cost(inner_cost_fn, inner_batch_fn, batch, v), task_v, retain_grads=order > 1)
+
+        # compute the cost to be optimized, and update all_grads if fist order method
+        if outer_cost_fn is None:
+            all_grads.append(inner_update_grads)
+        else:
+            cost = _vectorized_cost_and_update_grads(
+                outer_cost_fn, outer_batch_fn, order, batch, task_v, average_across_steps, all_grads)
+
+        # update cost and update parameters
+        total_cost = total_cost + cost
+        task_v = inner_optimization_step(task_v, inner_update_grads, inner_learning_rate, inplace=False,
+                                         stop_gradients=stop_gradients)
+
+    # once training is finished, compute the final cost, and update all_grads if fist order method
+    final_cost = _vectorized_cost_and_update_grads(
+        final_cost_fn, outer_batch_fn, order, batch, task_v, True, all_grads)
+
+    # update variables
+    if stop_gradients:
+        task_v = task_v.stop_gradients()
+
+    # average the cost or gradients across all timesteps if this option is chosen, and then across all tasks
+    if average_across_steps:
+        cost = (total_cost + final_cost) / ((inner_grad_steps + 1) * num_tasks)
+        if order == 1:
+            grads = (sum(all_grads) / max(len(all_grads), 1)).reduce_mean(0)
+    else:
+        cost = final_cost / num_tasks
+        if order == 1:
+            grads = all_grads[-1].reduce_mean(0)
+    if order == 1:
+        if return_inner_v in ['all', True]:
+            return cost, grads, task_v
+        elif return_inner_v == 'first':
+            return cost, grads, task_v[0:1]
+        return cost, grads
+    if return_inner_v in ['all', True]:
+        return cost, task_v
+    elif return_inner_v == 'first':
+        return cost, task_v[0:1]
+    return cost
+
+
 def _train_tasks(batch, inner_batch_fn, outer_batch_fn, inner_cost_fn, outer_cost_fn, variables, inner_grad_steps,
                  inner_learning_rate, inner_optimization_step, order, average_across_steps, batched, inner_v,
-                 keep_innver_v, outer_v, keep_outer_v, return_inner_v, num_tasks, stop_gradients):
+                 keep_innver_v, outer_v, keep_outer_v, return_inner_v, num_tasks, stop_gradients, vectorized=False):
+    if vectorized:
+        return _train_tasks_vectorized(
+            batch, inner_batch_fn, outer_batch_fn, inner_cost_fn, outer_cost_fn, variables, inner_grad_steps,
+            inner_learning_rate, inner_optimization_step, order, average_across_steps, inner_v, outer_v,
+            return_inner_v, num_tasks, stop_gradients)
     if batched:
         return _train_tasks_batched(
             batch, inner_batch_fn, outer_batch_fn, inner_cost_fn, outer_cost_fn, variables, inner_grad_steps,
@@ -181,7 +272,7 @@ def _train_tasks(batch, inner_batch_fn, outer_batch_fn, inner_cost_fn, outer_cos
 def fomaml_step(batch, inner_cost_fn, outer_cost_fn, variables, inner_grad_steps, inner_learning_rate,
                 inner_optimization_step=gradient_descent_update, inner_batch_fn=None, outer_batch_fn=None,
                 average_across_steps=False, batched=True, inner_v=None, keep_inner_v=True, outer_v=None,
-                keep_outer_v=True, return_inner_v=False, num_tasks=None, stop_gradients=True):
+                keep_outer_v=True, return_inner_v=False, num_tasks=None, stop_gradients=True, vectorized=False):
     """
     Perform step of first order MAML.
 
@@ -230,6 +321,12 @@ def fomaml_step(batch, inner_cost_fn, outer_cost_fn, variables, inner_grad_steps
     :type num_tasks: int, optional
     :param stop_gradients: Whether to stop the gradients of the cost. Default is True.
     :type stop_gradients: bool, optional
+    :param vectorized: Whether to give each task its own inner loop variables, stacked along a leading task dimension,
+                       and vectorize the inner loop across all tasks via ivy.vmap, rather than sharing the variables
+                       (batched) or looping over the tasks. inner_v and outer_v are not supported. The
+                       inner_optimization_step receives the stacked variables, and so any norms it computes, such as
+                       the layer-wise norms of LARS or LAMB, are reduced over the task axis too. Default is False.
+    :type vectorized: bool, optional
     :return: The cost and the gradients with respect to the outer loop variables.
     """
     if num_tasks is None:
@@ -237,7 +334,7 @@ def fomaml_step(batch, inner_cost_fn, outer_cost_fn, variables, inner_grad_steps
     rets = _train_tasks(
         batch, inner_batch_fn, outer_batch_fn, inner_cost_fn, outer_cost_fn, variables, inner_grad_steps,
         inner_learning_rate, inner_optimization_step, 1, average_across_steps, batched, inner_v, keep_inner_v, outer_v,
-        keep_outer_v, return_inner_v, num_tasks, stop_gradients)
+        keep_outer_v, return_inner_v, num_tasks, stop_gradients, vectorized)
     cost = rets[0]
     if stop_gradients:
         cost = ivy.stop_gradient(cost, preserve_type=False)
@@ -249,7 +346,7 @@ def fomaml_step(batch, inner_cost_fn, outer_cost_fn, variables, inner_grad_steps
 
 def reptile_step(batch, cost_fn, variables, inner_grad_steps, inner_learning_rate,
                  inner_optimization_step=gradient_descent_update, batched=True, return_inner_v=False, num_tasks=None,
-                 stop_gradients=True):
+                 stop_gradients=True, vectorized=False):
     """
     Perform step of Reptile.
 
@@ -275,6 +372,12 @@ def reptile_step(batch, cost_fn, variables, inner_grad_steps, inner_learning_rat
     :type num_tasks: int, optional
     :param stop_gradients: Whether to stop the gradients of the cost. Default is True.
     :type stop_gradients: bool, optional
+    :param vectorized: Whether to give each task its own inner loop variables, stacked along a leading task dimension,
+                       and vectorize the inner loop across all tasks via ivy.vmap, rather than sharing the variables
+                       (batched) or looping over the tasks. inner_v and outer_v are not supported. The
+                       inner_optimization_step receives the stacked variables, and so any norms it computes, such as
+                       the layer-wise norms of LARS or LAMB, are reduced over the task axis too. Default is False.
+    :type vectorized: bool, optional
     :return: The cost and the gradients with respect to the outer loop variables.
     """
     if num_tasks is None:
@@ -282,7 +385,7 @@ def reptile_step(batch, cost_fn, variables, inner_grad_steps, inner_learning_rat
     # noinspection PyTypeChecker
     rets = _train_tasks(
         batch, None, None, cost_fn, None, variables, inner_grad_steps, inner_learning_rate, inner_optimization_step,
-        1, True, batched, None, True, None, True, return_inner_v, num_tasks, stop_gradients)
+        1, True, batched, None, True, None, True, return_inner_v, num_tasks, stop_gradients, vectorized)
     cost = rets[0]
     if stop_gradients:
         cost = ivy.stop_gradient(cost, preserve_type=False)
@@ -297,7 +400,7 @@ def reptile_step(batch, cost_fn, variables, inner_grad_steps, inner_learning_rat
 def maml_step(batch, inner_cost_fn, outer_cost_fn, variables, inner_grad_steps, inner_learning_rate,
               inner_optimization_step=gradient_descent_update, inner_batch_fn=None, outer_batch_fn=None,
               average_across_steps=False, batched=True, inner_v=None, keep_inner_v=True, outer_v=None,
-              keep_outer_v=True, return_inner_v=False, num_tasks=None, stop_gradients=True):
+              keep_outer_v=True, return_inner_v=False, num_tasks=None, stop_gradients=True, vectorized=False):
     """
     Perform step of vanilla second order MAML.
 
@@ -345,6 +448,12 @@ def maml_step(batch, inner_cost_fn, outer_cost_fn, variables, inner_grad_steps,
     :type num_tasks: int, optional
     :param stop_gradients: Whether to stop the gradients of the cost. Default is True.
     :type stop_gradients: bool, optional
+    :param vectorized: Whether to give each task its own inner loop variables, stacked along a leading task dimension,
+                       and vectorize the inner loop across all tasks via ivy.vmap, rather than sharing the variables
+                       (batched) or looping over the tasks. inner_v and outer_v are not supported. The
+                       inner_optimization_step receives the stacked variables, and so any norms it computes, such as
+                       the layer-wise norms of LARS or LAMB, are reduced over the task axis too. Default is False.
+    :type vectorized: bool, optional
     :return: The cost and the gradients with respect to the outer loop variables.
     """
     if num_tasks is None:
@@ -354,7 +463,7 @@ def maml_step(batch, inner_cost_fn, outer_cost_fn, variables, inner_grad_steps,
         batch, inner_batch_fn, outer_batch_fn, inner_cost_fn, outer_cost_fn,
         variables.set_at_key_chains(v) if unique_outer else v, inner_grad_steps, inner_learning_rate,
         inner_optimization_step, 2, average_across_steps, batched, inner_v, keep_inner_v, outer_v, keep_outer_v,
-        return_inner_v, num_tasks, False),
+        return_inner_v, num_tasks, False, vectorized),
         variables.at_key_chains(outer_v, ignore_none=True)
         if keep_outer_v else variables.prune_key_chains(outer_v, ignore_none=True))
     if stop_gradients:
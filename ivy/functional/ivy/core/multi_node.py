@@ -741,9 +741,14 @@ def unify_nest(args: Type[MultiNode], kwargs: Type[MultiNode], node_str, mode, a
 # Node Mappers #
 # -------------#
 
+# noinspection PyProtectedMember
+from ivy.functional.ivy.core.device import _to_shared_memory, _from_shared_memory, _release_shared_memory
+
+
 class NodeMapper(abc.ABC):
 
-    def __init__(self, fn, ret_fn, queue_class, worker_class, node_strs, timeout=None, constant=None, unique=None):
+    def __init__(self, fn, ret_fn, queue_class, worker_class, node_strs, timeout=None, constant=None, unique=None,
+                 shared_memory=False):
         """
         Node Mapper base class.
 
@@ -763,12 +768,16 @@ class NodeMapper(abc.ABC):
         :type constant: dict of any, optional
         :param unique: A dict of keyword argument sequences which are unique for each process. Default is None.
         :type unique: dict of iterables of any, optional
+        :param shared_memory: Whether to send the arrays of the mapped arguments and the returns through shared memory
+                              blocks, as for ivy.DevMapper. Only applies to workers on the same host. Default is False.
+        :type shared_memory: bool, optional
         """
         constant_kwargs = ivy.default(constant, {})
         unique_kwargs = ivy.default(unique, {})
         self._fn = fn
         self._ret_fn = ret_fn
         self._node_strs = node_strs
+        self._shared_memory = shared_memory
         self._num_workers = len(node_strs)
         self._timeout = ivy.default(timeout, ivy.queue_timeout())
         self._workers = dict()
@@ -809,10 +818,14 @@ class NodeMapper(abc.ABC):
                 continue
             if loaded_kwargs is None:
                 return
+            if self._shared_memory:
+                loaded_kwargs = _from_shared_memory(loaded_kwargs)
             if 'split_factor' in loaded_kwargs:
                 ivy.set_split_factor(loaded_kwargs['split_factor'], node_str)
                 del loaded_kwargs['split_factor']
             ret = self._fn(**loaded_kwargs, **kwargs)
+            if self._shared_memory:
+                ret = _to_shared_memory(ret)
             output_queue.put(ret)
 
     def map(self, used_node_strs=None, split_factors=None, **kwargs):
@@ -831,10 +844,28 @@ class NodeMapper(abc.ABC):
         if ivy.exists(split_factors):
             kwargs['split_factor'] = split_factors
         used_node_strs = ivy.default(used_node_strs, self._node_strs)
-        [self._input_queues[ns].put({k: v[ns] for k, v in kwargs.items()}) for ns in used_node_strs]
-        return self._ret_fn(
-            ivy.MultiNodeIter([self._output_queues[ns].get(timeout=self._timeout) for ns in used_node_strs],
-                             self._num_workers))
+        if self._shared_memory:
+            for ns in used_node_strs:
+                shared_kwargs = _to_shared_memory({k: v[ns] for k, v in kwargs.items()})
+                try:
+                    self._input_queues[ns].put(shared_kwargs)
+                except Exception:
+                    _release_shared_memory(shared_kwargs)
+                    raise
+            rets = [_from_shared_memory(self._output_queues[ns].get(timeout=self._timeout)) for ns in used_node_strs]
+        else:
+            [self._input_queues[ns].put({k: v[ns] for k, v in kwargs.items()}) for ns in used_node_strs]
+            rets = [self._output_queues[ns].get(timeout=self._timeout) for ns in used_node_strs]
+        return self._ret_fn(ivy.MultiNodeIter(rets, self._num_workers))
+
+    def _release_queued_shared_memory(self):
+        # blocks which were sent but never loaded, for example following a timeout, are unlinked on shutdown
+        for q in list(self._input_queues.values()) + list(self._output_queues.values()):
+            while True:
+                try:
+                    _release_shared_memory(q.get_nowait())
+                except queue.Empty:
+                    break
 
     @abc.abstractmethod
     def __del__(self):
@@ -843,10 +874,10 @@ class NodeMapper(abc.ABC):
 
 class NodeMapperMultiProc(NodeMapper):
 
-    def __init__(self, fn, ret_fn, node_strs, timeout=None, constant=None, unique=None):
+    def __init__(self, fn, ret_fn, node_strs, timeout=None, constant=None, unique=None, shared_memory=False):
         multiprocessing = ivy.multiprocessing('forkserver')
         super().__init__(fn, ret_fn, multiprocessing.Queue, multiprocessing.Process, node_strs, timeout,
-                         constant, unique)
+                         constant, unique, shared_memory)
 
     def __del__(self):
         # noinspection PyBroadException
@@ -854,6 +885,8 @@ class NodeMapperMultiProc(NodeMapper):
             for i, w in enumerate(self._workers.values()):
                 self._input_queues[i].put(None)
                 w.join(timeout=0.25)
+            if self._shared_memory:
+                self._release_queued_shared_memory()
             for q in self._input_queues.values():
                 q.cancel_join_thread()
                 q.close()
@@ -1,4 +1,6 @@
 from . import compiler
-from .compiler import compile_graph, show_graph
+from .compiler import compile_graph, show_graph, GraphCache
+from .serialization import load_compiled_graph
+from .op_logging import install_tracing, uninstall_tracing
 from .globals import log_global_inference_rel_times
 try_use_compiled = True
@@ -1,6 +1,7 @@
 # global
 import ivy
 import copy
+from collections import OrderedDict
 
 # local
 from ivy.graph_compiler.graph import Graph
@@ -10,7 +11,8 @@ from ivy.graph_compiler.op_logging import _wrap_methods_for_op_logging, _unwrap_
 
 
 def _create_graph(fn, *args, stateful=None, arg_stateful_idxs=None, kwarg_stateful_idxs=None,
-                  output_connected_only=True, include_generators=True, with_array_caching=True, name='graph', **kwargs):
+                  output_connected_only=True, include_generators=True, with_array_caching=True, passes=None,
+                  name='graph', **kwargs):
 
     # extra stateful instances modified in the graph
     stateful = ivy.default(stateful, [])
@@ -71,6 +73,10 @@ def _create_graph(fn, *args, stateful=None, arg_stateful_idxs=None, kwarg_statef
     # connect graph
     graph.connect(output_connected_only)
 
+    # run the optimization passes on the connected graph
+    if passes:
+        graph.optimize(passes)
+
     # reset all global compiler variables, just to be sure
     glob.wrapping_paused = False
     glob.op_logging = False
@@ -83,21 +89,166 @@ def _create_graph(fn, *args, stateful=None, arg_stateful_idxs=None, kwarg_statef
     return graph
 
 
+class GraphCache:
+
+    def __init__(self, fn, max_graphs=8, stateful=None, arg_stateful_idxs=None, kwarg_stateful_idxs=None,
+                 include_generators=True, with_array_caching=True, passes=None, time_chronological=True,
+                 executor='dict', num_threads=None, min_group_width=2, name='graph'):
+        """
+        Dispatcher which lazily compiles and caches one graph per distinct input signature, where the signature is
+        given by the nest positions, shapes, dtypes and devices of all input arrays, together with the values of all
+        non-array leaves, which are baked into the graph as constants. The least recently used graph is evicted once
+        more than max_graphs signatures have been compiled.
+
+        :param fn: The function to compile for each input signature.
+        :type fn: callable
+        :param max_graphs: The maximum number of compiled graphs to keep in the cache. Default is 8.
+        :type max_graphs: int, optional
+        """
+        if max_graphs < 1:
+            raise Exception('max_graphs must be at least 1, but found {}'.format(max_graphs))
+        self._fn = fn
+        self._max_graphs = max_graphs
+        self._compile_kwargs = {'stateful': stateful, 'arg_stateful_idxs': arg_stateful_idxs,
+                                'kwarg_stateful_idxs': kwarg_stateful_idxs, 'include_generators': include_generators,
+                                'with_array_caching': with_array_caching, 'passes': passes}
+        self._time_chronological = time_chronological
+        self._executor = executor
+        self._num_threads = num_threads
+        self._min_group_width = min_group_width
+        self._name = name
+        self._graphs = OrderedDict()
+        self._compiled_fns = dict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # Private #
+    # --------#
+
+    @staticmethod
+    def _leaf_signature(x):
+        if ivy.is_array(x):
+            return tuple(ivy.shape(x)), ivy.dtype(x, as_str=True), ivy.dev(x, as_str=True)
+        # the type is included, so that equal but differently typed constants such as 1 and 1. are not conflated
+        try:
+            hash(x)
+            return type(x), x
+        except TypeError:
+            return type(x), repr(x)
+
+    @staticmethod
+    def _signature(args, kwargs):
+        sig = list()
+        for nest_key, nest in (('args', args), ('kwargs', kwargs)):
+            for idx in ivy.nested_indices_where(nest, lambda x: True):
+                sig.append((nest_key, tuple(idx), GraphCache._leaf_signature(ivy.index_nest(nest, idx))))
+        return tuple(sig)
+
+    def _get_compiled_fn(self, args, kwargs):
+        key = self._signature(args, kwargs)
+        if key in self._graphs:
+            self.hits += 1
+            self._graphs.move_to_end(key)
+            return self._compiled_fns[key]
+        self.misses += 1
+        graph = _create_graph(self._fn, *args, **self._compile_kwargs, name=self._name, **kwargs)
+        self._graphs[key] = graph
+        self._compiled_fns[key] = graph.compiled(
+            self._time_chronological, self._executor, self._num_threads, self._min_group_width)
+        if len(self._graphs) > self._max_graphs:
+            evicted_key, evicted_graph = self._graphs.popitem(last=False)
+            del self._compiled_fns[evicted_key]
+            # noinspection PyProtectedMember
+            evicted_graph._shutdown_thread_pool()
+            self.evictions += 1
+        return self._compiled_fns[key]
+
+    # Public #
+    # -------#
+
+    def compile(self, *args, **kwargs):
+        """
+        Compile the graph for the signature of the given inputs, without executing it.
+        """
+        self._get_compiled_fn(args, kwargs)
+
+    def cache_info(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'num_graphs': len(self._graphs), 'max_graphs': self._max_graphs}
+
+    def clear(self):
+        # noinspection PyProtectedMember
+        [graph._shutdown_thread_pool() for graph in self._graphs.values()]
+        self._graphs.clear()
+        self._compiled_fns.clear()
+
+    @property
+    def graphs(self):
+        return list(self._graphs.values())
+
+    def __call__(self, *args, **kwargs):
+        return self._get_compiled_fn(args, kwargs)(*args, **kwargs)
+
+    def __repr__(self):
+        return 'GraphCache({}, {})'.format(self._name, self.cache_info())
+
+
 def compile_graph(fn, *args, stateful=None, arg_stateful_idxs=None, kwarg_stateful_idxs=None, include_generators=True,
                   with_array_caching=True, return_graph=False, time_chronological=True, time_inference=False,
-                  timing_fname=None, name='graph', **kwargs):
+                  timing_fname=None, executor='dict', num_threads=None, min_group_width=2, passes=None, cache_by=None,
+                  max_cached_graphs=8, name='graph', **kwargs):
+    """
+    Trace the function fn with the example inputs, and compile the logged operations into an executable function.
+
+    :param fn: The function to compile.
+    :type fn: callable
+    :param stateful: Stateful objects which are modified in the graph, and which are not passed as inputs.
+    :type stateful: sequence of objects, optional
+    :param with_array_caching: Whether to cache the arrays created from constants when connecting. Default is True.
+    :type with_array_caching: bool, optional
+    :param return_graph: Whether to also return the graph, which can then be saved via graph.save(path), and loaded
+                         again without tracing via ivy.load_compiled_graph(path). Graphs with stateful objects, or
+                         with fused nodes from the fuse_elementwise pass, cannot be saved. Default is False.
+    :type return_graph: bool, optional
+    :param executor: The executor for the compiled function, one of [ dict | slots | wavefront ]. Default is dict.
+    :type executor: str, optional
+    :param passes: The optimization passes to run on the graph, as names registered in passes.PASSES or callables,
+                   or True for the default passes. Default is None.
+    :type passes: sequence of str or callable, or bool, optional
+    :param cache_by: If shape, a GraphCache is returned, which compiles one graph per input signature.
+                     Default is None.
+    :type cache_by: str, optional
+    :return: The compiled function, and optionally the graph.
+    """
 
     # set time inference flag
     glob.time_inference = time_inference
     glob.timing_fname = timing_fname
 
+    # multi-graph dispatcher, compiling lazily for each new input signature
+    if cache_by is not None:
+        if cache_by != 'shape':
+            raise Exception('cache_by must be one of [ None | shape ], but found {}'.format(cache_by))
+        if return_graph:
+            raise Exception('return_graph is not supported with cache_by, the graphs are available via .graphs')
+        graph_cache = GraphCache(
+            fn, max_cached_graphs, stateful=stateful, arg_stateful_idxs=arg_stateful_idxs,
+            kwarg_stateful_idxs=kwarg_stateful_idxs, include_generators=include_generators,
+            with_array_caching=with_array_caching, passes=passes, time_chronological=time_chronological,
+            executor=executor, num_threads=num_threads, min_group_width=min_group_width, name=name)
+        if args or kwargs:
+            graph_cache.compile(*args, **kwargs)
+        return graph_cache
+
     # create graph
     graph = _create_graph(
         fn, *args, stateful=stateful, arg_stateful_idxs=arg_stateful_idxs, kwarg_stateful_idxs=kwarg_stateful_idxs,
-        include_generators=include_generators, with_array_caching=with_array_caching, name=name, **kwargs)
+        include_generators=include_generators, with_array_caching=with_array_caching, passes=passes, name=name,
+        **kwargs)
 
     # compile the graph forward pass into an executable function
-    comp_fn = graph.compiled(time_chronological)
+    comp_fn = graph.compiled(time_chronological, executor, num_threads, min_group_width)
 
     # return
     if return_graph:
@@ -108,13 +259,13 @@ def compile_graph(fn, *args, stateful=None, arg_stateful_idxs=None, kwarg_statef
 def show_graph(fn, *args, stateful=None, arg_stateful_idxs=None, kwarg_stateful_idxs=None, randomness_factor=0.1,
                save_to_disk=False, with_edge_labels=True, with_arg_labels=True, with_output_labels=True,
                output_connected_only=True, include_generators=True, with_array_caching=True, highlight_subgraph=None,
-               fname=None, return_graph=False, name='graph', **kwargs):
+               fname=None, return_graph=False, passes=None, name='graph', **kwargs):
 
     # create graph
     graph = _create_graph(
         fn, *args, stateful=stateful, arg_stateful_idxs=arg_stateful_idxs, kwarg_stateful_idxs=kwarg_stateful_idxs,
         output_connected_only=output_connected_only, include_generators=include_generators,
-        with_array_caching=with_array_caching, name=name, **kwargs)
+        with_array_caching=with_array_caching, passes=passes, name=name, **kwargs)
 
     # show the compiled graph
     graph.show(save_to_disk, with_edge_labels, with_arg_labels, with_output_labels, output_connected_only,
@@ -7,6 +7,8 @@ raw_pids_to_weakrefs = dict()
 raw_pids_to_unique_pids = dict()
 dependent_pids = set()
 time_inference = False
+tracing_installed = set()
+tracing_graph = None
 timing_fname = None
 sum_inference_times = {'0_init_param_setting': 0,
                        '1_pre_param_setting': 0,
@@ -63,3 +65,9 @@ GENERATOR_METHODS = {'numpy': [],
                      'tensorflow': [],
                      'torch': ['rand'],
                      'mxnet': []}
+
+ELEMENTWISE_METHODS = ['__neg__', '__pow__', '__rpow__', '__add__', '__radd__', '__sub__', '__rsub__', '__mul__',
+                       '__rmul__', '__truediv__', '__rtruediv__', '__abs__', 'add', 'subtract', 'multiply', 'divide',
+                       'true_divide', 'negative', 'power', 'pow', 'abs', 'absolute', 'exp', 'expm1', 'log', 'log1p',
+                       'sqrt', 'rsqrt', 'square', 'reciprocal', 'tanh', 'sigmoid', 'relu', 'erf', 'sin', 'cos', 'tan',
+                       'maximum', 'minimum', 'clip', 'clamp', 'floor', 'ceil', 'round', 'sign', 'where']
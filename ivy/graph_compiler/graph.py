@@ -12,6 +12,7 @@ import copy
 import random
 import logging
 import inspect
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 try:
     # noinspection PyPackageRequirements
@@ -31,8 +32,11 @@ from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
 from ivy.graph_compiler.param import Param
 from ivy.graph_compiler import globals as glob
 # noinspection PyProtectedMember
+from ivy.graph_compiler.passes import run_passes, _is_pure
+from ivy.graph_compiler.serialization import save_graph
+# noinspection PyProtectedMember
 from ivy.graph_compiler.helpers import _get_shape, _get_unique_id, _terminal_pids_to_key, _args_str_from_fn, _output_str_from_fn,\
-    _param_to_label, _copy_func
+    _param_to_label, _copy_func, _index_getter, _index_setter, _nbytes, _out_fn, _input_signature
 
 
 class Graph:
@@ -122,6 +126,29 @@ class Graph:
         # all functions
         self._all_functions_fixed = list()
 
+        # number of functions removed by each optimization pass
+        self._pass_report = dict()
+
+        # slot-based executor storage, populated when lowering the fixed functions
+        self._num_slots = 0
+        self._arg_slot_getters = list()
+        self._kwarg_slot_getters = list()
+        self._stateful_slot_vals = list()
+        self._slotted_functions = list()
+        self._output_slot_setters = list()
+
+        # liveness storage, with the slots which die after each function, and buffer recycling functions
+        self._slot_dead_after = list()
+        self._slot_out_fns = list()
+        self._recycle_buffers = False
+        self._peak_memory = dict()
+
+        # wavefront executor storage, with groups of independent slotted functions per dependency level, and
+        # side-effecting functions in groups of their own
+        self._slotted_groups = list()
+        self._num_threads = None
+        self._thread_pool = None
+
         # graph formatting
         self._inter_node_color = (0., 0.8, 0.)
         self._stateful_node_color = (0.9, 0.7, 0.2)
@@ -187,6 +214,14 @@ class Graph:
     def _max_graph_height(self):
         return len(self._all_grouped_functions)
 
+    @property
+    def pass_report(self):
+        return self._pass_report
+
+    @property
+    def peak_memory(self):
+        return self._peak_memory
+
     @property
     def with_array_caching(self):
         return self._with_array_caching
@@ -500,6 +535,273 @@ class Graph:
             return self._output[0]
         return self._output
 
+    def _lower_to_slots(self):
+        pid_to_slot = dict()
+
+        def slot(pid):
+            if pid not in pid_to_slot:
+                pid_to_slot[pid] = len(pid_to_slot)
+            return pid_to_slot[pid]
+
+        self._arg_slot_getters = [(slot(pid), _index_getter(idx))
+                                  for pid, idx in zip(self._arg_param_ids, self._arg_tracked_idxs)]
+        self._kwarg_slot_getters = [(slot(pid), _index_getter(idx))
+                                    for pid, idx in zip(self._kwarg_param_ids, self._kwarg_tracked_idxs)]
+        self._stateful_slot_vals = [(slot(pid), val) for pid, val in zip(self._stateful_param_ids, self._stateful)]
+        self._slotted_functions = [
+            (fn, [slot(pid) for pid in fn.arg_param_ids], [slot(pid) for pid in fn.kwarg_param_ids],
+             [(slot(pid), _index_getter(idx)) for pid, idx in zip(fn.output_param_ids, fn.output_tracked_idxs)])
+            for fn in self._all_functions_fixed]
+        self._output_slot_setters = [(slot(pid), _index_setter(idx))
+                                     for pid, idx in zip(self._output_param_ids, self._output_tracked_idxs)]
+        self._num_slots = len(pid_to_slot)
+
+        # liveness analysis, each slot dies after its last consumer, unless it is held by the graph output
+        live_until = dict()
+        for i, (_, arg_slots, kwarg_slots, output_slot_getters) in enumerate(self._slotted_functions):
+            for s in [s for s, _ in output_slot_getters]:
+                live_until.setdefault(s, i)
+            for s in arg_slots + kwarg_slots:
+                live_until[s] = i
+        persistent_slots = set([s for s, _ in self._output_slot_setters] + [s for s, _ in self._stateful_slot_vals])
+        self._slot_dead_after = [list() for _ in self._slotted_functions]
+        for s, i in live_until.items():
+            if s not in persistent_slots:
+                self._slot_dead_after[i].append(s)
+
+        # dead buffers can be written into by later single-output ufuncs, if the framework supports inplace arrays
+        self._recycle_buffers = ivy.current_framework_str() == 'numpy' and ivy.inplace_arrays_supported()
+        self._slot_out_fns = [_out_fn(fn) if self._recycle_buffers else None for fn in self._all_functions_fixed]
+        self._peak_memory = dict()
+
+    @staticmethod
+    def _free_slots(slots, dead_slots, pool):
+        for s in dead_slots:
+            x = slots[s]
+            slots[s] = None
+            # only recycle buffers which own their memory, and which are not referenced anywhere else
+            if pool is not None and isinstance(x, np.ndarray) and x.base is None and x.flags.writeable and\
+                    sys.getrefcount(x) == 2:
+                pool.setdefault((x.shape, x.dtype), list()).append(x)
+
+    @staticmethod
+    def _call_slotted_fn(fn, out_fn, arg_vals, kwarg_vals, pool):
+        if out_fn is None:
+            return fn(arg_vals, kwarg_vals)
+        # a recycled buffer is only used if the inputs match those of the first call, which determined its shape
+        sig = _input_signature(arg_vals, kwarg_vals)
+        if out_fn.key:
+            in_sig, out_key = out_fn.key[0]
+            if sig == in_sig and pool.get(out_key):
+                return out_fn(arg_vals, kwarg_vals, pool[out_key].pop())
+            return fn(arg_vals, kwarg_vals)
+        ret = fn(arg_vals, kwarg_vals)
+        if isinstance(ret, np.ndarray):
+            out_fn.key.append((sig, (ret.shape, ret.dtype)))
+        return ret
+
+    def _track_memory(self, slots, all_bytes):
+        live_bytes = sum([_nbytes(x) for x in slots if x is not None])
+        self._peak_memory['with_liveness'] = max(self._peak_memory.get('with_liveness', 0), live_bytes)
+        self._peak_memory['without_liveness'] = max(self._peak_memory.get('without_liveness', 0), all_bytes)
+
+    def _call_slotted(self, *args, **kwargs):
+        slots = [None] * self._num_slots
+        for s, getter in self._arg_slot_getters:
+            slots[s] = getter(args)
+        for s, getter in self._kwarg_slot_getters:
+            slots[s] = getter(kwargs)
+        for s, val in self._stateful_slot_vals:
+            slots[s] = val
+        pool = dict() if self._recycle_buffers else None
+        # peak memory is measured on the first call only
+        track_memory = not self._peak_memory
+        all_bytes = sum([_nbytes(x) for x in slots if x is not None]) if track_memory else 0
+        for (fn, arg_slots, kwarg_slots, output_slot_getters), dead_slots, out_fn in\
+                zip(self._slotted_functions, self._slot_dead_after, self._slot_out_fns):
+            arg_vals = [slots[s] for s in arg_slots]
+            kwarg_vals = [slots[s] for s in kwarg_slots]
+            ret = self._call_slotted_fn(fn, out_fn, arg_vals, kwarg_vals, pool)
+            del arg_vals, kwarg_vals
+            if not isinstance(ret, tuple):
+                ret = (ret,)
+            for s, getter in output_slot_getters:
+                slots[s] = getter(ret)
+            del ret
+            if track_memory:
+                all_bytes += sum([_nbytes(slots[s]) for s, _ in output_slot_getters])
+                self._track_memory(slots, all_bytes)
+            self._free_slots(slots, dead_slots, pool)
+        if track_memory:
+            logging.info('graph {} peak memory: {}'.format(self._name, self._peak_memory))
+        for s, setter in self._output_slot_setters:
+            setter(self._output, slots[s])
+        if len(self._output) == 1:
+            return self._output[0]
+        return self._output
+
+    def _call_slotted_w_timing(self, *args, **kwargs):
+        total_start = time.perf_counter()
+        slots = [None] * self._num_slots
+        for s, getter in self._arg_slot_getters:
+            slots[s] = getter(args)
+        for s, getter in self._kwarg_slot_getters:
+            slots[s] = getter(kwargs)
+        for s, val in self._stateful_slot_vals:
+            slots[s] = val
+        pool = dict() if self._recycle_buffers else None
+        self.update_inference_times('0_init_param_setting', time.perf_counter() - total_start)
+        for (fn, arg_slots, kwarg_slots, output_slot_getters), dead_slots, out_fn in\
+                zip(self._slotted_functions, self._slot_dead_after, self._slot_out_fns):
+            start = time.perf_counter()
+            arg_vals = [slots[s] for s in arg_slots]
+            kwarg_vals = [slots[s] for s in kwarg_slots]
+            self.update_inference_times('1_pre_param_setting', time.perf_counter() - start)
+            start = time.perf_counter()
+            ret = self._call_slotted_fn(fn, out_fn, arg_vals, kwarg_vals, pool)
+            self.update_inference_times('2_fn_call', time.perf_counter() - start)
+            start = time.perf_counter()
+            del arg_vals, kwarg_vals
+            if not isinstance(ret, tuple):
+                ret = (ret,)
+            for s, getter in output_slot_getters:
+                slots[s] = getter(ret)
+            del ret
+            self._free_slots(slots, dead_slots, pool)
+            self.update_inference_times('3_post_param_setting', time.perf_counter() - start)
+        start = time.perf_counter()
+        for s, setter in self._output_slot_setters:
+            setter(self._output, slots[s])
+        self.update_inference_times('4_end_param_setting', time.perf_counter() - start)
+        total_time = time.perf_counter() - total_start
+        self.update_inference_times('total', total_time)
+        self.update_inference_times('count', 1)
+        self._log_timing_info()
+        if len(self._output) == 1:
+            return self._output[0]
+        return self._output
+
+    def _wavefront_levels(self):
+        # chronological order is a valid topological order, so every function is visited after its inputs
+        fns = sorted([fn for fns in self._all_grouped_functions for fn in fns], key=lambda f: f.timestamp)
+        pid_levels = dict()
+        read_levels = dict()
+        mutated_levels = dict()
+        last_impure_level = -1
+        levels = list()
+        for fn in fns:
+            in_pids = fn.arg_param_ids + fn.kwarg_param_ids
+            level = max([pid_levels.get(pid, -1) for pid in in_pids] +
+                        [mutated_levels.get(pid, -1) for pid in in_pids] + [-1]) + 1
+            impure = hasattr(fn, 'backend_fn') and not _is_pure(self, fn)
+            if impure:
+                # side-effecting functions run one at a time, in their original order, and only after all earlier
+                # readers of the parameters they may modify
+                level = max([level, last_impure_level + 1] + [read_levels.get(pid, -1) + 1 for pid in in_pids])
+                last_impure_level = level
+                for pid in in_pids:
+                    mutated_levels[pid] = level
+            for pid in in_pids:
+                read_levels[pid] = max(read_levels.get(pid, -1), level)
+            for pid in fn.output_param_ids:
+                pid_levels[pid] = level
+            levels.append((level, impure, fn))
+        return levels
+
+    def _lower_to_wavefronts(self, num_threads, min_group_width):
+        levels = self._wavefront_levels()
+        num_levels = max([level for level, _, _ in levels] + [-1]) + 1
+        pure_groups = [list() for _ in range(num_levels)]
+        impure_groups = [list() for _ in range(num_levels)]
+        for level, impure, fn in levels:
+            (impure_groups if impure else pure_groups)[level].append(fn)
+        # each level runs its independent pure functions, followed by at most one side-effecting function
+        groups = [(len(fns) >= min_group_width and not impure, fns)
+                  for pure_fns, impure_fns in zip(pure_groups, impure_groups)
+                  for impure, fns in ((False, pure_fns), (True, impure_fns)) if fns]
+        self._all_functions_fixed = [fn for _, fns in groups for fn in fns]
+        self._lower_to_slots()
+        self._slotted_groups = list()
+        i = 0
+        for parallel, fns in groups:
+            self._slotted_groups.append((parallel, self._slotted_functions[i:i + len(fns)],
+                                         [s for dead in self._slot_dead_after[i:i + len(fns)] for s in dead]))
+            i += len(fns)
+        self._shutdown_thread_pool()
+        self._num_threads = num_threads
+
+    def _shutdown_thread_pool(self):
+        if getattr(self, '_thread_pool', None) is not None:
+            self._thread_pool.shutdown(wait=False)
+            self._thread_pool = None
+
+    def __del__(self):
+        self._shutdown_thread_pool()
+
+    @staticmethod
+    def _run_slotted_fn(slotted_fn, slots):
+        fn, arg_slots, kwarg_slots, output_slot_getters = slotted_fn
+        ret = fn([slots[s] for s in arg_slots], [slots[s] for s in kwarg_slots])
+        if not isinstance(ret, tuple):
+            ret = (ret,)
+        for s, getter in output_slot_getters:
+            slots[s] = getter(ret)
+
+    def _run_slotted_group(self, parallel, slotted_fns, slots):
+        if parallel:
+            # the pool is created lazily, so graphs without parallel groups, or whose pool was shut down on eviction
+            # from a GraphCache, only start threads when needed
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(self._num_threads, thread_name_prefix=self._name)
+            list(self._thread_pool.map(lambda f: self._run_slotted_fn(f, slots), slotted_fns))
+            return
+        for slotted_fn in slotted_fns:
+            self._run_slotted_fn(slotted_fn, slots)
+
+    def _call_wavefront(self, *args, **kwargs):
+        slots = [None] * self._num_slots
+        for s, getter in self._arg_slot_getters:
+            slots[s] = getter(args)
+        for s, getter in self._kwarg_slot_getters:
+            slots[s] = getter(kwargs)
+        for s, val in self._stateful_slot_vals:
+            slots[s] = val
+        for parallel, slotted_fns, dead_slots in self._slotted_groups:
+            self._run_slotted_group(parallel, slotted_fns, slots)
+            self._free_slots(slots, dead_slots, None)
+        for s, setter in self._output_slot_setters:
+            setter(self._output, slots[s])
+        if len(self._output) == 1:
+            return self._output[0]
+        return self._output
+
+    def _call_wavefront_w_timing(self, *args, **kwargs):
+        total_start = time.perf_counter()
+        slots = [None] * self._num_slots
+        for s, getter in self._arg_slot_getters:
+            slots[s] = getter(args)
+        for s, getter in self._kwarg_slot_getters:
+            slots[s] = getter(kwargs)
+        for s, val in self._stateful_slot_vals:
+            slots[s] = val
+        self.update_inference_times('0_init_param_setting', time.perf_counter() - total_start)
+        start = time.perf_counter()
+        for parallel, slotted_fns, dead_slots in self._slotted_groups:
+            self._run_slotted_group(parallel, slotted_fns, slots)
+            self._free_slots(slots, dead_slots, None)
+        self.update_inference_times('2_fn_call', time.perf_counter() - start)
+        start = time.perf_counter()
+        for s, setter in self._output_slot_setters:
+            setter(self._output, slots[s])
+        self.update_inference_times('4_end_param_setting', time.perf_counter() - start)
+        total_time = time.perf_counter() - total_start
+        self.update_inference_times('total', total_time)
+        self.update_inference_times('count', 1)
+        self._log_timing_info()
+        if len(self._output) == 1:
+            return self._output[0]
+        return self._output
+
     def _log_timing_info(self):
         if glob.timing_fname is None:
             logging.info(self._name)
@@ -537,17 +839,43 @@ class Graph:
         self._outer_connected = True
         sys.setrecursionlimit(self._orig_recursion_limit)
 
-    def compiled(self, time_chronological=True):
+    def optimize(self, passes):
+        if not self._outer_connected:
+            self.connect()
+        self._pass_report = run_passes(self, passes)
+        return self._pass_report
+
+    def compiled(self, time_chronological=True, executor='dict', num_threads=None, min_group_width=2):
         if not self._outer_connected:
             self.connect()
         all_functions = self._all_functions
         if time_chronological:
             all_functions = sorted(all_functions, key=lambda f: f.timestamp)
         self._all_functions_fixed = all_functions
+        # tracked indices may have been pruned by array caching during connection, so rebuild the argument templates
+        [fn.compile_arg_template() for fn in self._all_functions_fixed if hasattr(fn, 'compile_arg_template')]
+        if executor == 'slots':
+            self._lower_to_slots()
+            if glob.time_inference:
+                return self._call_slotted_w_timing
+            return self._call_slotted
+        elif executor == 'wavefront':
+            # the wavefront groups are ordered by dependency level, keeping side-effecting functions chronological
+            self._lower_to_wavefronts(num_threads, min_group_width)
+            if glob.time_inference:
+                return self._call_wavefront_w_timing
+            return self._call_wavefront
+        elif executor != 'dict':
+            raise Exception('executor must be one of [ dict | slots | wavefront ], but found {}'.format(executor))
         if glob.time_inference:
             return self._call_w_timing
         return self._call
 
+    def save(self, path):
+        if not self._all_functions_fixed:
+            raise Exception('graph {} must be compiled before saving, via graph.compiled()'.format(self._name))
+        save_graph(self, path)
+
     # Graph Visualization #
     # --------------------#
 
@@ -5,6 +5,7 @@ import copy
 import types
 import numbers
 import inspect
+import operator
 import functools
 import numpy as np
 
@@ -87,6 +88,111 @@ def _get_shape(x_in):
     return None
 
 
+def _index_getter(idx):
+    if len(idx) == 1:
+        return operator.itemgetter(idx[0])
+    getters = [operator.itemgetter(i) for i in idx]
+
+    def _get(nest):
+        for getter in getters:
+            nest = getter(nest)
+        return nest
+    return _get
+
+
+def _index_setter(idx):
+    key = idx[-1]
+    if len(idx) == 1:
+        def _set(nest, val):
+            nest[key] = val
+        return _set
+    parent_getter = _index_getter(idx[:-1])
+
+    def _set(nest, val):
+        parent_getter(nest)[key] = val
+    return _set
+
+
+def _nest_builder(nest, tracked_idxs, to_mutable=False, _positions=None, _depth=0):
+    positions = list(enumerate(tracked_idxs)) if _positions is None else _positions
+    for i, idx in positions:
+        if len(idx) == _depth:
+            return operator.itemgetter(i)
+    if not positions:
+        return lambda _: nest
+    child_positions = dict()
+    for i, idx in positions:
+        child_positions.setdefault(idx[_depth], list()).append((i, idx))
+    child_builders = [(k, _nest_builder(nest[k], tracked_idxs, to_mutable, ps, _depth + 1))
+                      for k, ps in child_positions.items()]
+    nest_type = type(nest)
+    if nest_type is list or nest_type is dict:
+        def _build(vals):
+            ret = nest.copy()
+            for k, builder in child_builders:
+                ret[k] = builder(vals)
+            return ret
+    elif nest_type is tuple:
+        template = list(nest)
+
+        def _build(vals):
+            ret = template.copy()
+            for k, builder in child_builders:
+                ret[k] = builder(vals)
+            return ret if to_mutable else tuple(ret)
+    else:
+        # derived nests are updated in place, as with ivy.set_nest_at_indices
+        def _build(vals):
+            for k, builder in child_builders:
+                nest[k] = builder(vals)
+            return nest
+    return _build
+
+
+def _nest_writer(nest, tracked_idxs):
+    # writes the tracked values into a mutable nest copy, and then converts the copied tuples back, deepest first
+    setters = [_index_setter(idx) for idx in tracked_idxs]
+    tuple_idxs = sorted(set([tuple(idx[:d]) for idx in tracked_idxs for d in range(1, len(idx))
+                             if isinstance(ivy.index_nest(nest, idx[:d]), tuple)]), key=len, reverse=True)
+    tuple_setters = [(_index_getter(idx), _index_setter(idx)) for idx in tuple_idxs]
+    top_is_tuple = isinstance(nest, tuple)
+
+    def _write(nest_copy, vals):
+        for setter, val in zip(setters, vals):
+            setter(nest_copy, val)
+        for getter, setter in tuple_setters:
+            setter(nest_copy, tuple(getter(nest_copy)))
+        return tuple(nest_copy) if top_is_tuple and tracked_idxs else nest_copy
+    return _write
+
+
+def _nbytes(x):
+    if hasattr(x, 'nbytes'):
+        return x.nbytes
+    if hasattr(x, 'element_size') and hasattr(x, 'nelement'):
+        return x.element_size() * x.nelement()
+    return 0
+
+
+def _out_fn(fn):
+    backend_fn = getattr(fn, 'backend_fn', None)
+    if not isinstance(backend_fn, np.ufunc) or backend_fn.nout != 1 or not hasattr(fn, 'arg_templates') or\
+            'out' in fn.kwarg_nest:
+        return None
+    arg_templates = fn.arg_templates
+
+    def out_fn(arg_array_vals, kwarg_array_vals, out):
+        return backend_fn(*arg_templates[0](arg_array_vals), out=out, **arg_templates[1](kwarg_array_vals))
+
+    # the input signature and the (shape, dtype) of the output, recorded on the first call
+    out_fn.key = list()
+    return out_fn
+
+
+def _input_signature(arg_vals, kwarg_vals):
+    return tuple([(x.shape, x.dtype) if hasattr(x, 'dtype') else type(x) for x in arg_vals + kwarg_vals])
+
+
 def _terminal_pids_to_key(terminal_pids):
     return '_'.join([str(pid) for pid in terminal_pids])
 
@@ -9,12 +9,12 @@ import importlib
 from ivy.graph_compiler import globals as glob
 # noinspection PyProtectedMember
 from ivy.graph_compiler.helpers import _get_unique_id, _get_shape, _get_fn_signature, _clone_param, _delete_dependent_param,\
-    _args_n_kwarg_reprs_from_keys_n_args_n_kwargs, _output_reprs_from_output
+    _args_n_kwarg_reprs_from_keys_n_args_n_kwargs, _output_reprs_from_output, _nest_builder, _nest_writer
 # noinspection PyProtectedMember
 from ivy.func_wrapper import _wrap_or_unwrap_methods, NON_WRAPPED_METHODS, ARRAYLESS_RET_METHODS
 
 
-def _wrap_method_for_op_logging(fn, graph, limit_attributes=True, stateful_classes=None):
+def _wrap_method_for_op_logging(fn, graph=None, limit_attributes=True, stateful_classes=None):
 
     stateful_classes = tuple(ivy.default(stateful_classes, tuple()))
 
@@ -27,6 +27,11 @@ def _wrap_method_for_op_logging(fn, graph, limit_attributes=True, stateful_class
     # noinspection PyUnresolvedReferences,PyProtectedMember
     def _method_wrapped(*args, **kwargs):
 
+        # persistently installed wrappers trace into whichever graph is currently being created, if any
+        active_graph = graph if graph is not None else glob.tracing_graph
+        if active_graph is None:
+            return fn(*args, **kwargs)
+
         # if cloning a param currently, return directly via the original function
         if glob.wrapping_paused:
             return fn(*args, **kwargs)
@@ -109,8 +114,8 @@ def _wrap_method_for_op_logging(fn, graph, limit_attributes=True, stateful_class
                 return __obj
 
         # remove parameters from args and kwargs
-        ivy.map_nest_at_indices(args, arg_tracked_idxs, lambda x_: _delete_dependent_param(x_, graph))
-        ivy.map_nest_at_indices(kwargs, kwarg_tracked_idxs, lambda x_: _delete_dependent_param(x_, graph))
+        ivy.map_nest_at_indices(args, arg_tracked_idxs, lambda x_: _delete_dependent_param(x_, active_graph))
+        ivy.map_nest_at_indices(kwargs, kwarg_tracked_idxs, lambda x_: _delete_dependent_param(x_, active_graph))
 
         # covert return to list
         ret_listified = False
@@ -136,7 +141,7 @@ def _wrap_method_for_op_logging(fn, graph, limit_attributes=True, stateful_class
         # clone the param when getting an attribute, to preserve uniqueness in the graph
         if fn.__name__ in ['__getattr__', '__getattribute__']:
             # update the param_id for each param in the retreived attribute in the graph
-            ivy.map_nest_at_indices(ret, output_tracked_idxs, lambda x: _clone_param(x, graph))
+            ivy.map_nest_at_indices(ret, output_tracked_idxs, lambda x: _clone_param(x, active_graph))
 
         # find all duplicate param ids from the input in the return
         duplicates = list()
@@ -146,7 +151,7 @@ def _wrap_method_for_op_logging(fn, graph, limit_attributes=True, stateful_class
 
         # clone all repeated return parameters to give unique parameter ids in the graph
         duplicate_tracked_idxs = [output_tracked_idxs[i] for i in duplicates]
-        ivy.map_nest_at_indices(ret, duplicate_tracked_idxs, lambda x: _clone_param(x, graph))
+        ivy.map_nest_at_indices(ret, duplicate_tracked_idxs, lambda x: _clone_param(x, active_graph))
 
         # get return param ids after cloning
         output_vals = list(ivy.multi_index_nest(ret, output_tracked_idxs))
@@ -155,7 +160,7 @@ def _wrap_method_for_op_logging(fn, graph, limit_attributes=True, stateful_class
             glob.raw_pids_to_weakrefs[id(x)] = weakref.ref(x)
 
         # maybe add to set of dependent_pids
-        if fn.__name__ in glob.GENERATOR_METHODS and graph.include_generators:
+        if fn.__name__ in glob.GENERATOR_METHODS and active_graph.include_generators:
             [glob.dependent_pids.add(pid) for pid in output_param_ids]
         else:
             for pid in arg_param_ids + kwarg_param_ids:
@@ -163,28 +168,44 @@ def _wrap_method_for_op_logging(fn, graph, limit_attributes=True, stateful_class
                     [glob.dependent_pids.add(pid) for pid in output_param_ids]
                     break
 
+        # argument templates, with the constant parts of args and kwargs pre-bound, and only the tracked slots filled
+        arg_templates = [None, None]
+
+        # the timed variant splits each template into its copying and writing stages, to report them separately
+        timed_arg_templates = [None, None, None, None]
+
+        def compile_arg_template():
+            arg_templates[0] = _nest_builder(args, arg_tracked_idxs)
+            arg_templates[1] = _nest_builder(kwargs, kwarg_tracked_idxs)
+            if glob.time_inference:
+                arg_copier = _nest_builder(args, arg_tracked_idxs, to_mutable=True)
+                kwarg_copier = _nest_builder(kwargs, kwarg_tracked_idxs, to_mutable=True)
+                arg_placeholders = [None] * len(arg_tracked_idxs)
+                kwarg_placeholders = [None] * len(kwarg_tracked_idxs)
+                timed_arg_templates[0] = lambda: arg_copier(arg_placeholders)
+                timed_arg_templates[1] = lambda: kwarg_copier(kwarg_placeholders)
+                timed_arg_templates[2] = _nest_writer(args, arg_tracked_idxs)
+                timed_arg_templates[3] = _nest_writer(kwargs, kwarg_tracked_idxs)
+
+        compile_arg_template()
+
         # wrap the function
         def new_fn(arg_array_vals, kwarg_array_vals):
-            # ToDo: make this as efficient as possible; this is performed at runtime
-            args_writeable = ivy.copy_nest(args)
-            kwargs_writeable = ivy.copy_nest(kwargs)
-            ivy.set_nest_at_indices(args_writeable, arg_tracked_idxs, arg_array_vals)
-            ivy.set_nest_at_indices(kwargs_writeable, kwarg_tracked_idxs, kwarg_array_vals)
-            return backend_fn(*args_writeable, **kwargs_writeable)
+            return backend_fn(*arg_templates[0](arg_array_vals), **arg_templates[1](kwarg_array_vals))
 
         # wrap the function with timing
         def new_fn_w_timing(arg_array_vals, kwarg_array_vals):
             start = time.perf_counter()
-            args_writeable = ivy.copy_nest(args)
-            kwargs_writeable = ivy.copy_nest(kwargs)
-            graph.update_inference_times('2_0_arg_n_kwarg_copying', time.perf_counter() - start)
+            args_writeable = timed_arg_templates[0]()
+            kwargs_writeable = timed_arg_templates[1]()
+            active_graph.update_inference_times('2_0_arg_n_kwarg_copying', time.perf_counter() - start)
             start = time.perf_counter()
-            ivy.set_nest_at_indices(args_writeable, arg_tracked_idxs, arg_array_vals)
-            ivy.set_nest_at_indices(kwargs_writeable, kwarg_tracked_idxs, kwarg_array_vals)
-            graph.update_inference_times('2_1_arg_n_kwarg_writing', time.perf_counter() - start)
+            args_writeable = timed_arg_templates[2](args_writeable, arg_array_vals)
+            kwargs_writeable = timed_arg_templates[3](kwargs_writeable, kwarg_array_vals)
+            active_graph.update_inference_times('2_1_arg_n_kwarg_writing', time.perf_counter() - start)
             start = time.perf_counter()
             ret_ = backend_fn(*args_writeable, **kwargs_writeable)
-            graph.update_inference_times('2_2_backend_fn', time.perf_counter() - start)
+            active_graph.update_inference_times('2_2_backend_fn', time.perf_counter() - start)
             return ret_
 
         # add function attributes which inform about the arguments and returns
@@ -194,6 +215,12 @@ def _wrap_method_for_op_logging(fn, graph, limit_attributes=True, stateful_class
         if glob.time_inference:
             new_fn = new_fn_w_timing
 
+        new_fn.compile_arg_template = compile_arg_template
+        new_fn.arg_templates = arg_templates
+        new_fn.backend_fn = backend_fn
+        new_fn.arg_nest = args
+        new_fn.kwarg_nest = kwargs
+
         new_fn.arg_reprs = str(args)
         new_fn.arg_tracked_idxs = arg_tracked_idxs
         new_fn.arg_param_ids = arg_param_ids
@@ -228,13 +255,13 @@ def _wrap_method_for_op_logging(fn, graph, limit_attributes=True, stateful_class
         new_fn.signature = _get_fn_signature(backend_fn)
         new_fn.terminal = True
         new_fn.is_constant = len(arg_param_ids + kwarg_param_ids) == 0 and \
-                             (not graph.include_generators or
+                             (not active_graph.include_generators or
                               fn.__name__ not in glob.GENERATOR_METHODS[ivy.current_framework_str()])
 
         glob.wrapping_paused = False
 
-        fns_in = [graph._pid_to_functions_dict[pid]
-                  for pid in arg_param_ids + kwarg_param_ids if pid in graph._pid_to_functions_dict]
+        fns_in = [active_graph._pid_to_functions_dict[pid]
+                  for pid in arg_param_ids + kwarg_param_ids if pid in active_graph._pid_to_functions_dict]
         for fn_in in fns_in:
             fn_in.terminal = False
             if new_fn not in fn_in.fns_out:
@@ -253,23 +280,23 @@ def _wrap_method_for_op_logging(fn, graph, limit_attributes=True, stateful_class
 
             # add this function to the graph for each output pid
             for pid in output_param_ids:
-                if pid in graph._pid_to_functions_dict:
-                    graph._register_output(ret)
+                if pid in active_graph._pid_to_functions_dict:
+                    active_graph._register_output(ret)
                     glob.op_logging = False
-                    _unwrap_methods_from_op_logging(list(graph._stateful_classes))
+                    _unwrap_methods_from_op_logging(list(active_graph._stateful_classes))
                     # noinspection PyBroadException
                     try:
-                        graph.show(save_to_disk=True, output_connected_only=False)
+                        active_graph.show(save_to_disk=True, output_connected_only=False)
                     except Exception:
                         pass
                     raise Exception(
                         '\n\ntried to add {} to graph._functions_dict, but function {} with the same output pid {} '
                         'already exists!'.format(
                             new_fn.__name__ + '(*{}, **{})'.format(new_fn.arg_reprs, new_fn.kwarg_reprs),
-                            graph._pid_to_functions_dict[pid].__name__ + '(*{}, **{})'.format(
-                                graph._pid_to_functions_dict[pid].arg_reprs,
-                                graph._pid_to_functions_dict[pid].kwarg_reprs), pid))
-                graph.add_fn_to_dict(pid, new_fn)
+                            active_graph._pid_to_functions_dict[pid].__name__ + '(*{}, **{})'.format(
+                                active_graph._pid_to_functions_dict[pid].arg_reprs,
+                                active_graph._pid_to_functions_dict[pid].kwarg_reprs), pid))
+                active_graph.add_fn_to_dict(pid, new_fn)
 
         # unset wrapping as true
         glob.wrapped_stack.pop(-1)
@@ -292,11 +319,14 @@ def _unwrap_method_from_op_logging(method_wrapped):
 
 def _wrap_methods_for_op_logging(graph, stateful_classes=None):
 
-    # wrap backend framework
-    classes_to_wrap = [getattr(importlib.import_module(ctw[0]), ctw[1])
-                       for ctw in glob.CLASSES_TO_WRAP[ivy.current_framework_str()]]
-    _wrap_or_unwrap_methods(
-        lambda fn: _wrap_method_for_op_logging(fn, graph), classes_to_wrap=classes_to_wrap, native=True)
+    # wrap backend framework, unless the persistent tracing layer is already installed
+    if ivy.current_framework_str() in glob.tracing_installed:
+        glob.tracing_graph = graph
+    else:
+        classes_to_wrap = [getattr(importlib.import_module(ctw[0]), ctw[1])
+                           for ctw in glob.CLASSES_TO_WRAP[ivy.current_framework_str()]]
+        _wrap_or_unwrap_methods(
+            lambda fn: _wrap_method_for_op_logging(fn, graph), classes_to_wrap=classes_to_wrap, native=True)
 
     # wrap stateful classes
     stateful_classes = ivy.default(stateful_classes, [])
@@ -314,11 +344,14 @@ def _wrap_methods_for_op_logging(graph, stateful_classes=None):
 
 def _unwrap_methods_from_op_logging(stateful_classes=None):
 
-    # unwrap backend framework
-    classes_to_wrap = [getattr(importlib.import_module(ctw[0]), ctw[1])
-                       for ctw in glob.CLASSES_TO_WRAP[ivy.current_framework_str()]] + stateful_classes
-    _wrap_or_unwrap_methods(
-        lambda fn: _unwrap_method_from_op_logging(fn), classes_to_wrap=classes_to_wrap, native=True)
+    # unwrap backend framework, or just deactivate tracing if the persistent tracing layer is installed
+    if ivy.current_framework_str() in glob.tracing_installed:
+        glob.tracing_graph = None
+    else:
+        classes_to_wrap = [getattr(importlib.import_module(ctw[0]), ctw[1])
+                           for ctw in glob.CLASSES_TO_WRAP[ivy.current_framework_str()]] + stateful_classes
+        _wrap_or_unwrap_methods(
+            lambda fn: _unwrap_method_from_op_logging(fn), classes_to_wrap=classes_to_wrap, native=True)
 
     # unwrap stateful classes
     stateful_classes = ivy.default(stateful_classes, [])
@@ -329,3 +362,31 @@ def _unwrap_methods_from_op_logging(stateful_classes=None):
             cls.__getattr__ = _unwrap_method_from_op_logging(cls.__getattr__)
         if hasattr(cls, '__getattribute__'):
             cls.__getattribute__ = _unwrap_method_from_op_logging(cls.__getattribute__)
+
+
+def install_tracing():
+    """
+    Persistently wrap the backend framework for operation logging, such that subsequent graph compilations only need
+    to activate tracing, rather than wrapping and unwrapping every backend method. Outside of compilation, the wrapped
+    methods only perform a single global check before calling the original method.
+    """
+    fs = ivy.current_framework_str()
+    if fs in glob.tracing_installed:
+        return
+    classes_to_wrap = [getattr(importlib.import_module(ctw[0]), ctw[1]) for ctw in glob.CLASSES_TO_WRAP[fs]]
+    _wrap_or_unwrap_methods(
+        lambda fn: _wrap_method_for_op_logging(fn), classes_to_wrap=classes_to_wrap, native=True)
+    glob.tracing_installed.add(fs)
+
+
+def uninstall_tracing():
+    """
+    Remove the persistent operation logging wrappers from the backend framework.
+    """
+    fs = ivy.current_framework_str()
+    if fs not in glob.tracing_installed:
+        return
+    classes_to_wrap = [getattr(importlib.import_module(ctw[0]), ctw[1]) for ctw in glob.CLASSES_TO_WRAP[fs]]
+    _wrap_or_unwrap_methods(
+        lambda fn: _unwrap_method_from_op_logging(fn), classes_to_wrap=classes_to_wrap, native=True)
+    glob.tracing_installed.remove(fs)
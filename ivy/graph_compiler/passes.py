@@ -0,0 +1,377 @@
+# global
+import ivy
+import logging
+import numpy as np
+from collections import OrderedDict
+
+# local
+from ivy.graph_compiler import globals as glob
+# noinspection PyProtectedMember
+from ivy.graph_compiler.helpers import _nest_builder
+
+
+# frameworks whose ivy.compile traces the python function lazily, and so can compile the fused functions, whereas
+# torch scripting cannot compile python closures, and numpy and mxnet return the function unmodified
+TRACE_COMPILED_FRAMEWORKS = ['jax', 'tensorflow']
+
+
+# Helpers #
+# --------#
+
+def _is_array_or_unhashable(x):
+    if ivy.is_array(x):
+        return True
+    try:
+        hash(x)
+    except TypeError:
+        return True
+    return False
+
+
+def _nest_key(nest):
+    if isinstance(nest, (list, tuple)):
+        return (type(nest),) + tuple([_nest_key(x) for x in nest])
+    elif isinstance(nest, dict):
+        return (type(nest),) + tuple([(k, _nest_key(v)) for k, v in nest.items()])
+    elif _is_array_or_unhashable(nest):
+        # cached constants are only considered equal if they are the very same object
+        return 'id', id(nest)
+    return type(nest), nest
+
+
+def _is_pure(graph, fn):
+    if not hasattr(fn, 'backend_fn'):
+        return False
+    name = fn.__name__
+    if name in ['__setattr__', '__getattr__', '__getattribute__', '__setitem__'] or\
+            name in glob.GENERATOR_METHODS[ivy.current_framework_str()]:
+        return False
+    # in-place operators
+    if (name[0:3] == '__i' and name != '__invert__') or (name[-1] == '_' and name[0] != '_'):
+        return False
+    return not [t for t in fn.arg_param_types + fn.kwarg_param_types if issubclass(t, graph._all_stateful_classes)]
+
+
+def _decrement_param_counts(param_dict, fn):
+    for pid in fn.arg_param_ids + fn.kwarg_param_ids:
+        if pid in param_dict:
+            param_dict[pid].set_count(param_dict[pid].count - 1)
+
+
+def _remove_functions(graph, dict_key, fns_to_remove):
+    if not fns_to_remove:
+        return
+    graph._grouped_functions[dict_key] =\
+        [g for g in [[fn for fn in fns if fn not in fns_to_remove] for fns in graph._grouped_functions[dict_key]] if g]
+    graph._functions[dict_key] = [fn for fn in graph._functions[dict_key] if fn not in fns_to_remove]
+    graph._num_functions[dict_key] = len(graph._functions[dict_key])
+    for fn in graph._functions[dict_key]:
+        fn.fns_in = [fn_in for fn_in in fn.fns_in if fn_in not in fns_to_remove]
+        fn.fns_out = [fn_out for fn_out in fn.fns_out if fn_out not in fns_to_remove]
+
+
+def _bind_constant(fn, pid, value):
+    for nest, tracked_idxs, param_ids, param_types, param_shapes in\
+            ((fn.arg_nest, fn.arg_tracked_idxs, fn.arg_param_ids, fn.arg_param_types, fn.arg_param_shapes),
+             (fn.kwarg_nest, fn.kwarg_tracked_idxs, fn.kwarg_param_ids, fn.kwarg_param_types,
+              fn.kwarg_param_shapes)):
+        while pid in param_ids:
+            idx = param_ids.index(pid)
+            ivy.set_nest_at_index(nest, tracked_idxs[idx], value)
+            del tracked_idxs[idx]
+            del param_ids[idx]
+            del param_types[idx]
+            del param_shapes[idx]
+
+
+# Passes #
+# -------#
+
+def eliminate_common_subexpressions(graph, dict_key):
+    """
+    Removes all functions which repeat an earlier function call with identical backend function, identical constant
+    arguments and identical input parameters, redirecting all consumers to the outputs of the earlier call. Calls are
+    only merged if all consumers of both calls are pure, as an in-place consumer would otherwise change the value
+    seen by the others.
+
+    :param graph: The connected graph to optimize.
+    :type graph: ivy.graph_compiler.graph.Graph
+    :param dict_key: The key of the sub-graph to optimize.
+    :type dict_key: str
+    :return: The number of functions removed.
+    """
+    param_dict = graph._param_dict[dict_key]
+    seen = dict()
+    removed = list()
+    for fn in [fn for fns in graph._grouped_functions[dict_key] for fn in fns]:
+        if not _is_pure(graph, fn):
+            continue
+        key = (id(fn.backend_fn), _nest_key(fn.arg_nest), _nest_key(fn.kwarg_nest),
+               tuple([tuple(idx) for idx in fn.arg_tracked_idxs]), tuple(fn.arg_param_ids),
+               tuple([tuple(idx) for idx in fn.kwarg_tracked_idxs]), tuple(fn.kwarg_param_ids),
+               tuple([tuple(idx) for idx in fn.output_tracked_idxs]))
+        if key not in seen:
+            seen[key] = fn
+            continue
+        orig_fn = seen[key]
+        if [fn_out for fn_out in fn.fns_out + orig_fn.fns_out if not _is_pure(graph, fn_out)]:
+            continue
+        pid_map = dict(zip(fn.output_param_ids, orig_fn.output_param_ids))
+        for fn_out in fn.fns_out:
+            fn_out.arg_param_ids[:] = [pid_map.get(pid, pid) for pid in fn_out.arg_param_ids]
+            fn_out.kwarg_param_ids[:] = [pid_map.get(pid, pid) for pid in fn_out.kwarg_param_ids]
+            fn_out.fns_in = [orig_fn if fn_in is fn else fn_in for fn_in in fn_out.fns_in]
+            fn_out.fns_in = [fn_in for i, fn_in in enumerate(fn_out.fns_in) if fn_in not in fn_out.fns_in[:i]]
+            if fn_out not in orig_fn.fns_out:
+                orig_fn.fns_out.append(fn_out)
+        graph._output_param_ids[:] = [pid_map.get(pid, pid) for pid in graph._output_param_ids]
+        for pid, orig_pid in pid_map.items():
+            if pid in param_dict:
+                if orig_pid in param_dict:
+                    param_dict[orig_pid].set_count(param_dict[orig_pid].count + param_dict[pid].count)
+                del param_dict[pid]
+        _decrement_param_counts(param_dict, fn)
+        removed.append(fn)
+    _remove_functions(graph, dict_key, removed)
+    return len(removed)
+
+
+def fold_constants(graph, dict_key):
+    """
+    Evaluates all functions whose inputs are entirely constant once at compile time, and caches the resultant arrays
+    directly in the arguments of the receiving functions, or in the graph output. With array caching, which is the
+    default, such functions are already removed and their outputs cached when the graph is connected, and so this pass
+    only has an effect for graphs compiled with with_array_caching=False, and is only among the default passes then.
+
+    :param graph: The connected graph to optimize.
+    :type graph: ivy.graph_compiler.graph.Graph
+    :param dict_key: The key of the sub-graph to optimize.
+    :type dict_key: str
+    :return: The number of functions removed.
+    """
+    param_dict = graph._param_dict[dict_key]
+    const_vals = dict()
+    folded = list()
+    for fn in [fn for fns in graph._grouped_functions[dict_key] for fn in fns]:
+        in_pids = fn.arg_param_ids + fn.kwarg_param_ids
+        if not _is_pure(graph, fn) or [pid for pid in in_pids if pid not in const_vals]:
+            continue
+        ret = fn([const_vals[pid] for pid in fn.arg_param_ids], [const_vals[pid] for pid in fn.kwarg_param_ids])
+        if not isinstance(ret, tuple):
+            ret = (ret,)
+        for pid, idx in zip(fn.output_param_ids, fn.output_tracked_idxs):
+            const_vals[pid] = ivy.index_nest(ret, idx)
+        folded.append(fn)
+    if not folded:
+        return 0
+    for fn in [fn for fn in graph._functions[dict_key] if fn not in folded]:
+        for pid in [pid for pid in fn.arg_param_ids + fn.kwarg_param_ids if pid in const_vals]:
+            _bind_constant(fn, pid, const_vals[pid])
+    for pid in [pid for pid in graph._output_param_ids if pid in const_vals]:
+        idx = graph._output_param_ids.index(pid)
+        ivy.set_nest_at_index(graph._output, graph._output_tracked_idxs[idx], const_vals[pid])
+        del graph._output_tracked_idxs[idx]
+        del graph._output_param_ids[idx]
+    for pid in const_vals:
+        if pid in param_dict:
+            del param_dict[pid]
+    _remove_functions(graph, dict_key, folded)
+    return len(folded)
+
+
+def _is_elementwise(graph, fn):
+    if not _is_pure(graph, fn) or len(fn.output_param_ids) != 1:
+        return False
+    if isinstance(fn.backend_fn, np.ufunc):
+        return fn.backend_fn.nout == 1
+    return fn.__name__ in glob.ELEMENTWISE_METHODS
+
+
+def _fused_elementwise_fn(chain):
+    steps = list()
+    ext_pids = list()
+    for i, fn in enumerate(chain):
+        carried_pid = chain[i - 1].output_param_ids[0] if i > 0 else None
+        sources = list()
+        for pid in fn.arg_param_ids + fn.kwarg_param_ids:
+            if pid == carried_pid:
+                sources.append(-1)
+            else:
+                sources.append(len(ext_pids))
+                ext_pids.append(pid)
+        num_args = len(fn.arg_param_ids)
+        steps.append((fn.backend_fn, _nest_builder(fn.arg_nest, fn.arg_tracked_idxs),
+                      _nest_builder(fn.kwarg_nest, fn.kwarg_tracked_idxs), sources[:num_args], sources[num_args:],
+                      fn.output_tracked_idxs[0], i > 0 and isinstance(fn.backend_fn, np.ufunc) and
+                      'out' not in fn.kwarg_nest))
+    # whether each ufunc step can write into the buffer of the step before, determined on the first call
+    inplace_flags = list()
+
+    def fused_fn(arg_vals, _):
+        calibrated = bool(inplace_flags)
+        flags = list()
+        carry = None
+        for i_, (backend_fn, arg_builder, kwarg_builder, arg_sources, kwarg_sources, out_idx, ufunc) in \
+                enumerate(steps):
+            args = arg_builder([carry if s == -1 else arg_vals[s] for s in arg_sources])
+            kwargs = kwarg_builder([carry if s == -1 else arg_vals[s] for s in kwarg_sources])
+            if calibrated and inplace_flags[i_]:
+                try:
+                    ret = backend_fn(*args, out=carry, **kwargs)
+                except (ValueError, TypeError):
+                    ret = backend_fn(*args, **kwargs)
+            else:
+                ret = backend_fn(*args, **kwargs)
+                flags.append(ufunc and isinstance(ret, np.ndarray) and isinstance(carry, np.ndarray) and
+                             ret.dtype == carry.dtype and ret.shape == carry.shape)
+            carry = ivy.index_nest(ret if isinstance(ret, tuple) else (ret,), out_idx)
+        if not calibrated:
+            inplace_flags[:] = flags
+        return carry
+
+    return fused_fn, ext_pids
+
+
+def fuse_elementwise(graph, dict_key):
+    """
+    Replaces each maximal chain of elementwise functions, where every intermediate array is consumed only by the next
+    function in the chain, with a single fused function. With numpy, the ufuncs in the chain write into the buffer of
+    the preceding intermediate via out=, and with jax and tensorflow the fused function is passed to ivy.compile.
+
+    :param graph: The connected graph to optimize.
+    :type graph: ivy.graph_compiler.graph.Graph
+    :param dict_key: The key of the sub-graph to optimize.
+    :type dict_key: str
+    :return: The number of functions removed.
+    """
+    param_dict = graph._param_dict[dict_key]
+    fns = [fn for fns_ in graph._grouped_functions[dict_key] for fn in fns_]
+
+    def next_in_chain(fn):
+        pid = fn.output_param_ids[0]
+        if len(fn.fns_out) != 1 or pid in graph._output_param_ids or\
+                (pid in param_dict and param_dict[pid].count != 1):
+            return None
+        fn_out = fn.fns_out[0]
+        if fn_out not in fns or not _is_elementwise(graph, fn_out) or\
+                (fn_out.arg_param_ids + fn_out.kwarg_param_ids).count(pid) != 1:
+            return None
+        return fn_out
+
+    chained = set()
+    removed = list()
+    for fn in fns:
+        if fn in chained or not _is_elementwise(graph, fn):
+            continue
+        chain = [fn]
+        while True:
+            fn_next = next_in_chain(chain[-1])
+            if fn_next is None or fn_next in chained:
+                break
+            chain.append(fn_next)
+        if len(chain) < 2:
+            continue
+        chained.update(chain)
+        fused_fn, ext_pids = _fused_elementwise_fn(chain)
+        if ivy.current_framework_str() in TRACE_COMPILED_FRAMEWORKS:
+            fused_fn = ivy.compile(fused_fn)
+        fused = _fused_node(fused_fn, chain, ext_pids)
+        for pid in [f.output_param_ids[0] for f in chain[:-1]]:
+            if pid in param_dict:
+                del param_dict[pid]
+        for f in fns:
+            if f in chain:
+                continue
+            f.fns_out = [fused if f_out is chain[0] or f_out in chain else f_out for f_out in f.fns_out]
+            f.fns_out = [f_out for i, f_out in enumerate(f.fns_out) if f_out not in f.fns_out[:i]]
+            f.fns_in = [fused if f_in is chain[-1] else f_in for f_in in f.fns_in]
+        for fns_ in graph._grouped_functions[dict_key]:
+            if chain[-1] in fns_:
+                fns_[fns_.index(chain[-1])] = fused
+        graph._functions[dict_key] = [fused if f is chain[-1] else f for f in graph._functions[dict_key]]
+        removed += chain[:-1]
+    if removed and ivy.current_framework_str() not in TRACE_COMPILED_FRAMEWORKS + ['numpy']:
+        logging.info('graph {}: the fused functions are not compiled with {}, and only save the per-function '
+                     'overhead'.format(graph._name, ivy.current_framework_str()))
+    _remove_functions(graph, dict_key, removed)
+    return len(removed)
+
+
+def _fused_node(fused_fn, chain, ext_pids):
+    def fused(arg_vals, kwarg_vals):
+        return fused_fn(arg_vals, kwarg_vals)
+
+    ext_types = dict()
+    ext_shapes = dict()
+    for fn in chain:
+        ext_types.update(zip(fn.arg_param_ids + fn.kwarg_param_ids, fn.arg_param_types + fn.kwarg_param_types))
+        ext_shapes.update(zip(fn.arg_param_ids + fn.kwarg_param_ids, fn.arg_param_shapes + fn.kwarg_param_shapes))
+    last = chain[-1]
+    fused.__name__ = 'fused_' + '_'.join([fn.__name__.strip('_') for fn in chain])
+    fused.fused_fns = chain
+    fused.arg_param_ids = ext_pids
+    fused.arg_tracked_idxs = [[i] for i in range(len(ext_pids))]
+    fused.arg_param_types = [ext_types[pid] for pid in ext_pids]
+    fused.arg_param_shapes = [ext_shapes[pid] for pid in ext_pids]
+    fused.arg_param_var_flags = [False] * len(ext_pids)
+    fused.kwarg_param_ids = list()
+    fused.kwarg_tracked_idxs = list()
+    fused.kwarg_param_types = list()
+    fused.kwarg_param_shapes = list()
+    fused.kwarg_param_var_flags = list()
+    for attr in ['output_param_ids', 'output_tracked_idxs', 'output_param_types', 'output_param_shapes',
+                 'output_param_var_flags', 'timestamp', 'tree_depth', 'tree_height', 'terminal', 'fns_out',
+                 'output_reprs']:
+        if hasattr(last, attr):
+            setattr(fused, attr, getattr(last, attr))
+    fused.is_constant = False
+    fused.fns_in = [f for fn in chain for f in fn.fns_in if f not in chain]
+    fused.fns_in = [f for i, f in enumerate(fused.fns_in) if f not in fused.fns_in[:i]]
+    fused.arg_reprs = str([fn.__name__ for fn in chain])
+    fused.kwarg_reprs = str(dict())
+    fused.arg_n_kwarg_reprs = dict()
+    fused.signature = dict()
+    return fused
+
+
+PASSES = OrderedDict([('cse', eliminate_common_subexpressions),
+                      ('fold_constants', fold_constants),
+                      ('fuse_elementwise', fuse_elementwise)])
+
+
+def default_passes(graph):
+    """
+    Returns the names of the passes run for passes=True, in order. Constant folding is only included for graphs
+    without array caching, as it has nothing left to fold otherwise.
+
+    :param graph: The graph to optimize.
+    :type graph: ivy.graph_compiler.graph.Graph
+    :return: List of pass names registered in PASSES.
+    """
+    return ['cse'] + ([] if graph.with_array_caching else ['fold_constants']) + ['fuse_elementwise']
+
+
+def run_passes(graph, passes):
+    """
+    Runs the sequence of optimization passes over every connected sub-graph, in order.
+
+    :param graph: The connected graph to optimize.
+    :type graph: ivy.graph_compiler.graph.Graph
+    :param passes: The passes to run, either names registered in PASSES, or callables accepting the graph and the
+                   sub-graph key and returning the number of functions removed. True runs the default_passes.
+    :type passes: sequence of str or callable, or bool
+    :return: Ordered dict of the number of functions removed by each pass.
+    """
+    if passes is True:
+        passes = default_passes(graph)
+    report = OrderedDict()
+    for p in passes:
+        if isinstance(p, str):
+            if p not in PASSES:
+                raise Exception('pass must be one of {}, but found {}'.format(list(PASSES.keys()), p))
+            name, pass_fn = p, PASSES[p]
+        else:
+            name, pass_fn = p.__name__, p
+        report[name] = report.get(name, 0) + sum([pass_fn(graph, dict_key) for dict_key in list(graph._functions)])
+    logging.info('graph {} optimization passes removed: {}'.format(graph._name, dict(report)))
+    return report
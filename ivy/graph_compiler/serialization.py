@@ -0,0 +1,188 @@
+# global
+import os
+import ivy
+import pickle
+import numpy as np
+
+# local
+# noinspection PyProtectedMember
+from ivy.graph_compiler.helpers import _index_getter, _index_setter, _nest_builder
+
+
+class _ConstantRef:
+
+    def __init__(self, idx):
+        self.idx = idx
+
+
+def _extract_constants(nest, tracked_idxs, constants, constant_ids):
+    nest = ivy.copy_nest(nest, include_derived=True, to_mutable=True)
+    for idx in tracked_idxs:
+        ivy.set_nest_at_index(nest, idx, None)
+    for idx in ivy.nested_indices_where(nest, lambda x: ivy.is_array(x)):
+        x = ivy.index_nest(nest, idx)
+        if id(x) not in constant_ids:
+            constant_ids[id(x)] = len(constants)
+            constants.append(ivy.to_numpy(x))
+        ivy.set_nest_at_index(nest, idx, _ConstantRef(constant_ids[id(x)]))
+    return nest
+
+
+def _constant_to_framework(c):
+    dtype = str(c.dtype)
+    if ivy.current_framework_str() == 'torch':
+        # the torch backend builds numpy inputs as default float tensors, and so the values are passed as a list
+        return ivy.array(c.tolist(), dtype)
+    return ivy.array(np.asarray(c), dtype)
+
+
+def _insert_constants(nest, constants):
+    for idx in ivy.nested_indices_where(nest, lambda x: isinstance(x, _ConstantRef)):
+        ivy.set_nest_at_index(nest, idx, constants[ivy.index_nest(nest, idx).idx])
+    return nest
+
+
+def save_graph(graph, path):
+    """
+    Save the compiled function order, parameter wiring, tracked indices and cached constant arrays of a graph to the
+    directory path, such that it can be loaded via ivy.load_compiled_graph without tracing the function again.
+
+    :param graph: The compiled graph to save.
+    :type graph: ivy.graph_compiler.graph.Graph
+    :param path: The directory to save the graph to.
+    :type path: str
+    """
+    if graph._all_stateful:
+        raise Exception('graphs with stateful objects cannot be saved, but graph {} has stateful objects {}'.format(
+            graph._name, graph._all_stateful))
+    pid_to_slot = dict()
+
+    def slot(pid):
+        if pid not in pid_to_slot:
+            pid_to_slot[pid] = len(pid_to_slot)
+        return pid_to_slot[pid]
+
+    constants = list()
+    constant_ids = dict()
+    functions = list()
+    for fn in graph._all_functions_fixed:
+        if hasattr(fn, 'fused_fns'):
+            raise Exception('graphs with fused functions cannot be saved, but graph {} contains {}'.format(
+                graph._name, fn.__name__))
+        backend_fn = getattr(fn, 'backend_fn', None)
+        if ivy.exists(backend_fn):
+            arg_nest = _extract_constants(fn.arg_nest, fn.arg_tracked_idxs, constants, constant_ids)
+            kwarg_nest = _extract_constants(fn.kwarg_nest, fn.kwarg_tracked_idxs, constants, constant_ids)
+        else:
+            # identity function, added for inputs which are passed directly to the output
+            arg_nest, kwarg_nest = [None], dict()
+        functions.append(
+            {'name': fn.__name__, 'backend_fn': backend_fn, 'arg_nest': arg_nest, 'kwarg_nest': kwarg_nest,
+             'arg_tracked_idxs': fn.arg_tracked_idxs, 'arg_slots': [slot(pid) for pid in fn.arg_param_ids],
+             'kwarg_tracked_idxs': fn.kwarg_tracked_idxs, 'kwarg_slots': [slot(pid) for pid in fn.kwarg_param_ids],
+             'output_tracked_idxs': fn.output_tracked_idxs,
+             'output_slots': [slot(pid) for pid in fn.output_param_ids]})
+    spec = {'name': graph._name,
+            'framework': ivy.current_framework_str(),
+            'arg_tracked_idxs': graph._arg_tracked_idxs,
+            'arg_slots': [slot(pid) for pid in graph._arg_param_ids],
+            'kwarg_tracked_idxs': graph._kwarg_tracked_idxs,
+            'kwarg_slots': [slot(pid) for pid in graph._kwarg_param_ids],
+            'functions': functions,
+            'output': _extract_constants(graph._output, graph._output_tracked_idxs, constants, constant_ids),
+            'output_tracked_idxs': graph._output_tracked_idxs,
+            'output_slots': [slot(pid) for pid in graph._output_param_ids],
+            'num_slots': len(pid_to_slot),
+            'num_constants': len(constants)}
+    os.makedirs(path, exist_ok=True)
+    for i, const in enumerate(constants):
+        np.save(os.path.join(path, 'constant_{}.npy'.format(i)), const)
+    with open(os.path.join(path, 'graph.pickle'), 'wb') as f:
+        pickle.dump(spec, f)
+
+
+class LoadedGraph:
+
+    def __init__(self, spec, constants):
+        """
+        Callable graph, loaded from disk, which executes the saved function order over a flat list of parameter slots.
+
+        :param spec: The saved graph specification.
+        :type spec: dict
+        :param constants: The cached constant arrays, indexed by the constant references in the specification.
+        :type constants: sequence of arrays
+        """
+        self._name = spec['name']
+        self._num_slots = spec['num_slots']
+        self._arg_slot_getters = [(s, _index_getter(idx)) for s, idx in zip(spec['arg_slots'],
+                                                                            spec['arg_tracked_idxs'])]
+        self._kwarg_slot_getters = [(s, _index_getter(idx)) for s, idx in zip(spec['kwarg_slots'],
+                                                                              spec['kwarg_tracked_idxs'])]
+        self._functions = list()
+        for fn_spec in spec['functions']:
+            backend_fn = fn_spec['backend_fn']
+            if ivy.exists(backend_fn):
+                arg_builder = _nest_builder(_insert_constants(fn_spec['arg_nest'], constants),
+                                            fn_spec['arg_tracked_idxs'])
+                kwarg_builder = _nest_builder(_insert_constants(fn_spec['kwarg_nest'], constants),
+                                              fn_spec['kwarg_tracked_idxs'])
+
+                def fn(arg_vals, kwarg_vals, backend_fn_=backend_fn, arg_builder_=arg_builder,
+                       kwarg_builder_=kwarg_builder):
+                    return backend_fn_(*arg_builder_(arg_vals), **kwarg_builder_(kwarg_vals))
+            else:
+                def fn(arg_vals, _):
+                    return arg_vals[0]
+            self._functions.append(
+                (fn, fn_spec['arg_slots'], fn_spec['kwarg_slots'],
+                 [(s, _index_getter(idx)) for s, idx in zip(fn_spec['output_slots'],
+                                                            fn_spec['output_tracked_idxs'])]))
+        self._output = _insert_constants(spec['output'], constants)
+        self._output_slot_setters = [(s, _index_setter(idx)) for s, idx in zip(spec['output_slots'],
+                                                                               spec['output_tracked_idxs'])]
+
+    def __call__(self, *args, **kwargs):
+        slots = [None] * self._num_slots
+        for s, getter in self._arg_slot_getters:
+            slots[s] = getter(args)
+        for s, getter in self._kwarg_slot_getters:
+            slots[s] = getter(kwargs)
+        for fn, arg_slots, kwarg_slots, output_slot_getters in self._functions:
+            ret = fn([slots[s] for s in arg_slots], [slots[s] for s in kwarg_slots])
+            if not isinstance(ret, tuple):
+                ret = (ret,)
+            for s, getter in output_slot_getters:
+                slots[s] = getter(ret)
+        for s, setter in self._output_slot_setters:
+            setter(self._output, slots[s])
+        if len(self._output) == 1:
+            return self._output[0]
+        return self._output
+
+    def __repr__(self):
+        return 'LoadedGraph({}, {} functions)'.format(self._name, len(self._functions))
+
+
+def load_compiled_graph(path, mmap=True):
+    """
+    Load a graph saved via Graph.save, returning a callable with the same signature as the originally compiled
+    function. The constant arrays are memory-mapped by default, such that forked worker processes share their pages.
+
+    :param path: The directory the graph was saved to.
+    :type path: str
+    :param mmap: Whether to memory-map the constant arrays, rather than reading them into memory. Default is True.
+                 Memory-mapped constants are only used directly with the numpy backend, and are otherwise copied into
+                 arrays of the current framework.
+    :type mmap: bool, optional
+    :return: The loaded compiled graph.
+    """
+    with open(os.path.join(path, 'graph.pickle'), 'rb') as f:
+        spec = pickle.load(f)
+    if spec['framework'] != ivy.current_framework_str():
+        raise Exception('graph {} was saved with framework {}, but the current framework is {}'.format(
+            spec['name'], spec['framework'], ivy.current_framework_str()))
+    constants = [np.load(os.path.join(path, 'constant_{}.npy'.format(i)), mmap_mode='r' if mmap else None)
+                 for i in range(spec['num_constants'])]
+    if spec['framework'] != 'numpy':
+        constants = [_constant_to_framework(c) for c in constants]
+    return LoadedGraph(spec, constants)
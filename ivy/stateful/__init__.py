@@ -6,6 +6,8 @@ from . import initializers
 from .initializers import *
 from . import layers
 from .layers import *
+from . import lr_schedulers
+from .lr_schedulers import *
 from . import module
 from .module import *
 from . import norms
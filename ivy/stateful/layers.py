@@ -646,7 +646,7 @@ class Conv3DTranspose(Module):
 class LSTM(Module):
 
     def __init__(self, input_channels, output_channels, weight_initializer=GlorotUniform(), num_layers=1,
-                 return_sequence=True, return_state=True, dev=None, v=None):
+                 return_sequence=True, return_state=True, dev=None, v=None, checkpoint=False):
         """
         LSTM layer, which is a set of stacked lstm cells.
 
@@ -667,6 +667,10 @@ class LSTM(Module):
         :type dev: ivy.Device, optional
         :param v: the variables for each of the lstm cells, as a container, constructed internally by default.
         :type v: ivy container of parameter arrays, optional
+        :param checkpoint: Whether to checkpoint the forward pass over the sequence, recomputing the intermediate
+                           activations during the backward pass rather than storing them, for the backends which
+                           rematerialize, see ivy.checkpoint. Default is False.
+        :type checkpoint: bool, optional
         """
         self._input_channels = input_channels
         self._output_channels = output_channels
@@ -674,7 +678,7 @@ class LSTM(Module):
         self._num_layers = num_layers
         self._return_sequence = return_sequence
         self._return_state = return_state
-        Module.__init__(self, dev, v)
+        Module.__init__(self, dev, v, checkpoint=checkpoint)
 
     # Public #
 
@@ -0,0 +1,99 @@
+"""
+Collection of Ivy learning rate schedulers, evaluated on the host from the optimizer step count.
+"""
+
+# global
+import abc
+import math
+
+
+# Base #
+# -----#
+
+class LRScheduler(abc.ABC):
+
+    @abc.abstractmethod
+    def __call__(self, step):
+        """
+        Compute the learning rate for the given step. Override this abstract method with child class custom
+        implementation.
+
+        :param step: The optimizer step count, starting at 1 for the first step.
+        :type step: int
+        :return: The learning rate as a python float.
+        """
+        raise NotImplementedError
+
+
+# Schedulers #
+# -----------#
+
+class WarmupLR(LRScheduler):
+
+    def __init__(self, lr, warmup_steps, after=None):
+        """
+        Linearly increase the learning rate up to lr over the warmup steps, and then either hold it constant or hand
+        over to another scheduler.
+
+        :param lr: The learning rate at the end of the warmup.
+        :type lr: float
+        :param warmup_steps: The number of warmup steps.
+        :type warmup_steps: int
+        :param after: The scheduler to use after the warmup, called with the number of steps since the warmup ended.
+                      Default is None, in which case the learning rate is held at lr.
+        :type after: LRScheduler, optional
+        """
+        self._lr = lr
+        self._warmup_steps = warmup_steps
+        self._after = after
+
+    def __call__(self, step):
+        if step <= self._warmup_steps:
+            return self._lr * step / self._warmup_steps
+        if self._after is not None:
+            return self._after(step - self._warmup_steps)
+        return self._lr
+
+
+class CosineLR(LRScheduler):
+
+    def __init__(self, lr, decay_steps, min_lr=0.):
+        """
+        Decay the learning rate from lr to min_lr over the decay steps, following half a cosine period.
+
+        :param lr: The initial learning rate.
+        :type lr: float
+        :param decay_steps: The number of steps over which to decay the learning rate.
+        :type decay_steps: int
+        :param min_lr: The final learning rate, held after the decay steps. Default is zero.
+        :type min_lr: float, optional
+        """
+        self._lr = lr
+        self._decay_steps = decay_steps
+        self._min_lr = min_lr
+
+    def __call__(self, step):
+        progress = min(step, self._decay_steps) / self._decay_steps
+        return self._min_lr + 0.5 * (self._lr - self._min_lr) * (1 + math.cos(math.pi * progress))
+
+
+class StepDecayLR(LRScheduler):
+
+    def __init__(self, lr, step_size, gamma=0.1):
+        """
+        Multiply the learning rate by gamma every step_size steps.
+
+        :param lr: The initial learning rate.
+        :type lr: float
+        :param step_size: The number of steps between each decay.
+        :type step_size: int
+        :param gamma: The factor by which to multiply the learning rate at each decay. Default is 0.1.
+        :type gamma: float, optional
+        """
+        self._lr = lr
+        self._step_size = step_size
+        self._gamma = gamma
+
+    def __call__(self, step):
+        # steps start at 1, so the first step_size steps run at the initial learning rate
+        return self._lr * self._gamma ** ((step - 1) // self._step_size)
@@ -22,7 +22,7 @@ class Module(abc.ABC):
 
     def __init__(self, dev=None, v=None, build_mode='on_init', compile_on_next_step=False, store_vars=True,
                  stateful=None, arg_stateful_idxs=None, kwarg_stateful_idxs=None, fallback_to_non_compiled=False,
-                 with_partial_v=False, devs=None):
+                 with_partial_v=False, devs=None, checkpoint=False):
         """
         Initialze Ivy layer, which is a stateful object consisting of trainable variables.
 
@@ -53,6 +53,10 @@ class Module(abc.ABC):
         :type with_partial_v: bool, optional
         :param devs: devices on which to distribute the module's variables 'cuda:0', 'cuda:1', 'cpu' etc.
         :type devs: sequence of str, optional
+        :param checkpoint: Whether to checkpoint the forward pass via ivy.checkpoint, discarding the intermediate
+                           activations and recomputing them during the backward pass. Only the jax and torch backends
+                           rematerialize, for the others the forward pass is unchanged. Default is False.
+        :type checkpoint: bool, optional
         :type build_mode: str, optional
         """
         valid_build_modes = ['on_init', 'explicit', 'on_call']
@@ -68,6 +72,7 @@ class Module(abc.ABC):
         self._fallback_to_non_compiled = fallback_to_non_compiled
         self._with_partial_v = with_partial_v
         self._store_vars = store_vars
+        self._checkpoint = checkpoint
         self._built = False
         self._compiled = False
         self._compiled_fn = None
@@ -290,13 +295,30 @@ class Module(abc.ABC):
         """
         raise NotImplementedError
 
+    def _checkpointed_forward(self, *args, **kwargs):
+        """
+        Forward pass with the variables passed explicitly to ivy.checkpoint, such that gradients flow through the
+        recomputed activations.
+        """
+        def forward_with_v(v, *a):
+            v_orig = self.v
+            self.v = v
+            try:
+                return self._forward(*a, **kwargs)
+            finally:
+                self.v = v_orig
+        return ivy.checkpoint(forward_with_v, self.v, *args)
+
     def _forward_with_tracking(self, *args, **kwargs):
         """
         Forward pass while optionally tracking submodule returns and call order
         """
         if self.track_submod_call_order():
             self._add_submod_enter()
-        ret = self._forward(*args, **kwargs)
+        if self._checkpoint:
+            ret = self._checkpointed_forward(*args, **kwargs)
+        else:
+            ret = self._forward(*args, **kwargs)
         track_submod_rets = self.track_submod_rets()
         check_submod_rets = self.check_submod_rets()
         if track_submod_rets or check_submod_rets:
@@ -409,7 +431,8 @@ class Module(abc.ABC):
                   'but found\n\ntop_mod: {}'.format(self.top_mod))
 
     def compile_graph(self, *args, v=None, with_grads=None, stateful=None, arg_stateful_idxs=None,
-                      kwarg_stateful_idxs=None, include_generators=True, **kwargs):
+                      kwarg_stateful_idxs=None, include_generators=True, cache_by=None, max_cached_graphs=8,
+                      **kwargs):
         with_grads = ivy.with_grads(with_grads)
         logging.info('compiling forward pass for network {} ...'.format(self))
         stateful = ivy.default(stateful, self._stateful)
@@ -430,7 +453,8 @@ class Module(abc.ABC):
         kwargs['with_grads'] = with_grads
         self._compiled_fn = ivy.compile_graph(
             self._call, *args, **kwargs, stateful=stateful, arg_stateful_idxs=arg_stateful_idxs,
-            kwarg_stateful_idxs=kwarg_stateful_idxs, include_generators=include_generators, name=str(self))
+            kwarg_stateful_idxs=kwarg_stateful_idxs, include_generators=include_generators, cache_by=cache_by,
+            max_cached_graphs=max_cached_graphs, name=str(self))
         logging.info('{} forward pass compiled!'.format(self))
         self._compiled = True
 
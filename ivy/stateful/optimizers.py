@@ -8,6 +8,9 @@ import logging
 
 # local
 import ivy
+from ivy.stateful.lr_schedulers import LRScheduler
+# noinspection PyProtectedMember
+from ivy.functional.ivy.core.gradients import _accumulate_grads, _zero_grads
 
 
 # Base #
@@ -16,12 +19,13 @@ import ivy
 class Optimizer(abc.ABC):
 
     def __init__(self, lr, inplace=None, stop_gradients=True, init_on_first_step=False, compile_on_next_step=False,
-                 fallback_to_non_compiled=False, dev=None):
+                 fallback_to_non_compiled=False, dev=None, accumulate_steps=1):
         """
         Construct an general Optimizer. This is an abstract class, and must be derived.
 
-        :param lr: Learning rate.
-        :type lr: function or float.
+        :param lr: Learning rate, either a float, a function without arguments, or an LRScheduler evaluated on the
+                   host with the step count.
+        :type lr: function, LRScheduler or float.
         :param inplace: Whether to update the variables in-place, or to create new variable handles.
                         This is only relevant for frameworks with stateful variables such as PyTorch.
                         Default is True, provided the backend framework supports it.
@@ -37,6 +41,9 @@ class Optimizer(abc.ABC):
         :type fallback_to_non_compiled: bool, optional
         :param dev: device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu' etc.
         :type dev: ivy.Device, optional
+        :param accumulate_steps: The number of calls to step over which to accumulate the gradients, before the mean
+                                 gradients are applied to the variables. Default is 1, which applies every step.
+        :type accumulate_steps: int, optional
         """
         self._lr = lr
         self._inplace = inplace
@@ -46,9 +53,16 @@ class Optimizer(abc.ABC):
         self._compile_on_next_step = compile_on_next_step
         self._fallback_to_non_compiled = fallback_to_non_compiled
         self._dev = ivy.default(dev, ivy.default_device())
-        self._count = ivy.array([0], dev=self._dev)
+        self._step_count = 0
+        self._count = None
+        self._lr_array = None
+        self._device_scalars = False
         self._compiled_step_fn = None
         self._compiled = False
+        self._accumulate_steps = accumulate_steps
+        self._accumulated_grads = None
+        self._accumulated_count = 0
+        self._packed_grads = None
 
     # Private #
     # --------#
@@ -71,6 +85,76 @@ class Optimizer(abc.ABC):
 
     # Given #
 
+    def _host_lr(self):
+        if isinstance(self._lr, LRScheduler):
+            return self._lr(self._step_count)
+        elif callable(self._lr):
+            return self._lr()
+        return self._lr
+
+    def _get_lr(self):
+        """
+        The learning rate for the current step, as a python float, unless a graph is compiled with a learning rate
+        which changes between steps, in which case it is returned as a device array updated by step.
+        """
+        if self._device_scalars and ivy.exists(self._lr_array):
+            return self._lr_array
+        return self._host_lr()
+
+    def _get_step(self):
+        """
+        The step count, as a python int, unless a graph is compiled, in which case it is returned as a device array.
+        """
+        return self._count if self._device_scalars else self._step_count
+
+    def _use_device_scalars(self):
+        # compiled graphs would otherwise capture the step count and learning rate as constants
+        self._device_scalars = True
+        self._count = ivy.array([self._step_count], dev=self._dev)
+        if callable(self._lr):
+            self._lr_array = ivy.array(self._host_lr(), 'float32', self._dev)
+
+    def _increment_step(self):
+        self._step_count += 1
+        if not self._device_scalars:
+            return
+        self._count += 1
+        if ivy.exists(self._lr_array):
+            lr = ivy.array(self._host_lr(), 'float32', self._dev)
+            if ivy.inplace_arrays_supported():
+                ivy.inplace_update(self._lr_array, lr)
+            else:
+                self._lr_array = lr
+
+    def _accumulate(self, grads):
+        """
+        Accumulate the gradients into a buffer allocated once, returning the mean gradients on every
+        accumulate_steps-th call, and None otherwise.
+        """
+        if self._accumulated_count == 0:
+            if ivy.exists(self._accumulated_grads) and ivy.inplace_arrays_supported():
+                # the buffer is zeroed and incremented, as inplace_update would alias the storage of the passed grads
+                self._accumulated_grads = _accumulate_grads(_zero_grads(self._accumulated_grads), grads)
+            else:
+                self._accumulated_grads = grads.map(lambda g, kc: ivy.copy_array(g))
+        else:
+            self._accumulated_grads = _accumulate_grads(self._accumulated_grads, grads)
+        self._accumulated_count += 1
+        if self._accumulated_count < self._accumulate_steps:
+            return
+        self._accumulated_count = 0
+        return self._accumulated_grads / self._accumulate_steps
+
+    def _pack_grads(self, grads):
+        """
+        Pack the gradients for the fused updates, into the buffers packed on the previous step where the layout is
+        unchanged, rather than allocating new buffers on every step.
+        """
+        if ivy.exists(self._packed_grads) and self._packed_grads.same_layout(grads):
+            return self._packed_grads.pack_into(grads, check_layout=False)
+        self._packed_grads = grads.pack()
+        return self._packed_grads
+
     def _step_fn(self, v, grads, ignore_missing):
         if ignore_missing:
             return v.set_at_keys(self._step(v.at_key_chains(grads), grads))
@@ -93,17 +177,19 @@ class Optimizer(abc.ABC):
 
     # Given #
 
-    def compile_graph(self, v, grads=None, ignore_missing=False):
+    def compile_graph(self, v, grads=None, ignore_missing=False, cache_by=None, max_cached_graphs=8):
         # ToDo: add more options to this function, like in ivy.Module
         logging.info('compiling step for optimizer {} ...'.format(self))
+        self._use_device_scalars()
         self._compiled_step_fn = \
             ivy.compile_graph(self._step_fn, v, ivy.default(grads, v.deep_copy()), ignore_missing, stateful=[self],
-                              name=str(self))
+                              cache_by=cache_by, max_cached_graphs=max_cached_graphs, name=str(self))
         logging.info('{} step compiled!'.format(self))
         self._compiled = True
 
     def show_graph(self, v, grads=None, ignore_missing=False):
         # ToDo: add more options to this function, like in ivy.Module
+        self._use_device_scalars()
         ivy.show_graph(self._step_fn, v, ivy.default(grads, v.deep_copy()), ignore_missing, stateful=[self],
                        name=str(self))
 
@@ -121,11 +207,16 @@ class Optimizer(abc.ABC):
         :param ignore_missing: Whether to ignore keys missing from the gradients which exist in the variables.
                                Default is False.
         :type ignore_missing: bool, optional
-        :return: The updated variables, following update step.
+        :return: The updated variables, following update step. If gradients are being accumulated, the variables are
+                 returned unchanged until the final step of each accumulation.
         """
+        if self._accumulate_steps > 1:
+            grads = self._accumulate(grads)
+            if grads is None:
+                return v
         if self._compiled and ivy.try_use_compiled:
             try:
-                self._count += 1
+                self._increment_step()
                 return self._compiled_step_fn(v, grads, ignore_missing)
             except Exception as e:
                 if self._fallback_to_non_compiled:
@@ -134,9 +225,9 @@ class Optimizer(abc.ABC):
         elif self._compile_on_next_step and self._initialized and not self._compiled:
             self.compile_graph(v, grads, ignore_missing)
             self._compile_on_next_step = False
-            self._count += 1
+            self._increment_step()
             return self._compiled_step_fn(v, grads, ignore_missing)
-        self._count += 1
+        self._increment_step()
         self._initialized = True
         return self._step_fn(v, grads, ignore_missing)
 
@@ -146,7 +237,8 @@ class Optimizer(abc.ABC):
 
 class SGD(Optimizer):
 
-    def __init__(self, lr=lambda: 1e-4, inplace=None, stop_gradients=True, compile_on_next_step=False):
+    def __init__(self, lr=lambda: 1e-4, inplace=None, stop_gradients=True, compile_on_next_step=False,
+                 accumulate_steps=1):
         """
         Construct a Stochastic-Gradient-Descent (SGD) optimizer.
 
@@ -160,8 +252,12 @@ class SGD(Optimizer):
         :type stop_gradients: bool, optional
         :param compile_on_next_step: Whether to compile the optimizer on the next step. Default is False.
         :type compile_on_next_step: bool, optional
+        :param accumulate_steps: The number of calls to step over which to accumulate the gradients, before the mean
+                                 gradients are applied to the variables. Default is 1, which applies every step.
+        :type accumulate_steps: int, optional
         """
-        Optimizer.__init__(self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step)
+        Optimizer.__init__(self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step,
+                           accumulate_steps=accumulate_steps)
 
     # Custom Step
 
@@ -175,8 +271,7 @@ class SGD(Optimizer):
         :type grads: sequence of arrays
         :return: The new updated variables container, following gradient descent step.
         """
-        return ivy.gradient_descent_update(v, grads, self._lr if isinstance(self._lr, float) else self._lr(),
-                                           self._inplace, self._stop_gradients)
+        return ivy.gradient_descent_update(v, grads, self._get_lr(), self._inplace, self._stop_gradients)
 
     def set_state(self, state):
         """
@@ -194,7 +289,8 @@ class SGD(Optimizer):
 
 class LARS(Optimizer):
 
-    def __init__(self, lr=lambda: 1e-4, decay_lambda=0, inplace=None, stop_gradients=True, compile_on_next_step=False):
+    def __init__(self, lr=lambda: 1e-4, decay_lambda=0, inplace=None, stop_gradients=True, compile_on_next_step=False,
+                 fused=False, accumulate_steps=1):
         """
         Construct a Layerwise Adaptive Rate Scaling (LARS) optimizer.
 
@@ -210,9 +306,17 @@ class LARS(Optimizer):
         :type stop_gradients: bool, optional
         :param compile_on_next_step: Whether to compile the optimizer on the next step. Default is False.
         :type compile_on_next_step: bool, optional
+        :param fused: Whether to use the fused multi-tensor update, which performs the weight updates in a single
+                      traversal of the variables. Default is False.
+        :type fused: bool, optional
+        :param accumulate_steps: The number of calls to step over which to accumulate the gradients, before the mean
+                                 gradients are applied to the variables. Default is 1, which applies every step.
+        :type accumulate_steps: int, optional
         """
         self._decay_lambda = decay_lambda
-        Optimizer.__init__(self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step)
+        self._fused = fused
+        Optimizer.__init__(self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step,
+                           accumulate_steps=accumulate_steps)
 
     # Custom Step
 
@@ -226,8 +330,8 @@ class LARS(Optimizer):
         :type grads: sequence of arrays
         :return: The new updated variables container, following LARS step.
         """
-        return ivy.lars_update(v, grads, self._lr if isinstance(self._lr, float) else self._lr(),
-                               self._decay_lambda, self._inplace, self._stop_gradients)
+        update_fn = ivy.fused_lars_update if self._fused else ivy.lars_update
+        return update_fn(v, grads, self._get_lr(), self._decay_lambda, self._inplace, self._stop_gradients)
 
     def set_state(self, state):
         """
@@ -246,7 +350,7 @@ class LARS(Optimizer):
 class Adam(Optimizer):
 
     def __init__(self, lr=1e-4, beta1=0.9, beta2=0.999, epsilon=1e-07, inplace=None, stop_gradients=True,
-                 compile_on_next_step=False, dev=None):
+                 compile_on_next_step=False, dev=None, fused=False, accumulate_steps=1):
         """
         Construct an ADAM optimizer.
 
@@ -268,8 +372,16 @@ class Adam(Optimizer):
         :type compile_on_next_step: bool, optional
         :param dev: device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu' etc.
         :type dev: ivy.Device, optional
-        """
-        Optimizer.__init__(self, lr, inplace, stop_gradients, True, compile_on_next_step, dev)
+        :param fused: Whether to use the fused multi-tensor update, which performs the weight updates in a single
+                      traversal of the variables, with the moments kept packed in one flat buffer per dtype and
+                      device. Default is False.
+        :type fused: bool, optional
+        :param accumulate_steps: The number of calls to step over which to accumulate the gradients, before the mean
+                                 gradients are applied to the variables. Default is 1, which applies every step.
+        :type accumulate_steps: int, optional
+        """
+        Optimizer.__init__(self, lr, inplace, stop_gradients, True, compile_on_next_step, dev=dev,
+                           accumulate_steps=accumulate_steps)
         self._beta1 = beta1
         self._beta2 = beta2
         self._epsilon = epsilon
@@ -277,6 +389,7 @@ class Adam(Optimizer):
         self._vw = None
         self._first_pass = True
         self._should_compile = False
+        self._fused = fused
 
     # Custom Step
 
@@ -294,9 +407,10 @@ class Adam(Optimizer):
             self._mw = grads
             self._vw = grads ** 2
             self._first_pass = False
-        new_v, self._mw, self._vw = ivy.adam_update(
-            v, grads, self._lr if isinstance(self._lr, float) else self._lr(), self._mw, self._vw, self._count,
-            self._beta1, self._beta2, self._epsilon, self._inplace, self._stop_gradients)
+        update_fn = ivy.fused_adam_update if self._fused else ivy.adam_update
+        new_v, self._mw, self._vw = update_fn(
+            v, self._pack_grads(grads) if self._fused else grads, self._get_lr(), self._mw, self._vw,
+            self._get_step(), self._beta1, self._beta2, self._epsilon, self._inplace, self._stop_gradients)
         return new_v
 
     def set_state(self, state):
@@ -311,13 +425,15 @@ class Adam(Optimizer):
 
     @property
     def state(self):
+        if isinstance(self._mw, ivy.PackedContainer):
+            return ivy.Container({'mw': self._mw.unpack(), 'vw': self._vw.unpack()})
         return ivy.Container({'mw': self._mw, 'vw': self._vw})
 
 
 class LAMB(Optimizer):
 
     def __init__(self, lr=1e-4, beta1=0.9, beta2=0.999, epsilon=1e-07, max_trust_ratio=10, decay_lambda=0, inplace=None,
-                 stop_gradients=True, compile_on_next_step=False, dev=None):
+                 stop_gradients=True, compile_on_next_step=False, dev=None, fused=False, accumulate_steps=1):
         """
         Construct an LAMB optimizer.
 
@@ -344,8 +460,16 @@ class LAMB(Optimizer):
         :type compile_on_next_step: bool, optional
         :param dev: device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu' etc.
         :type dev: ivy.Device, optional
-        """
-        Optimizer.__init__(self, lr, inplace, stop_gradients, True, compile_on_next_step, dev)
+        :param fused: Whether to use the fused multi-tensor update, which performs the weight updates in a single
+                      traversal of the variables, with the moments kept packed in one flat buffer per dtype and
+                      device. Default is False.
+        :type fused: bool, optional
+        :param accumulate_steps: The number of calls to step over which to accumulate the gradients, before the mean
+                                 gradients are applied to the variables. Default is 1, which applies every step.
+        :type accumulate_steps: int, optional
+        """
+        Optimizer.__init__(self, lr, inplace, stop_gradients, True, compile_on_next_step, dev=dev,
+                           accumulate_steps=accumulate_steps)
         self._beta1 = beta1
         self._beta2 = beta2
         self._epsilon = epsilon
@@ -354,6 +478,7 @@ class LAMB(Optimizer):
         self._max_trust_ratio = max_trust_ratio
         self._decay_lambda = decay_lambda
         self._first_pass = True
+        self._fused = fused
 
     # Custom Step
 
@@ -371,10 +496,11 @@ class LAMB(Optimizer):
             self._mw = grads
             self._vw = grads ** 2
             self._first_pass = False
-        new_v, self._mw, self._vw = ivy.lamb_update(
-            v, grads, self._lr if isinstance(self._lr, float) else self._lr(), self._mw, self._vw, self._count,
-            self._beta1, self._beta2, self._epsilon, self._max_trust_ratio, self._decay_lambda, self._inplace,
-            self._stop_gradients)
+        update_fn = ivy.fused_lamb_update if self._fused else ivy.lamb_update
+        new_v, self._mw, self._vw = update_fn(
+            v, self._pack_grads(grads) if self._fused else grads, self._get_lr(), self._mw, self._vw,
+            self._get_step(), self._beta1, self._beta2, self._epsilon, self._max_trust_ratio, self._decay_lambda,
+            self._inplace, self._stop_gradients)
         return new_v
 
     def set_state(self, state):
@@ -389,4 +515,6 @@ class LAMB(Optimizer):
 
     @property
     def state(self):
+        if isinstance(self._mw, ivy.PackedContainer):
+            return ivy.Container({'mw': self._mw.unpack(), 'vw': self._vw.unpack()})
         return ivy.Container({'mw': self._mw, 'vw': self._vw})
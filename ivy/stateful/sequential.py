@@ -8,7 +8,7 @@ from ivy.stateful.module import Module
 
 class Sequential(Module):
 
-    def __init__(self, *sub_modules, dev=None, v=None):
+    def __init__(self, *sub_modules, dev=None, v=None, checkpoint=False):
         """
         A sequential container. Modules will be added to it in the order they are passed in the constructor.
 
@@ -18,6 +18,10 @@ class Sequential(Module):
         :type dev: ivy.Device, optional
         :param v: the variables for each submodule in the sequence, constructed internally by default.
         :type v: ivy container of variables, optional
+        :param checkpoint: Whether to checkpoint the forward pass of the sequence, recomputing the intermediate
+                           activations during the backward pass rather than storing them, for the backends which
+                           rematerialize, see ivy.checkpoint. Default is False.
+        :type checkpoint: bool, optional
         """
         if v is not None:
             for i, submod in enumerate(sub_modules):
@@ -28,7 +32,7 @@ class Sequential(Module):
                         raise Exception('variables v passed to Sequential class must have key chains in the form of'
                                         '"submodules/v{}", where {} is an idx')
         self._submodules = list(sub_modules)
-        Module.__init__(self, dev, v)
+        Module.__init__(self, dev, v, checkpoint=checkpoint)
 
     def _forward(self, inputs):
         """
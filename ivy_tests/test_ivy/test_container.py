@@ -0,0 +1,473 @@
+"""
+Collection of tests for ivy.Container
+"""
+
+# global
+import os
+import time
+import queue
+import pytest
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# local
+import ivy
+
+
+def test_container_shuffle_via_permutation_keeps_rows_aligned():
+    ivy.set_framework('numpy')
+    try:
+        x = np.arange(24).reshape((6, 4))
+        container = ivy.Container({'a': x, 'b': {'c': x * 10, 'd': x[:, 0]}, 'e': np.arange(6)})
+        shuffled = container.shuffle(0, via_permutation=True)
+        a = ivy.to_numpy(shuffled.a)
+        assert a.shape == (6, 4)
+        # the rows are permuted as a whole, and identically for every leaf
+        assert sorted(map(tuple, a.tolist())) == sorted(map(tuple, x.tolist()))
+        assert np.array_equal(ivy.to_numpy(shuffled.b.c), a * 10)
+        assert np.array_equal(ivy.to_numpy(shuffled.b.d), a[:, 0])
+        assert np.array_equal(ivy.to_numpy(shuffled.e), a[:, 0] // 4)
+    finally:
+        ivy.unset_framework()
+
+
+def _packable_container():
+    return ivy.Container({'a': np.arange(6, dtype=np.float32).reshape((2, 3)),
+                          'b': {'c': np.arange(4, dtype=np.float32) + 10., 'd': np.array(3., np.float32)},
+                          'e': np.arange(5, dtype=np.int64),
+                          'f': 'not an array'})
+
+
+def test_packed_container_round_trip():
+    ivy.set_framework('numpy')
+    try:
+        container = _packable_container()
+        packed = container.pack()
+        # one buffer per dtype, with offsets accumulated within each buffer
+        # noinspection PyProtectedMember
+        assert sorted([int(buf.shape[0]) for buf in packed._buffers.values()]) == [5, 11]
+        # noinspection PyProtectedMember
+        assert [(kc, offset, size) for kc, _, offset, size, _ in packed._index] == \
+               [('a', 0, 6), ('b/c', 6, 4), ('b/d', 10, 1), ('e', 0, 5)]
+        unpacked = packed.unpack()
+        for kc, x in container.to_iterator():
+            y = unpacked.at_key_chain(kc)
+            if isinstance(x, str):
+                assert y == x
+                continue
+            y = ivy.to_numpy(y)
+            assert y.shape == x.shape and y.dtype == x.dtype
+            assert np.array_equal(y, x)
+    finally:
+        ivy.unset_framework()
+
+
+def test_packed_container_leaves_are_zero_copy_views():
+    ivy.set_framework('numpy')
+    try:
+        packed = _packable_container().pack()
+        # noinspection PyProtectedMember
+        buffers = [ivy.to_numpy(buf) for buf in packed._buffers.values()]
+        for kc in ['a', 'b/c', 'b/d', 'e']:
+            leaf = ivy.to_numpy(packed.at_key_chain(kc))
+            assert [buf for buf in buffers if np.shares_memory(leaf, buf)]
+        # writes into the buffer are seen through the views
+        # noinspection PyProtectedMember
+        float_buffer = [buf for buf in buffers if buf.dtype == np.float32][0]
+        float_buffer[0] = 100.
+        assert ivy.to_numpy(packed.unpack().a)[0, 0] == 100.
+    finally:
+        ivy.unset_framework()
+
+
+def test_packed_container_ops_match_container_ops():
+    ivy.set_framework('numpy')
+    try:
+        container = _packable_container().prune_key_chain('f')
+        packed = container.pack()
+        expected = (container * 2 + container).clip(1., 12.)
+        actual = (packed * 2 + packed).clip(1., 12.).unpack()
+        for kc, x in expected.to_iterator():
+            assert np.allclose(ivy.to_numpy(actual.at_key_chain(kc)), ivy.to_numpy(x))
+        assert np.allclose(ivy.to_numpy(packed.reduce_sum()),
+                           sum([np.sum(x) for _, x in container.to_iterator()]))
+    finally:
+        ivy.unset_framework()
+
+
+def test_indexed_container_index_and_invalidation():
+    ivy.set_framework('numpy')
+    try:
+        cont = ivy.Container({'a': np.zeros((2, 3)), 'b': {'c': np.ones((2, 3)), 'd': np.ones((2, 3)) * 2}}).indexed()
+        assert isinstance(cont.b, ivy.IndexedContainer)
+        assert cont.has_key_chain('b/c') and cont.has_key_chain('b.d') and not cont.has_key_chain('b/e')
+        assert np.array_equal(cont.at_key_chain('b/d'), np.ones((2, 3)) * 2)
+        assert [kc for kc, _ in cont.to_iterator()] == ['a', 'b/c', 'b/d']
+        assert cont.all_key_chains() == ['a', 'b/c', 'b/d']
+        assert cont.shape == [2, 3]
+        assert cont.dev == ivy.dev(cont.a)
+
+        # setting a nested entry invalidates the index and the cached shape of every ancestor
+        cont.b['e'] = np.zeros((2, 5))
+        assert cont.has_key_chain('b/e')
+        assert cont.shape == [2, None]
+
+        # as do key-chain sets, including those which create new child containers
+        cont.set_at_key_chain('f/g', np.zeros((2,)), inplace=True)
+        assert isinstance(cont.f, ivy.IndexedContainer)
+        assert cont.has_key_chain('f/g')
+        cont.f['h'] = np.zeros((2,))
+        assert cont.all_key_chains() == ['a', 'b/c', 'b/d', 'b/e', 'f/g', 'f/h']
+        assert cont.shape == [2]
+
+        del cont.b['e']
+        assert not cont.has_key_chain('b/e')
+    finally:
+        ivy.unset_framework()
+
+
+def test_container_memmap_round_trip(tmp_path):
+    ivy.set_framework('numpy')
+    try:
+        container = ivy.Container({'a': np.arange(24, dtype=np.float32).reshape((6, 4)),
+                                   'b': {'c': np.arange(6, dtype=np.int64), 'd': 'text', 'e': {}}})
+        container.to_disk_as_memmap(str(tmp_path))
+        loaded = ivy.Container.from_disk_as_memmap(str(tmp_path))
+        # with numpy, the leaves stay memory-mapped, and are only read when accessed
+        assert isinstance(loaded.a, np.memmap)
+        assert loaded.a.dtype == np.float32 and loaded.b.c.dtype == np.int64
+        assert np.array_equal(loaded.a, container.a)
+        assert np.array_equal(loaded.b.c, container.b.c)
+        assert loaded.b.d == 'text'
+        assert isinstance(loaded.b.e, ivy.Container) and not loaded.b.e
+        sliced = ivy.Container.from_disk_as_memmap(str(tmp_path), slice_obj=slice(2, 4))
+        assert np.array_equal(sliced.a, container.a[2:4])
+        assert np.array_equal(sliced.b.c, container.b.c[2:4])
+        loaded_in_memory = ivy.Container.from_disk_as_memmap(str(tmp_path), mmap=False)
+        assert not isinstance(loaded_in_memory.a, np.memmap)
+        assert np.array_equal(loaded_in_memory.a, container.a)
+    finally:
+        ivy.unset_framework()
+
+
+def _write_h5_container(h5_filepath, num_rows):
+    x = np.arange(num_rows * 3, dtype=np.float32).reshape((num_rows, 3))
+    container = ivy.Container({'a': x, 'b': {'c': np.arange(num_rows, dtype=np.int64)}})
+    container.to_disk_as_hdf5(h5_filepath, mode='w')
+    return container
+
+
+def test_container_iter_hdf5(tmp_path):
+    pytest.importorskip('h5py')
+    ivy.set_framework('numpy')
+    try:
+        h5_filepath = os.path.join(str(tmp_path), 'data.hdf5')
+        container = _write_h5_container(h5_filepath, 10)
+        batches = list(ivy.Container.iter_hdf5(h5_filepath, 4))
+        assert [b.b.c.shape[0] for b in batches] == [4, 4, 2]
+        assert np.array_equal(np.concatenate([ivy.to_numpy(b.a) for b in batches], 0), container.a)
+        assert np.array_equal(np.concatenate([ivy.to_numpy(b.b.c) for b in batches], 0), container.b.c)
+        dropped = list(ivy.Container.iter_hdf5(h5_filepath, 4, drop_last=True))
+        assert [b.b.c.shape[0] for b in dropped] == [4, 4]
+        shuffled = list(ivy.Container.iter_hdf5(h5_filepath, 4, shuffle=True, seed_value=1, num_workers=2))
+        c = np.concatenate([ivy.to_numpy(b.b.c) for b in shuffled], 0)
+        # every row is yielded exactly once, with the rows of all datasets permuted identically
+        assert sorted(c.tolist()) == list(range(10))
+        assert not np.array_equal(c, container.b.c)
+        assert np.array_equal(np.concatenate([ivy.to_numpy(b.a) for b in shuffled], 0), container.a[c])
+        reshuffled = list(ivy.Container.iter_hdf5(h5_filepath, 4, shuffle=True, seed_value=1))
+        assert np.array_equal(np.concatenate([ivy.to_numpy(b.b.c) for b in reshuffled], 0), c)
+    finally:
+        ivy.unset_framework()
+
+
+def test_container_iter_hdf5_closes_file_when_stopped_early(tmp_path):
+    h5py = pytest.importorskip('h5py')
+    ivy.set_framework('numpy')
+    try:
+        h5_filepath = os.path.join(str(tmp_path), 'data.hdf5')
+        _write_h5_container(h5_filepath, 10)
+        iterator = ivy.Container.iter_hdf5(h5_filepath, 2, prefetch=3)
+        next(iterator)
+        iterator.close()
+        # the file handle opened by the iterator must be released, so the file can be opened for writing again
+        with h5py.File(h5_filepath, 'w'):
+            pass
+    finally:
+        ivy.unset_framework()
+
+
+def _filled_queues(num_queues, rows_per_queue):
+    queues = list()
+    for i in range(num_queues):
+        q = queue.Queue()
+        q.put({'a': np.full((rows_per_queue, 3), i, dtype=np.float32), 'b': {'c': np.arange(rows_per_queue) + i}})
+        queues.append(q)
+    return queues
+
+
+def test_container_queue_prefetch_matches_lazy_loading():
+    ivy.set_framework('numpy')
+    try:
+        lazy = ivy.Container(queues=_filled_queues(4, 2), queue_load_sizes=[2] * 4,
+                             container_combine_method='concat')
+        prefetched = ivy.Container(queues=_filled_queues(4, 2), queue_load_sizes=[2] * 4,
+                                   container_combine_method='concat', queue_prefetch=2)
+        for query in [0, slice(1, 3), 3, slice(4, 8), 7]:
+            expected, actual = lazy[query], prefetched[query]
+            assert np.array_equal(ivy.to_numpy(actual.a), ivy.to_numpy(expected.a))
+            assert np.array_equal(ivy.to_numpy(actual.b.c), ivy.to_numpy(expected.b.c))
+        # lazy loading keeps every loaded container, whereas prefetching releases those before the earliest query
+        # noinspection PyProtectedMember
+        assert sorted(lazy._loaded_containers_from_queues) == [0, 1, 2, 3]
+        # noinspection PyProtectedMember
+        assert sorted(prefetched._loaded_containers_from_queues) == [3]
+    finally:
+        ivy.unset_framework()
+
+
+def test_container_queue_prefetch_loads_ahead_and_releases_in_order():
+    ivy.set_framework('numpy')
+    try:
+        cont = ivy.Container(queues=_filled_queues(4, 2), queue_load_sizes=[2] * 4, container_combine_method='concat',
+                             queue_prefetch=2)
+        # the background thread loads up to queue_prefetch containers before any are requested, and no more
+        # noinspection PyProtectedMember
+        with cont._queue_cond:
+            # noinspection PyProtectedMember
+            assert cont._queue_cond.wait_for(lambda: len(cont._loaded_containers_from_queues) == 2, 5.)
+        time.sleep(0.05)
+        # noinspection PyProtectedMember
+        assert sorted(cont._loaded_containers_from_queues) == [0, 1]
+        assert np.array_equal(ivy.to_numpy(cont[5].b.c), np.array(3))
+        with pytest.raises(Exception):
+            # the containers of the earlier queues are released, so indexing them again is an error
+            cont[0]
+    finally:
+        ivy.unset_framework()
+
+
+def test_container_queue_prefetch_raises_loading_errors():
+    ivy.set_framework('numpy')
+    try:
+        queues = _filled_queues(1, 2) + [queue.Queue()]
+        cont = ivy.Container(queues=queues, queue_load_sizes=[2, 2], container_combine_method='concat',
+                             queue_timeout=0.1, queue_prefetch=1)
+        assert np.array_equal(ivy.to_numpy(cont[1].b.c), np.array(1))
+        with pytest.raises(Exception):
+            # the second queue is empty, so the prefetching thread fails, and the error is raised when indexing
+            cont[2]
+    finally:
+        ivy.unset_framework()
+
+
+def test_container_shuffle_h5_file_in_blocks_keeps_dataset_properties(tmp_path):
+    h5py = pytest.importorskip('h5py')
+    h5_filepath = os.path.join(str(tmp_path), 'data.hdf5')
+    x = np.arange(30, dtype=np.float32).reshape((10, 3))
+    with h5py.File(h5_filepath, 'w') as h5_file:
+        dataset = h5_file.create_dataset('x', data=x, chunks=(4, 3), compression='gzip', compression_opts=7,
+                                         shuffle=True, maxshape=(None, 3))
+        dataset.attrs['units'] = 'm'
+        h5_file.create_group('g').create_dataset('y', data=np.arange(10))
+    ivy.Container.shuffle_h5_file(h5_filepath, seed_value=0, block_size=3)
+    with h5py.File(h5_filepath, 'r') as h5_file:
+        dataset = h5_file['x']
+        assert dataset.chunks == (4, 3) and dataset.maxshape == (None, 3)
+        assert dataset.compression == 'gzip' and dataset.compression_opts == 7 and dataset.shuffle
+        assert dataset.attrs['units'] == 'm'
+        assert set(h5_file.keys()) == {'g', 'x'}
+        y = h5_file['g/y'][:]
+        # the rows of every dataset are permuted identically, with each row appearing once
+        assert sorted(y.tolist()) == list(range(10)) and not np.array_equal(y, np.arange(10))
+        assert np.array_equal(dataset[:], x[y])
+
+
+def _assert_same_as_constructed(cont):
+    # containers built via _from_trusted must be indistinguishable from those built via the constructor
+    constructed = ivy.Container(dict(cont), **cont.config)
+    assert type(cont) is ivy.Container
+    assert list(cont.keys()) == list(constructed.keys())
+    assert cont.__dict__ == constructed.__dict__
+    for value in cont.values():
+        if isinstance(value, ivy.Container):
+            _assert_same_as_constructed(value)
+
+
+def test_container_trusted_construction_matches_constructor():
+    ivy.set_framework('numpy')
+    try:
+        container = ivy.Container({'b': np.arange(4.), 'a': {'d': np.ones((4, 2)), 'c': np.zeros(4)}},
+                                  alphabetical_keys=False, print_limit=5, default_key_color='red')
+        results = {'map': container.map(lambda x, kc: x * 2),
+                   'slice': container[1:3],
+                   'add': container + container,
+                   'reduce': ivy.Container.reduce([container, container], lambda xs: xs[0] - xs[1])}
+        for result in results.values():
+            _assert_same_as_constructed(result)
+            assert list(result.a.keys()) == ['d', 'c']
+        assert np.array_equal(results['slice'].a.d, container.a.d[1:3])
+        assert np.array_equal(results['add'].b, container.b * 2)
+        assert np.array_equal(results['map'].a.c, results['reduce'].a.c)
+        # the results are fully functional containers
+        results['map'].e = np.ones(2)
+        assert np.array_equal(results['map'].e, np.ones(2))
+        assert str(results['slice'])
+    finally:
+        ivy.unset_framework()
+
+
+def test_container_trusted_construction_falls_back_for_untrusted_values():
+    ivy.set_framework('numpy')
+    try:
+        container = ivy.Container({'a': np.ones(2)}, types_to_iteratively_nest=(list,))
+        # plain dicts, and values of the types to nest, still need to be converted by the constructor
+        # noinspection PyProtectedMember
+        from_dict = ivy.Container._from_trusted({'a': {'b': np.ones(2)}}, container.config)
+        assert isinstance(from_dict.a, ivy.Container)
+        # noinspection PyProtectedMember
+        from_list = ivy.Container._from_trusted({'a': [np.ones(2), np.zeros(2)]}, container.config)
+        assert isinstance(from_list.a, ivy.Container) and np.array_equal(from_list.a.it_1, np.zeros(2))
+    finally:
+        ivy.unset_framework()
+
+
+def _mappable_container():
+    return ivy.Container({'a': np.arange(8192.), 'b': {'c': np.ones((64, 128)), 'd': np.arange(4.)},
+                          'e': [np.arange(5000.), np.ones(3)]})
+
+
+def test_container_parallel_map_matches_sequential_map():
+    ivy.set_framework('numpy')
+    try:
+        container = _mappable_container()
+        for kwargs in [{}, {'key_chains': ['b/c']}, {'key_chains': ['b/c'], 'to_apply': False},
+                       {'key_chains': ['a', 'b/d'], 'prune_unapplied': True}, {'map_sequences': True}]:
+            expected = container.map(lambda x, kc: x * 2 if hasattr(x, 'shape') else x, **kwargs)
+            actual = container.map(lambda x, kc: x * 2 if hasattr(x, 'shape') else x, num_workers=4,
+                                   min_parallel_size=100, **kwargs)
+            assert ivy.Container.identical_structure([expected, actual])
+            for (_, e), (_, a) in zip(expected.to_iterator(), actual.to_iterator()):
+                if isinstance(e, list):
+                    assert all([np.array_equal(e_, a_) for e_, a_ in zip(e, a)])
+                else:
+                    assert np.array_equal(e, a)
+        inplace = _mappable_container()
+        assert inplace.map(lambda x, kc: x + 1, key_chains=['a', 'b/c'], num_workers=2, inplace=True) is None
+        assert np.array_equal(inplace.a, container.a + 1) and np.array_equal(inplace.b.c, container.b.c + 1)
+        assert np.array_equal(inplace.b.d, container.b.d)
+    finally:
+        ivy.unset_framework()
+
+
+def test_container_parallel_map_uses_executor_for_large_leaves_only():
+    ivy.set_framework('numpy')
+    try:
+        threads = dict()
+
+        def _record_thread(x, kc):
+            threads[kc] = threading.get_ident()
+            return x
+
+        with ThreadPoolExecutor(2) as executor:
+            _mappable_container().map(_record_thread, executor=executor, min_parallel_size=4096)
+            # a passed executor is left running for the caller to reuse
+            assert executor.submit(lambda: 1).result() == 1
+        assert threads['b/d'] == threading.get_ident()
+        assert threads['a'] != threading.get_ident() and threads['b/c'] != threading.get_ident()
+
+        def _raise(x, kc):
+            raise ValueError('failed at {}'.format(kc))
+
+        with pytest.raises(ValueError):
+            _mappable_container().map(_raise, num_workers=2, min_parallel_size=1)
+    finally:
+        ivy.unset_framework()
+
+
+def _h5_batch(start, batch_size):
+    return ivy.Container({'x': np.arange(start * 3, (start + batch_size) * 3, dtype=np.float32).reshape((-1, 3)),
+                          'y': {'z': np.arange(start, start + batch_size)}})
+
+
+def test_h5_writer_appends_batches(tmp_path):
+    h5py = pytest.importorskip('h5py')
+    ivy.set_framework('numpy')
+    try:
+        h5_filepath = os.path.join(str(tmp_path), 'data.hdf5')
+        with ivy.H5Writer(h5_filepath, mode='w', chunks=4, compression='gzip', compression_opts=3,
+                          max_pending=1) as writer:
+            for start, batch_size in [(0, 5), (5, 3), (8, 6)]:
+                assert writer.write(_h5_batch(start, batch_size)) == start
+            assert writer.index == 14
+        with pytest.raises(Exception):
+            writer.write(_h5_batch(14, 1))
+        with h5py.File(h5_filepath, 'r') as h5_file:
+            # the datasets are grown to fit each batch, and keep the chunking and compression they were created with
+            assert h5_file['x'].shape == (14, 3) and h5_file['y/z'].shape == (14,)
+            assert h5_file['x'].chunks == (4, 3) and h5_file['x'].compression == 'gzip'
+            assert h5_file['x'].compression_opts == 3
+        loaded = ivy.Container.from_disk_as_hdf5(h5_filepath)
+        expected = _h5_batch(0, 14)
+        assert np.array_equal(ivy.to_numpy(loaded.x), expected.x)
+        assert np.array_equal(ivy.to_numpy(loaded.y.z), expected.y.z)
+    finally:
+        ivy.unset_framework()
+
+
+def test_h5_writer_with_max_batch_size_into_open_file(tmp_path):
+    h5py = pytest.importorskip('h5py')
+    ivy.set_framework('numpy')
+    try:
+        h5_filepath = os.path.join(str(tmp_path), 'data.hdf5')
+        with h5py.File(h5_filepath, 'w') as h5_file:
+            writer = ivy.H5Writer(h5_file, starting_index=2, max_batch_size=10)
+            writer.write(_h5_batch(2, 4))
+            writer.write(_h5_batch(6, 4))
+            writer.close()
+            # the file was opened by the caller, so it is flushed but left open
+            assert h5_file['x'].shape == (10, 3)
+            assert np.array_equal(h5_file['y/z'][2:], np.arange(2, 10))
+    finally:
+        ivy.unset_framework()
+
+
+def test_container_to_disk_as_hdf5_with_chunks_and_compression(tmp_path):
+    h5py = pytest.importorskip('h5py')
+    ivy.set_framework('numpy')
+    try:
+        h5_filepath = os.path.join(str(tmp_path), 'data.hdf5')
+        container = _h5_batch(0, 9)
+        container.to_disk_as_hdf5(h5_filepath, mode='w', chunks=(2, 3), compression='lzf')
+        with h5py.File(h5_filepath, 'r') as h5_file:
+            assert h5_file['x'].chunks == (2, 3) and h5_file['x'].compression == 'lzf'
+            # the chunk shape applies to the leading dimensions of leaves with a lower rank
+            assert h5_file['y/z'].chunks == (2,) and h5_file['y/z'].compression == 'lzf'
+        loaded = ivy.Container.from_disk_as_hdf5(h5_filepath)
+        assert np.array_equal(ivy.to_numpy(loaded.x), container.x)
+        assert np.array_equal(ivy.to_numpy(loaded.y.z), container.y.z)
+    finally:
+        ivy.unset_framework()
+
+
+def test_packed_container_pack_into_existing_buffers():
+    ivy.set_framework('numpy')
+    try:
+        container = _packable_container()
+        packed = container.pack()
+        view = packed.at_key_chain('a')
+        new_container = container.map(lambda x, kc: np.asarray(x * 3, x.dtype) if ivy.is_array(x) else x)
+        assert packed.same_layout(new_container)
+        assert packed.pack_into(new_container) is packed
+        # the leaves are written into the existing buffers, so views retrieved earlier see the new values
+        assert np.array_equal(ivy.to_numpy(view), ivy.to_numpy(new_container.a))
+        for kc, x in new_container.to_iterator():
+            if ivy.is_array(x):
+                assert np.array_equal(ivy.to_numpy(packed.at_key_chain(kc)), ivy.to_numpy(x))
+        reshaped = new_container.map(lambda x, kc: np.reshape(x, (-1,)) if ivy.is_array(x) else x)
+        assert not packed.same_layout(reshaped) and not packed.same_layout(new_container.prune_key_chain('a'))
+        with pytest.raises(Exception):
+            packed.pack_into(reshaped)
+    finally:
+        ivy.unset_framework()
@@ -0,0 +1,63 @@
+"""
+Collection of tests for the Ivy device functions
+"""
+
+# global
+import gc
+import weakref
+import pytest
+import numpy as np
+
+# local
+import ivy
+# noinspection PyProtectedMember
+from ivy.functional.ivy.core.device import _SharedArray, _to_shared_memory, _from_shared_memory
+
+
+def test_shared_array_loads_as_zero_copy_view():
+    ivy.set_framework('numpy')
+    try:
+        x = np.arange(12, dtype=np.float32).reshape((3, 4))
+        loaded = _SharedArray(x).load()
+        assert np.array_equal(loaded, x) and loaded.dtype == x.dtype
+        # the loaded array views the block directly, and derived views keep the block mapped once it is deleted
+        owner = weakref.ref(loaded.base)
+        derived = loaded[1:]
+        del loaded
+        gc.collect()
+        assert owner() is not None
+        assert np.array_equal(derived, x[1:])
+        del derived
+        gc.collect()
+        assert owner() is None
+    finally:
+        ivy.unset_framework()
+
+
+def test_shared_memory_nest_round_trip():
+    ivy.set_framework('numpy')
+    try:
+        nest = {'a': np.arange(6.), 'b': [np.ones((2, 3), dtype=np.int32), 'text'],
+                'c': ivy.Container({'d': np.zeros((0, 4))})}
+        shared = _to_shared_memory(nest)
+        assert isinstance(shared['a'], _SharedArray) and isinstance(shared['c'].d, _SharedArray)
+        loaded = _from_shared_memory(shared)
+        assert np.array_equal(loaded['a'], nest['a'])
+        assert np.array_equal(loaded['b'][0], nest['b'][0]) and loaded['b'][0].dtype == np.int32
+        assert loaded['b'][1] == 'text'
+        assert loaded['c'].d.shape == (0, 4)
+    finally:
+        ivy.unset_framework()
+
+
+def test_shared_array_release_unlinks_unloaded_block():
+    ivy.set_framework('numpy')
+    try:
+        shared = _SharedArray(np.arange(4.))
+        shared.release()
+        # the block is gone, so a later load fails, and releasing again is a no-op
+        with pytest.raises(FileNotFoundError):
+            shared.load()
+        shared.release()
+    finally:
+        ivy.unset_framework()
@@ -0,0 +1,188 @@
+"""
+Collection of tests for the Ivy graph compiler
+"""
+
+# global
+import pytest
+import numpy as np
+
+# local
+import ivy
+
+
+def _chain_fn(x, y):
+    a = ivy.tanh(x) + y
+    b = a * 2.
+    c = ivy.exp(-b) - ivy.sin(a)
+    return c, ivy.reduce_sum(b * c)
+
+
+def _random_inputs(seed):
+    rng = np.random.RandomState(seed)
+    return ivy.array(rng.uniform(size=(3, 4)), 'float32'), ivy.array(rng.uniform(size=(3, 4)), 'float32')
+
+
+def test_slot_executor_matches_dict_executor():
+    ivy.set_framework('numpy')
+    try:
+        x, y = _random_inputs(0)
+        dict_fn = ivy.compile_graph(_chain_fn, x, y)
+        slots_fn = ivy.compile_graph(_chain_fn, x, y, executor='slots')
+        for seed in range(3):
+            x, y = _random_inputs(seed)
+            expected = [ivy.to_numpy(r).copy() for r in dict_fn(x, y)]
+            actual = [ivy.to_numpy(r).copy() for r in slots_fn(x, y)]
+            for e, a in zip(expected, actual):
+                assert np.allclose(e, a)
+            assert np.allclose(expected[0], ivy.to_numpy(_chain_fn(x, y)[0]))
+    finally:
+        ivy.unset_framework()
+
+
+def test_slot_executor_buffer_recycling_leaves_held_outputs_unchanged():
+    ivy.set_framework('numpy')
+    try:
+        x, y = _random_inputs(0)
+        slots_fn = ivy.compile_graph(_chain_fn, x, y, executor='slots')
+        held = list()
+        for seed in range(4):
+            x, y = _random_inputs(seed)
+            held.append((ivy.to_numpy(slots_fn(x, y)[0]), ivy.to_numpy(_chain_fn(x, y)[0])))
+        # recycled intermediate buffers must never be ones still referenced by earlier outputs
+        for out, expected in held:
+            assert np.allclose(out, expected)
+    finally:
+        ivy.unset_framework()
+
+
+def test_graph_cache_recompiles_for_new_non_array_args():
+    ivy.set_framework('numpy')
+    try:
+        def fn(x, scale, shift=0.):
+            return x * scale + shift
+
+        x, _ = _random_inputs(0)
+        cached_fn = ivy.compile_graph(fn, cache_by='shape')
+        for scale, shift in [(2., 0.), (3., 0.), (2., 0.), (2., 1.), (2, 0.)]:
+            assert np.allclose(ivy.to_numpy(cached_fn(x, scale, shift=shift)), ivy.to_numpy(x) * scale + shift)
+        # the non-array leaves are baked into each graph as constants, so each distinct value needs its own graph
+        assert cached_fn.cache_info()['misses'] == 4
+        assert cached_fn.cache_info()['hits'] == 1
+    finally:
+        ivy.unset_framework()
+
+
+def test_fold_constants_shrinks_graph_without_array_caching():
+    ivy.set_framework('numpy')
+    try:
+        def fn(x):
+            c = ivy.exp(ivy.ones((3, 4)) * 2.)
+            return ivy.tanh(x) + c
+
+        x, _ = _random_inputs(0)
+        comp_fn, graph = ivy.compile_graph(fn, x, with_array_caching=False, return_graph=True)
+        folded_fn, folded_graph = ivy.compile_graph(fn, x, with_array_caching=False, passes=True, return_graph=True)
+        assert folded_graph.pass_report['fold_constants'] > 0
+        # noinspection PyProtectedMember
+        assert len(folded_graph._all_functions_fixed) < len(graph._all_functions_fixed)
+        assert np.allclose(ivy.to_numpy(folded_fn(x)), ivy.to_numpy(comp_fn(x)))
+        assert np.allclose(ivy.to_numpy(folded_fn(x)), ivy.to_numpy(fn(x)))
+        # with array caching, the constants are already cached when connecting, so folding is not a default pass
+        _, cached_graph = ivy.compile_graph(fn, x, passes=True, return_graph=True)
+        assert 'fold_constants' not in cached_graph.pass_report
+    finally:
+        ivy.unset_framework()
+
+
+def test_loaded_graph_keeps_constant_dtypes(tmp_path):
+    pytest.importorskip('torch')
+    ivy.set_framework('torch')
+    try:
+        def fn(x):
+            idxs = ivy.array([[2], [0]], 'int64')
+            return ivy.gather_nd(x, idxs) * ivy.array([2.], 'float64')
+
+        x, _ = _random_inputs(0)
+        _, graph = ivy.compile_graph(fn, x, return_graph=True)
+        graph.save(str(tmp_path))
+        loaded_fn = ivy.load_compiled_graph(str(tmp_path))
+        # integer indices which came back as floats could not be gathered with, and float64 would become float32
+        ret = loaded_fn(x)
+        assert ivy.dtype(ret, as_str=True) == 'float64'
+        assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(fn(x)))
+    finally:
+        ivy.unset_framework()
+
+
+def test_wavefront_executor_serializes_side_effecting_functions():
+    ivy.set_framework('numpy')
+    try:
+        def fn(x, y):
+            a = ivy.tanh(x)
+            b = ivy.sin(y)
+            c = ivy.exp(x)
+            a += b
+            return a + c, b * c
+
+        x, y = _random_inputs(0)
+        comp_fn, graph = ivy.compile_graph(fn, x, y, executor='wavefront', min_group_width=2, return_graph=True)
+        for seed in range(3):
+            x, y = _random_inputs(seed)
+            for out, expected in zip(comp_fn(x, y), fn(x, y)):
+                assert np.allclose(ivy.to_numpy(out), ivy.to_numpy(expected))
+        # noinspection PyProtectedMember
+        from ivy.graph_compiler.passes import _is_pure
+        # noinspection PyProtectedMember
+        for parallel, slotted_fns, _ in graph._slotted_groups:
+            impure = [f for f, _, _, _ in slotted_fns if hasattr(f, 'backend_fn') and not _is_pure(graph, f)]
+            if impure:
+                assert not parallel and len(slotted_fns) == 1
+    finally:
+        ivy.unset_framework()
+
+
+def test_graph_cache_shuts_down_thread_pools_of_evicted_graphs():
+    ivy.set_framework('numpy')
+    try:
+        cached_fn = ivy.compile_graph(_chain_fn, cache_by='shape', max_cached_graphs=1, executor='wavefront',
+                                      min_group_width=1)
+        x, y = _random_inputs(0)
+        cached_fn(x, y)
+        graph = cached_fn.graphs[0]
+        # noinspection PyProtectedMember
+        assert graph._thread_pool is not None
+        cached_fn(ivy.concatenate([x, x], 0), ivy.concatenate([y, y], 0))
+        assert cached_fn.cache_info()['evictions'] == 1
+        # noinspection PyProtectedMember
+        assert graph._thread_pool is None
+    finally:
+        ivy.unset_framework()
+
+
+def test_saved_graph_round_trip(tmp_path):
+    ivy.set_framework('numpy')
+    try:
+        x, y = _random_inputs(0)
+        comp_fn, graph = ivy.compile_graph(_chain_fn, x, y, return_graph=True)
+        graph.save(str(tmp_path))
+        for mmap in [True, False]:
+            loaded_fn = ivy.load_compiled_graph(str(tmp_path), mmap=mmap)
+            for seed in range(3):
+                x, y = _random_inputs(seed)
+                expected = [ivy.to_numpy(r).copy() for r in comp_fn(x, y)]
+                for e, a in zip(expected, loaded_fn(x, y)):
+                    assert np.allclose(e, ivy.to_numpy(a))
+    finally:
+        ivy.unset_framework()
+
+
+def test_graph_with_fused_nodes_cannot_be_saved(tmp_path):
+    ivy.set_framework('numpy')
+    try:
+        x, y = _random_inputs(0)
+        _, graph = ivy.compile_graph(_chain_fn, x, y, passes=['fuse_elementwise'], return_graph=True)
+        assert graph.pass_report['fuse_elementwise'] > 0
+        with pytest.raises(Exception):
+            graph.save(str(tmp_path))
+    finally:
+        ivy.unset_framework()
@@ -0,0 +1,78 @@
+"""
+Collection of tests for Ivy meta learning and vectorized mapping
+"""
+
+# global
+import pytest
+import numpy as np
+
+# local
+import ivy
+
+
+def _meta_batch_n_variables(num_tasks):
+    rng = np.random.RandomState(0)
+    batch = ivy.Container({'x': ivy.array(rng.uniform(size=(num_tasks, 5, 3)), 'float32'),
+                           'y': ivy.array(rng.uniform(size=(num_tasks, 5, 1)), 'float32')})
+    variables = ivy.Container({'w': ivy.variable(ivy.array(rng.uniform(size=(3, 1)), 'float32')),
+                               'b': ivy.variable(ivy.array(rng.uniform(size=(1,)), 'float32'))})
+    return batch, variables
+
+
+def _meta_cost(batch, v):
+    return ivy.reduce_mean((ivy.matmul(batch.x, v.w) + v.b - batch.y) ** 2)
+
+
+@pytest.mark.parametrize('step_fn', ['fomaml_step', 'reptile_step', 'maml_step'])
+@pytest.mark.parametrize('return_inner_v', ['all', 'first'])
+def test_vectorized_meta_step_matches_for_loop(step_fn, return_inner_v):
+    pytest.importorskip('torch')
+    ivy.set_framework('torch')
+    try:
+        num_tasks = 4
+        batch, variables = _meta_batch_n_variables(num_tasks)
+        args = (batch, _meta_cost, variables, 2, 0.1) if step_fn == 'reptile_step' else \
+            (batch, _meta_cost, None, variables, 2, 0.1)
+        fn = getattr(ivy, step_fn)
+        loop_ret = fn(*args, batched=False, return_inner_v=return_inner_v)
+        vectorized_ret = fn(*args, vectorized=True, return_inner_v=return_inner_v)
+        batched_ret = fn(*args, return_inner_v=return_inner_v)
+        assert np.allclose(ivy.to_numpy(loop_ret[0]), ivy.to_numpy(vectorized_ret[0]), atol=1e-6)
+        if step_fn != 'maml_step':
+            for kc, grad in loop_ret[1].to_iterator():
+                assert np.allclose(ivy.to_numpy(grad), ivy.to_numpy(vectorized_ret[1][kc]), atol=1e-6)
+        # the inner variables have a leading task dimension, of size num_tasks for all and 1 for first
+        num_returned = num_tasks if return_inner_v == 'all' else 1
+        for kc, loop_v in loop_ret[-1].to_iterator():
+            assert tuple(loop_v.shape) == (num_returned,) + tuple(variables[kc].shape)
+            assert tuple(vectorized_ret[-1][kc].shape) == tuple(loop_v.shape)
+            assert tuple(batched_ret[-1][kc].shape) == tuple(loop_v.shape)
+            assert np.allclose(ivy.to_numpy(loop_v), ivy.to_numpy(vectorized_ret[-1][kc]), atol=1e-6)
+    finally:
+        ivy.unset_framework()
+
+
+@pytest.mark.parametrize('framework', ['numpy', 'torch'])
+def test_vmap_matches_per_example_calls(framework):
+    pytest.importorskip(framework)
+    ivy.set_framework(framework)
+    try:
+        rng = np.random.RandomState(0)
+        x = ivy.Container({'a': ivy.array(rng.uniform(size=(3, 4)), 'float32'),
+                           'b': ivy.array(rng.uniform(size=(4, 3)), 'float32')})
+        w = ivy.array(rng.uniform(size=(4,)), 'float32')
+
+        def fn(x_, w_):
+            return {'sum': ivy.reduce_sum(x_.a * w_ + x_.b), 'prod': x_.a * x_.b}
+
+        # the batch axis is 0 for x.a and 1 for x.b, with w broadcast, and the outputs stacked along the last axis
+        x_b = x.copy()
+        x_b.b = ivy.swapaxes(x.b, 0, 1)
+        ret = ivy.vmap(lambda x_, w_: fn(x_, w_), in_axes=(0, None), out_axes=-1)(
+            ivy.Container({'a': x.a, 'b': x_b.b}), w)
+        for i in range(3):
+            expected = fn(ivy.Container({'a': x.a[i], 'b': x.b[:, i]}), w)
+            assert np.allclose(ivy.to_numpy(ret['sum'])[i], ivy.to_numpy(expected['sum']))
+            assert np.allclose(ivy.to_numpy(ret['prod'])[:, i], ivy.to_numpy(expected['prod']))
+    finally:
+        ivy.unset_framework()
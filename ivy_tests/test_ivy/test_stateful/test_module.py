@@ -0,0 +1,70 @@
+"""
+Collection of tests for Ivy modules
+"""
+
+# global
+import pytest
+import numpy as np
+
+# local
+import ivy
+
+
+class _TanhChain(ivy.Module):
+
+    def __init__(self, ws, checkpoint=False):
+        self._ws = ws
+        self.forward_calls = 0
+        ivy.Module.__init__(self, checkpoint=checkpoint)
+
+    def _create_variables(self, dev):
+        return {'w{}'.format(i): ivy.variable(ivy.array(w, 'float32', dev)) for i, w in enumerate(self._ws)}
+
+    def _forward(self, x, scale=1.):
+        self.forward_calls += 1
+        for i in range(len(self._ws)):
+            x = ivy.tanh(ivy.matmul(x, self.v['w{}'.format(i)])) * scale
+        return x
+
+
+def test_checkpointed_module_gradients_match_uncheckpointed():
+    pytest.importorskip('torch')
+    ivy.set_framework('torch')
+    try:
+        rng = np.random.RandomState(0)
+        ws = [rng.uniform(-1, 1, size=(4, 4)) for _ in range(3)]
+        x = ivy.array(rng.uniform(size=(5, 4)), 'float32')
+        module, checkpointed_module = _TanhChain(ws), _TanhChain(ws, checkpoint=True)
+        cost, grads = ivy.execute_with_gradients(lambda v: ivy.reduce_mean(module(x, scale=2., v=v)), module.v)
+        checkpointed_cost, checkpointed_grads = ivy.execute_with_gradients(
+            lambda v: ivy.reduce_mean(checkpointed_module(x, scale=2., v=v)), checkpointed_module.v)
+        assert np.allclose(ivy.to_numpy(cost), ivy.to_numpy(checkpointed_cost))
+        for kc, grad in grads.to_iterator():
+            assert np.allclose(ivy.to_numpy(grad), ivy.to_numpy(checkpointed_grads[kc]))
+        # torch rematerializes, so the forward pass runs again during the backward pass
+        assert module.forward_calls == 1
+        assert checkpointed_module.forward_calls == 2
+    finally:
+        ivy.unset_framework()
+
+
+def test_checkpoint_gradients_match_direct_call():
+    pytest.importorskip('torch')
+    ivy.set_framework('torch')
+    try:
+        rng = np.random.RandomState(0)
+        v = ivy.Container({'w': ivy.variable(ivy.array(rng.uniform(size=(4, 3)), 'float32')),
+                           'b': ivy.variable(ivy.array(rng.uniform(size=(3,)), 'float32'))})
+        x = ivy.array(rng.uniform(size=(5, 4)), 'float32')
+
+        def fn(v_, x_, power=2.):
+            return ivy.reduce_sum(ivy.sin(ivy.matmul(x_, v_.w) + v_.b) ** power)
+
+        cost, grads = ivy.execute_with_gradients(lambda v_: fn(v_, x, power=3.), v)
+        checkpointed_cost, checkpointed_grads = ivy.execute_with_gradients(
+            lambda v_: ivy.checkpoint(fn, v_, x, power=3.), v)
+        assert np.allclose(ivy.to_numpy(cost), ivy.to_numpy(checkpointed_cost))
+        for kc, grad in grads.to_iterator():
+            assert np.allclose(ivy.to_numpy(grad), ivy.to_numpy(checkpointed_grads[kc]))
+    finally:
+        ivy.unset_framework()
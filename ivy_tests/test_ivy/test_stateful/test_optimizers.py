@@ -0,0 +1,178 @@
+"""
+Collection of tests for Ivy optimizers
+"""
+
+# global
+import pytest
+import numpy as np
+
+# local
+import ivy
+
+
+def test_sgd_gradient_accumulation_leaves_passed_grads_unchanged():
+    pytest.importorskip('torch')
+    ivy.set_framework('torch')
+    try:
+        v = ivy.Container({'w': ivy.variable(ivy.array([1., 2.], 'float32'))})
+        optimizer = ivy.SGD(lr=0.1, accumulate_steps=2)
+        for step in range(1, 7):
+            grads = ivy.Container({'w': ivy.array([float(step), float(step)], 'float32')})
+            v = optimizer.step(v, grads)
+            # the accumulation buffer must not alias, and so must not write into, the gradients passed in
+            assert np.array_equal(ivy.to_numpy(grads.w), [step, step])
+    finally:
+        ivy.unset_framework()
+
+
+def _fused_optimizer_variables(seed):
+    rng = np.random.RandomState(seed)
+    return ivy.Container({'layer0': {'w': ivy.variable(ivy.array(rng.uniform(size=(4, 3)), 'float32')),
+                                     'b': ivy.variable(ivy.array(rng.uniform(size=(3,)), 'float32'))},
+                          'layer1': {'w': ivy.variable(ivy.array(rng.uniform(size=(3, 2)), 'float32'))}})
+
+
+@pytest.mark.parametrize('framework', ['numpy', 'torch'])
+@pytest.mark.parametrize('optimizer_class, kwargs', [(ivy.Adam, {}), (ivy.LAMB, {'decay_lambda': 0.1}),
+                                                     (ivy.LARS, {'decay_lambda': 0.1})])
+def test_fused_optimizers_match_unfused(framework, optimizer_class, kwargs):
+    pytest.importorskip(framework)
+    ivy.set_framework(framework)
+    try:
+        v, v_fused = _fused_optimizer_variables(0), _fused_optimizer_variables(0)
+        optimizer = optimizer_class(lr=0.01, **kwargs)
+        fused_optimizer = optimizer_class(lr=0.01, fused=True, **kwargs)
+        for step in range(1, 5):
+            grads = _fused_optimizer_variables(step).map(lambda x, kc: ivy.stop_gradient(x - 0.5))
+            v = optimizer.step(v, grads)
+            v_fused = fused_optimizer.step(v_fused, grads)
+            for (kc, x), (kc_fused, x_fused) in zip(v.to_iterator(), v_fused.to_iterator()):
+                assert kc == kc_fused
+                assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(x_fused), atol=1e-6)
+    finally:
+        ivy.unset_framework()
+
+
+def test_fused_adam_packs_grads_into_persistent_buffers():
+    ivy.set_framework('numpy')
+    try:
+        v = _fused_optimizer_variables(0)
+        optimizer = ivy.Adam(lr=0.01, fused=True)
+        grads = _fused_optimizer_variables(1)
+        v = optimizer.step(v, grads)
+        # noinspection PyProtectedMember
+        buffers = dict(optimizer._packed_grads._buffers)
+        grads = _fused_optimizer_variables(2)
+        optimizer.step(v, grads)
+        # noinspection PyProtectedMember
+        packed = optimizer._packed_grads
+        # noinspection PyProtectedMember
+        assert all([packed._buffers[group] is buf for group, buf in buffers.items()])
+        assert np.array_equal(ivy.to_numpy(packed.at_key_chain('layer1/w')), ivy.to_numpy(grads.layer1.w))
+        # the passed gradients are copied into the buffers, not aliased by them
+        assert np.array_equal(ivy.to_numpy(grads.layer0.b), ivy.to_numpy(_fused_optimizer_variables(2).layer0.b))
+    finally:
+        ivy.unset_framework()
+
+
+def test_optimizer_keeps_step_count_and_lr_schedule_on_host():
+    pytest.importorskip('torch')
+    ivy.set_framework('torch')
+    try:
+        v = ivy.Container({'w': ivy.variable(ivy.array([1., 2.], 'float32'))})
+        grads = ivy.Container({'w': ivy.array([1., 1.], 'float32')})
+        schedule = ivy.StepDecayLR(0.1, step_size=2, gamma=0.5)
+        optimizer = ivy.SGD(lr=schedule)
+        expected = np.array([1., 2.])
+        for step in range(1, 6):
+            v = optimizer.step(v, grads)
+            expected -= schedule(step)
+            # the step count and learning rate stay python scalars, so no device arrays are created or read back
+            assert isinstance(optimizer._get_step(), int) and optimizer._get_step() == step
+            assert isinstance(optimizer._get_lr(), float) and optimizer._get_lr() == schedule(step)
+            assert optimizer._count is None and optimizer._lr_array is None
+            assert np.allclose(ivy.to_numpy(v.w), expected)
+    finally:
+        ivy.unset_framework()
+
+
+def test_optimizer_device_scalars_match_host_scalars():
+    pytest.importorskip('torch')
+    ivy.set_framework('torch')
+    try:
+        v, v_device = _fused_optimizer_variables(0), _fused_optimizer_variables(0)
+        optimizer = ivy.Adam(lr=ivy.WarmupLR(0.01, warmup_steps=3))
+        device_optimizer = ivy.Adam(lr=ivy.WarmupLR(0.01, warmup_steps=3))
+        # as done when compiling a graph, which would otherwise capture the step count and learning rate as constants
+        device_optimizer._use_device_scalars()
+        lr_array = device_optimizer._lr_array
+        for step in range(1, 6):
+            grads = _fused_optimizer_variables(step).map(lambda x, kc: ivy.stop_gradient(x - 0.5))
+            v = optimizer.step(v, grads)
+            v_device = device_optimizer.step(v_device, grads)
+            assert ivy.to_scalar(device_optimizer._get_step()) == step
+            assert np.allclose(ivy.to_numpy(device_optimizer._get_lr()), optimizer._get_lr())
+            # the learning rate array is updated in place, so compiled graphs holding it see the new value
+            assert device_optimizer._get_lr() is lr_array
+            for (_, x), (_, x_device) in zip(v.to_iterator(), v_device.to_iterator()):
+                assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(x_device), atol=1e-6)
+    finally:
+        ivy.unset_framework()
+
+
+def test_adam_step_with_python_step_matches_array_step():
+    ivy.set_framework('numpy')
+    try:
+        dcdws = _fused_optimizer_variables(0)
+        mw, vw = _fused_optimizer_variables(1), _fused_optimizer_variables(2).map(lambda x, kc: x ** 2)
+        for step in [1, 2, 10]:
+            host = ivy.adam_step(dcdws, mw, vw, step)
+            device = ivy.adam_step(dcdws, mw, vw, ivy.array([step]))
+            for host_c, device_c in zip(host, device):
+                for (_, x), (_, y) in zip(host_c.to_iterator(), device_c.to_iterator()):
+                    assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(y))
+    finally:
+        ivy.unset_framework()
+
+
+@pytest.mark.parametrize('framework', ['numpy', 'torch'])
+def test_gradient_accumulation_recovers_from_inf_gradients(framework):
+    pytest.importorskip(framework)
+    ivy.set_framework(framework)
+    try:
+        optimizer = ivy.SGD(lr=0.1, accumulate_steps=2)
+        inf_grads = ivy.Container({'w': ivy.array([np.inf, 1.], 'float32')})
+        assert optimizer._accumulate(inf_grads) is None
+        assert np.isinf(ivy.to_numpy(optimizer._accumulate(inf_grads).w)[0])
+        for window in range(1, 4):
+            grads = ivy.Container({'w': ivy.array([float(window), 1.], 'float32')})
+            assert optimizer._accumulate(grads) is None
+            # the buffer is zeroed at the start of each window, so the inf of an earlier window cannot leak as nan
+            assert np.array_equal(ivy.to_numpy(optimizer._accumulate(grads).w), [window, 1.])
+        # after skipping the update of the window with inf gradients, the weights stay finite
+        v = ivy.Container({'w': ivy.variable(ivy.array([1., 2.], 'float32'))})
+        for window in range(1, 4):
+            grads = ivy.Container({'w': ivy.array([float(window), 1.], 'float32')})
+            v = optimizer.step(optimizer.step(v, grads), grads)
+            assert np.isfinite(ivy.to_numpy(v.w)).all()
+    finally:
+        ivy.unset_framework()
+
+
+def test_accumulated_gradients_into_buffer_holding_inf():
+    pytest.importorskip('torch')
+    ivy.set_framework('torch')
+    try:
+        v = ivy.Container({'w': ivy.variable(ivy.array([1., 2.], 'float32'))})
+        batch = ivy.array(np.random.uniform(size=(8, 2)), 'float32')
+
+        def cost_fn(v_, batch_chunk):
+            return ivy.reduce_mean(ivy.reduce_sum(batch_chunk * v_.w, -1))
+
+        _, expected = ivy.accumulated_gradients(cost_fn, v, batch, chunk_size=2)
+        out = ivy.Container({'w': ivy.array([np.inf, -np.inf], 'float32')})
+        _, grads = ivy.accumulated_gradients(cost_fn, v, batch, chunk_size=2, out=out)
+        assert np.isfinite(ivy.to_numpy(grads.w)).all()
+        assert np.allclose(ivy.to_numpy(grads.w), ivy.to_numpy(expected.w))
+    finally:
+        ivy.unset_framework()
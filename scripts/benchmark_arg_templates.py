@@ -0,0 +1,100 @@
+"""
+Microbenchmark of the per-op argument filling in compiled graphs, reported under the 2_0_arg_n_kwarg_copying and
+2_1_arg_n_kwarg_writing time_inference keys. The nest copying plus set_nest_at_indices which used to run for every op
+is compared against the argument templates, for a few representative argument nests.
+
+Usage: python scripts/benchmark_arg_templates.py --framework numpy --reps 10000
+"""
+
+# global
+import time
+import argparse
+import numpy as np
+
+# local
+import ivy
+# noinspection PyProtectedMember
+from ivy.graph_compiler.helpers import _nest_builder, _nest_writer
+
+
+def _arg_nests():
+    x = ivy.array(np.random.uniform(size=(4,)), 'float32')
+    return {'binary': ([x, x], {}),
+            'kwargs': ([x], {'axis': -1, 'keepdims': True, 'out': None}),
+            'nested': ([[x, x, x, x], 0], {}),
+            'mixed': ([[x, [x, 1.]], 'same'], {'dtype': 'float32'})}
+
+
+def _time(fn, reps):
+    fn()
+    start = time.perf_counter()
+    for _ in range(reps):
+        fn()
+    return (time.perf_counter() - start) / reps
+
+
+def _nest_copying(args, kwargs, reps):
+    arg_idxs = ivy.nested_indices_where(args, ivy.is_array)
+    kwarg_idxs = ivy.nested_indices_where(kwargs, ivy.is_array)
+    arg_vals = ivy.multi_index_nest(args, arg_idxs)
+    kwarg_vals = ivy.multi_index_nest(kwargs, kwarg_idxs)
+
+    def copy():
+        return ivy.copy_nest(args), ivy.copy_nest(kwargs)
+
+    copies = copy()
+
+    def write():
+        ivy.set_nest_at_indices(copies[0], arg_idxs, arg_vals)
+        ivy.set_nest_at_indices(copies[1], kwarg_idxs, kwarg_vals)
+
+    return _time(copy, reps), _time(write, reps)
+
+
+def _templates(args, kwargs, reps):
+    arg_idxs = ivy.nested_indices_where(args, ivy.is_array)
+    kwarg_idxs = ivy.nested_indices_where(kwargs, ivy.is_array)
+    arg_vals = ivy.multi_index_nest(args, arg_idxs)
+    kwarg_vals = ivy.multi_index_nest(kwargs, kwarg_idxs)
+    arg_copier = _nest_builder(args, arg_idxs, to_mutable=True)
+    kwarg_copier = _nest_builder(kwargs, kwarg_idxs, to_mutable=True)
+    arg_writer, kwarg_writer = _nest_writer(args, arg_idxs), _nest_writer(kwargs, kwarg_idxs)
+    arg_template, kwarg_template = _nest_builder(args, arg_idxs), _nest_builder(kwargs, kwarg_idxs)
+    arg_placeholders, kwarg_placeholders = [None] * len(arg_idxs), [None] * len(kwarg_idxs)
+
+    def copy():
+        return arg_copier(arg_placeholders), kwarg_copier(kwarg_placeholders)
+
+    copies = copy()
+
+    def write():
+        arg_writer(copies[0], arg_vals)
+        kwarg_writer(copies[1], kwarg_vals)
+
+    def fused():
+        arg_template(arg_vals)
+        kwarg_template(kwarg_vals)
+
+    return _time(copy, reps), _time(write, reps), _time(fused, reps)
+
+
+def main(framework, reps):
+    ivy.set_framework(framework)
+    print('{:<8}{:>22}{:>22}{:>22}{:>22}{:>20}'.format(
+        'nest', 'before 2_0 copy (us)', 'before 2_1 write (us)', 'after 2_0 copy (us)', 'after 2_1 write (us)',
+        'after untimed (us)'))
+    for name, (args, kwargs) in _arg_nests().items():
+        before = _nest_copying(args, kwargs, reps)
+        after = _templates(args, kwargs, reps)
+        print('{:<8}{:>22.2f}{:>22.2f}{:>22.2f}{:>22.2f}{:>20.2f}'.format(
+            name, *[t * 1e6 for t in before + after]))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='numpy',
+                        help='the backend framework, one of numpy, jax, tensorflow, torch or mxnet.')
+    parser.add_argument('--reps', type=int, default=10000, help='the number of timed repetitions.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.reps)
@@ -0,0 +1,86 @@
+"""
+Measurement of the activation memory saved by checkpointing modules with the torch backend, for a sequence of
+blocks with and without checkpoint=True on each block. The memory held for the backward pass is measured as the
+bytes of the distinct tensors saved by autograd during the forward pass, which works on any device, and the peak
+allocated memory of the forward and backward pass is also reported on cuda devices. The time of each forward and
+backward pass shows the cost of the recomputation.
+
+Only the jax and torch backends rematerialize, for numpy, tensorflow and mxnet the forward pass is unchanged by
+checkpointing, and so they are not measured.
+
+Usage: python scripts/benchmark_checkpoint_memory.py --dev cuda:0 --depths 4 16 64 --width 1024 --batch_size 256
+"""
+
+# global
+import time
+import torch
+import argparse
+import numpy as np
+
+# local
+import ivy
+
+
+class _Block(ivy.Module):
+
+    def __init__(self, width, dev, checkpoint):
+        self._width = width
+        ivy.Module.__init__(self, dev, checkpoint=checkpoint)
+
+    def _create_variables(self, dev):
+        return {'w{}'.format(i): ivy.variable(ivy.array(
+            np.random.uniform(-1, 1, size=(self._width, self._width)) / self._width ** 0.5, 'float32', dev))
+            for i in range(2)}
+
+    def _forward(self, x):
+        return x + ivy.matmul(ivy.tanh(ivy.matmul(x, self.v.w0)), self.v.w1)
+
+
+def _saved_bytes(fn):
+    saved = dict()
+
+    def pack(t):
+        saved[(t.data_ptr(), t.dtype, tuple(t.shape))] = t.numel() * t.element_size()
+        return t
+
+    with torch.autograd.graph.saved_tensors_hooks(pack, lambda t: t):
+        ret = fn()
+    return ret, sum(saved.values())
+
+
+def _measure(model, x, dev):
+    if 'cuda' in dev:
+        torch.cuda.synchronize()
+        torch.cuda.reset_peak_memory_stats()
+    start = time.perf_counter()
+    (_, grads), saved = _saved_bytes(
+        lambda: ivy.execute_with_gradients(lambda v: ivy.reduce_mean(model(x, v=v)), model.v))
+    ivy.to_numpy(grads.to_flat_list()[0])
+    duration = time.perf_counter() - start
+    peak = torch.cuda.max_memory_allocated() if 'cuda' in dev else None
+    return saved, peak, duration
+
+
+def main(dev, depths, width, batch_size):
+    ivy.set_framework('torch')
+    x = ivy.array(np.random.uniform(size=(batch_size, width)), 'float32', dev)
+    print('{:<8}{:<14}{:>16}{:>16}{:>14}'.format('depth', 'checkpoint', 'saved (MB)', 'peak (MB)', 'time (ms)'))
+    for depth in depths:
+        for checkpoint in [False, True]:
+            model = ivy.Sequential(*[_Block(width, dev, checkpoint) for _ in range(depth)], dev=dev)
+            _measure(model, x, dev)
+            saved, peak, duration = _measure(model, x, dev)
+            print('{:<8}{:<14}{:>16.1f}{:>16}{:>14.1f}'.format(
+                depth, str(checkpoint), saved / 1e6, 'n/a' if peak is None else '{:.1f}'.format(peak / 1e6),
+                duration * 1e3))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dev', type=str, default='cpu', help='the device on which to run the model.')
+    parser.add_argument('--depths', type=int, nargs='+', default=[4, 16, 64], help='the numbers of blocks.')
+    parser.add_argument('--width', type=int, default=1024, help='the feature width of each block.')
+    parser.add_argument('--batch_size', type=int, default=256, help='the batch size of the input.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.dev, parsed_args.depths, parsed_args.width, parsed_args.batch_size)
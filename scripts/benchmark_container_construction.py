@@ -0,0 +1,69 @@
+"""
+Microbenchmark of the container methods which build a new container from the entries of an existing one, namely map,
+slicing and addition, on a wide container with many leaves at the top level, and a deep container with few leaves per
+level. The trusted construction of the results is compared against passing them through the full constructor.
+
+Usage: python scripts/benchmark_container_construction.py --framework numpy --width 1000 --depth 50 --reps 200
+"""
+
+# global
+import time
+import argparse
+import numpy as np
+
+# local
+import ivy
+
+
+def _wide(width):
+    return ivy.Container({'leaf_{}'.format(i): ivy.array(np.random.uniform(size=(8, 4)), 'float32')
+                          for i in range(width)})
+
+
+def _deep(depth):
+    dict_in = {'x': ivy.array(np.random.uniform(size=(8, 4)), 'float32')}
+    for i in range(depth):
+        dict_in = {'child': dict_in, 'leaf_{}'.format(i): ivy.array(np.random.uniform(size=(8, 4)), 'float32')}
+    return ivy.Container(dict_in)
+
+
+def _time(fn, reps):
+    fn()
+    start = time.perf_counter()
+    for _ in range(reps):
+        fn()
+    return (time.perf_counter() - start) / reps
+
+
+def _time_ops(cont, reps):
+    return [_time(lambda: cont.map(lambda x, kc: x), reps),
+            _time(lambda: cont[2:6], reps),
+            _time(lambda: cont + cont, reps)]
+
+
+def main(framework, width, depth, reps):
+    ivy.set_framework(framework)
+    # noinspection PyProtectedMember
+    from_trusted = ivy.Container._from_trusted
+    print('{:<10}{:<10}{:>20}{:>18}{:>10}'.format('container', 'op', 'constructor (us)', 'trusted (us)', 'speedup'))
+    for name, cont in [('wide', _wide(width)), ('deep', _deep(depth))]:
+        ivy.Container._from_trusted = staticmethod(lambda dict_in, config: ivy.Container(dict_in, **config))
+        try:
+            constructed = _time_ops(cont, reps)
+        finally:
+            ivy.Container._from_trusted = from_trusted
+        trusted = _time_ops(cont, reps)
+        for op, c, t in zip(['map', 'slice', 'add'], constructed, trusted):
+            print('{:<10}{:<10}{:>20.1f}{:>18.1f}{:>10.2f}'.format(name, op, c * 1e6, t * 1e6, c / t))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='numpy',
+                        help='the backend framework, one of numpy, jax, tensorflow, torch or mxnet.')
+    parser.add_argument('--width', type=int, default=1000, help='the number of leaves of the wide container.')
+    parser.add_argument('--depth', type=int, default=50, help='the number of levels of the deep container.')
+    parser.add_argument('--reps', type=int, default=200, help='the number of timed repetitions.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.width, parsed_args.depth, parsed_args.reps)
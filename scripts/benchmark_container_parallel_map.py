@@ -0,0 +1,54 @@
+"""
+Benchmark of ivy.Container.map applied sequentially and with num_workers threads, for a container of large leaves
+where the mapped function releases the GIL, and a container of small leaves which fall below min_parallel_size and
+are mapped inline.
+
+Usage: python scripts/benchmark_container_parallel_map.py --framework numpy --num_leaves 32 --leaf_size 1000000
+"""
+
+# global
+import time
+import argparse
+import numpy as np
+
+# local
+import ivy
+
+
+def _container(num_leaves, leaf_size):
+    return ivy.Container({'leaf_{}'.format(i): ivy.array(np.random.uniform(size=(leaf_size,)), 'float32')
+                          for i in range(num_leaves)})
+
+
+def _time(fn, reps):
+    fn()
+    start = time.perf_counter()
+    for _ in range(reps):
+        fn()
+    return (time.perf_counter() - start) / reps
+
+
+def main(framework, num_leaves, leaf_size, workers, reps):
+    ivy.set_framework(framework)
+    func = lambda x, kc: ivy.tanh(ivy.exp(-x) * x)
+    print('{:<8}{:>14}{:>18}{:>10}'.format('leaves', 'num_workers', 'per map (ms)', 'speedup'))
+    for name, cont in [('large', _container(num_leaves, leaf_size)), ('small', _container(num_leaves * 32, 16))]:
+        sequential = _time(lambda: cont.map(func), reps)
+        print('{:<8}{:>14}{:>18.2f}{:>10.2f}'.format(name, 'None', sequential * 1e3, 1.))
+        for num_workers in workers:
+            t = _time(lambda: cont.map(func, num_workers=num_workers), reps)
+            print('{:<8}{:>14}{:>18.2f}{:>10.2f}'.format(name, num_workers, t * 1e3, sequential / t))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='numpy',
+                        help='the backend framework, one of numpy, jax, tensorflow, torch or mxnet.')
+    parser.add_argument('--num_leaves', type=int, default=32, help='the number of large leaves.')
+    parser.add_argument('--leaf_size', type=int, default=1000000, help='the number of elements of each large leaf.')
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4, 8],
+                        help='the num_workers values to compare against sequential mapping.')
+    parser.add_argument('--reps', type=int, default=10, help='the number of timed repetitions.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.num_leaves, parsed_args.leaf_size, parsed_args.workers, parsed_args.reps)
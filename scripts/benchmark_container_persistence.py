@@ -0,0 +1,73 @@
+"""
+Benchmark of saving and loading a container of large arrays with the memory-mapped format, against the hdf5 and pickle
+formats. Loading is timed both for the full container, and for a slice of 32 rows, which with memory-mapping only
+reads the bytes of the slice.
+
+Usage: python scripts/benchmark_container_persistence.py --framework numpy --num_arrays 20 --rows 4096 --cols 1024
+"""
+
+# global
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+
+# local
+import ivy
+
+
+def _time(fn, reps):
+    fn()
+    start = time.perf_counter()
+    for _ in range(reps):
+        fn()
+    return (time.perf_counter() - start) / reps
+
+
+def _touch(cont):
+    # access every leaf, so lazily loaded arrays are actually read
+    return [float(ivy.to_numpy(x).sum()) for _, x in cont.to_iterator()]
+
+
+def main(framework, num_arrays, rows, cols, reps):
+    ivy.set_framework(framework)
+    cont = ivy.Container({'w{}'.format(i): ivy.array(np.random.uniform(size=(rows, cols)), 'float32')
+                          for i in range(num_arrays)})
+    slc = slice(0, 32)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        memmap_path = os.path.join(tmp_dir, 'memmap')
+        h5_path = os.path.join(tmp_dir, 'cont.hdf5')
+        pickle_path = os.path.join(tmp_dir, 'cont.pickle')
+        formats = {
+            'memmap': (lambda: cont.to_disk_as_memmap(memmap_path),
+                       lambda: _touch(ivy.Container.from_disk_as_memmap(memmap_path)),
+                       lambda: _touch(ivy.Container.from_disk_as_memmap(memmap_path, slice_obj=slc))),
+            'hdf5': (lambda: cont.to_disk_as_hdf5(h5_path, mode='w'),
+                     lambda: _touch(ivy.Container.from_disk_as_hdf5(h5_path)),
+                     lambda: _touch(ivy.Container.from_disk_as_hdf5(h5_path, slice_obj=slc))),
+            'pickle': (lambda: cont.to_disk_as_pickled(pickle_path),
+                       lambda: _touch(ivy.Container.from_disk_as_pickled(pickle_path)),
+                       lambda: _touch(ivy.Container.from_disk_as_pickled(pickle_path)[slc]))}
+        print('{:<10}{:>14}{:>14}{:>20}'.format('format', 'save (ms)', 'load (ms)', 'load 32 rows (ms)'))
+        for name, (save_fn, load_fn, load_slice_fn) in formats.items():
+            try:
+                save_time = _time(save_fn, reps)
+            except Exception as e:
+                print('{:<10}skipped, {}'.format(name, e))
+                continue
+            print('{:<10}{:>14.1f}{:>14.1f}{:>20.1f}'.format(
+                name, save_time * 1e3, _time(load_fn, reps) * 1e3, _time(load_slice_fn, reps) * 1e3))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='numpy',
+                        help='the backend framework, one of numpy, jax, tensorflow, torch or mxnet.')
+    parser.add_argument('--num_arrays', type=int, default=20, help='the number of arrays in the container.')
+    parser.add_argument('--rows', type=int, default=4096, help='the number of rows of each array.')
+    parser.add_argument('--cols', type=int, default=1024, help='the number of columns of each array.')
+    parser.add_argument('--reps', type=int, default=3, help='the number of timed repetitions.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.num_arrays, parsed_args.rows, parsed_args.cols, parsed_args.reps)
@@ -0,0 +1,76 @@
+"""
+Benchmark of the per-call dispatch overhead of the ivy function wrapper for each backend, measured as the time of a
+wrapped call minus the time of calling the backend function directly with native arguments. The specialised wrapper
+with the flat argument fast path is compared against the previous wrapper, which always traversed the arguments and
+the return via nested_map.
+
+Usage: python scripts/benchmark_dispatch_overhead.py --frameworks numpy torch --reps 100000
+"""
+
+# global
+import time
+import argparse
+import numpy as np
+
+# local
+import ivy
+from ivy.func_wrapper import ARRAYLESS_RET_METHODS, NESTED_ARRAY_RET_METHODS
+
+
+def _reference_wrapper(fn):
+    # the wrapper prior to the flat argument fast path
+    def _method_wrapped(*args, **kwargs):
+        native_args, native_kwargs = ivy.args_to_native(*args, **kwargs)
+        native_ret = fn(*native_args, **native_kwargs)
+        if fn.__name__ in ARRAYLESS_RET_METHODS + NESTED_ARRAY_RET_METHODS:
+            return native_ret
+        return ivy.to_ivy(native_ret, nested=True)
+    return _method_wrapped
+
+
+def _calls():
+    x = ivy.array(np.random.uniform(size=(4,)), 'float32')
+    y = ivy.array(np.random.uniform(size=(4,)), 'float32')
+    return {'add': ('add', (x, y), {}),
+            'reduce_sum': ('reduce_sum', (x,), {'axis': 0}),
+            'clip': ('clip', (x, 0.2, 0.8), {}),
+            'shape': ('shape', (x,), {}),
+            'concatenate': ('concatenate', ([x, y],), {'axis': 0})}
+
+
+def _time(fn, args, kwargs, reps):
+    fn(*args, **kwargs)
+    start = time.perf_counter()
+    for _ in range(reps):
+        fn(*args, **kwargs)
+    return (time.perf_counter() - start) / reps
+
+
+def main(frameworks, reps):
+    print('{:<12}{:<14}{:>14}{:>22}{:>22}{:>10}'.format(
+        'framework', 'function', 'direct (us)', 'previous overhead (us)', 'fast path overhead (us)', 'speedup'))
+    for framework in frameworks:
+        try:
+            ivy.set_framework(framework)
+        except ImportError:
+            print('{:<12}not installed, skipping'.format(framework))
+            continue
+        for name, (fn_name, args, kwargs) in _calls().items():
+            wrapped_fn = getattr(ivy, fn_name)
+            inner_fn = getattr(wrapped_fn, 'inner_fn', wrapped_fn)
+            native_args, native_kwargs = ivy.args_to_native(*args, **kwargs)
+            direct = _time(inner_fn, native_args, native_kwargs, reps)
+            previous = _time(_reference_wrapper(inner_fn), args, kwargs, reps) - direct
+            fast = _time(wrapped_fn, args, kwargs, reps) - direct
+            print('{:<12}{:<14}{:>14.2f}{:>22.2f}{:>22.2f}{:>10.2f}'.format(
+                framework, name, direct * 1e6, previous * 1e6, fast * 1e6, previous / max(fast, 1e-9)))
+        ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--frameworks', type=str, nargs='+', default=['numpy', 'jax', 'tensorflow', 'torch', 'mxnet'],
+                        help='the backend frameworks to benchmark, any which are not installed are skipped.')
+    parser.add_argument('--reps', type=int, default=100000, help='the number of timed calls per function.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.frameworks, parsed_args.reps)
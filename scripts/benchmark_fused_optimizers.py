@@ -0,0 +1,103 @@
+"""
+Benchmark of the fused multi-tensor optimizer updates against the per-array updates, for containers of 10, 100 and
+1000 variables, together with the cost of packing the gradients into new buffers on every step against packing them
+into the persistent buffers of the previous step, as the fused optimizers do.
+
+Usage: python scripts/benchmark_fused_optimizers.py --framework torch --size 1024 --steps 50
+"""
+
+# global
+import time
+import argparse
+import numpy as np
+
+# local
+import ivy
+
+
+def _random_container(num_arrays, size, variables=False):
+    fn = ivy.variable if variables else lambda x: x
+    return ivy.Container({'w{}'.format(i): fn(ivy.array(np.random.uniform(size=(size,)), 'float32'))
+                          for i in range(num_arrays)})
+
+
+def _time_steps(update_fn, ws, dcdws, steps):
+    # one untimed step, so any lazy initialization does not count towards the timing
+    update_fn(ws, dcdws, 1)
+    start = time.perf_counter()
+    for step in range(2, steps + 2):
+        update_fn(ws, dcdws, step)
+    return (time.perf_counter() - start) / steps
+
+
+def _updates():
+    lr = 1e-3
+
+    def adam(fused):
+        state = dict()
+
+        def update(ws, dcdws, step):
+            if 'mw' not in state:
+                state['mw'], state['vw'] = dcdws.as_zeros(), dcdws.as_zeros()
+            fn = ivy.fused_adam_update if fused else ivy.adam_update
+            _, state['mw'], state['vw'] = fn(ws, dcdws, lr, state['mw'], state['vw'], step)
+        return update
+
+    def lamb(fused):
+        state = dict()
+
+        def update(ws, dcdws, step):
+            if 'mw' not in state:
+                state['mw'], state['vw'] = dcdws.as_zeros(), dcdws.as_zeros()
+            fn = ivy.fused_lamb_update if fused else ivy.lamb_update
+            _, state['mw'], state['vw'] = fn(ws, dcdws, lr, state['mw'], state['vw'], step)
+        return update
+
+    def lars(fused):
+        fn = ivy.fused_lars_update if fused else ivy.lars_update
+        return lambda ws, dcdws, step: fn(ws, dcdws, lr)
+
+    return {'adam': adam, 'lamb': lamb, 'lars': lars}
+
+
+def _time_packing(dcdws, steps):
+    packed = dcdws.pack()
+    times = list()
+    for fn in [dcdws.pack, lambda: packed.pack_into(dcdws, check_layout=False)]:
+        fn()
+        start = time.perf_counter()
+        for _ in range(steps):
+            fn()
+        times.append((time.perf_counter() - start) / steps)
+    return times
+
+
+def main(framework, size, steps, counts):
+    ivy.set_framework(framework)
+    variables = framework != 'numpy'
+    print('{:<6}{:>8}{:>16}{:>16}{:>10}'.format('update', 'arrays', 'per-array (ms)', 'fused (ms)', 'speedup'))
+    for name, make_update in _updates().items():
+        for num_arrays in counts:
+            dcdws = _random_container(num_arrays, size)
+            times = [_time_steps(make_update(fused), _random_container(num_arrays, size, variables), dcdws, steps)
+                     for fused in [False, True]]
+            print('{:<6}{:>8}{:>16.3f}{:>16.3f}{:>10.2f}'.format(
+                name, num_arrays, times[0] * 1e3, times[1] * 1e3, times[0] / times[1]))
+    print('\n{:<6}{:>8}{:>16}{:>16}{:>10}'.format('grads', 'arrays', 'pack (ms)', 'pack_into (ms)', 'speedup'))
+    for num_arrays in counts:
+        times = _time_packing(_random_container(num_arrays, size), steps)
+        print('{:<6}{:>8}{:>16.3f}{:>16.3f}{:>10.2f}'.format(
+            'pack', num_arrays, times[0] * 1e3, times[1] * 1e3, times[0] / times[1]))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='torch',
+                        help='the backend framework, one of numpy, jax, tensorflow, torch or mxnet.')
+    parser.add_argument('--size', type=int, default=1024, help='the number of elements in each array.')
+    parser.add_argument('--steps', type=int, default=50, help='the number of timed update steps.')
+    parser.add_argument('--counts', type=int, nargs='+', default=[10, 100, 1000],
+                        help='the numbers of arrays in the container.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.size, parsed_args.steps, parsed_args.counts)
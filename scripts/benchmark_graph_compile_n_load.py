@@ -0,0 +1,70 @@
+"""
+Benchmark of the latency to obtain a compiled graph, for graphs of 10, 100 and 1000 operations. Compilation with the
+wrap and unwrap cycle on every compile is compared against compilation with the persistent tracing layer installed,
+and against loading the graph from disk via ivy.load_compiled_graph, with and without memory-mapped constants.
+
+Usage: python scripts/benchmark_graph_compile_n_load.py --framework numpy --reps 5
+"""
+
+# global
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+
+# local
+import ivy
+
+
+def _chain(num_ops):
+    def fn(x, w):
+        for _ in range(num_ops // 2):
+            x = ivy.tanh(x * w)
+        return x
+    return fn
+
+
+def _time(fn, reps):
+    start = time.perf_counter()
+    for _ in range(reps):
+        fn()
+    return (time.perf_counter() - start) / reps
+
+
+def main(framework, reps, counts):
+    ivy.set_framework(framework)
+    x = ivy.array(np.random.uniform(size=(16,)), 'float32')
+    w = ivy.array(np.random.uniform(size=(16,)), 'float32')
+    print('{:>6}{:>20}{:>20}{:>16}{:>16}{:>20}'.format(
+        'ops', 'wrap/unwrap (ms)', 'installed (ms)', 'load (ms)', 'load mmap (ms)', 'first call (ms)'))
+    for num_ops in counts:
+        fn = _chain(num_ops)
+        ivy.uninstall_tracing()
+        wrap_time = _time(lambda: ivy.compile_graph(fn, x, w), reps)
+        ivy.install_tracing()
+        installed_time = _time(lambda: ivy.compile_graph(fn, x, w), reps)
+        ivy.uninstall_tracing()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'graph')
+            _, graph = ivy.compile_graph(fn, x, w, return_graph=True)
+            graph.save(path)
+            load_time = _time(lambda: ivy.load_compiled_graph(path, mmap=False), reps)
+            load_mmap_time = _time(lambda: ivy.load_compiled_graph(path), reps)
+            loaded_fn = ivy.load_compiled_graph(path)
+            first_call_time = _time(lambda: loaded_fn(x, w), 1)
+        print('{:>6}{:>20.2f}{:>20.2f}{:>16.2f}{:>16.2f}{:>20.2f}'.format(
+            num_ops, wrap_time * 1e3, installed_time * 1e3, load_time * 1e3, load_mmap_time * 1e3,
+            first_call_time * 1e3))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='numpy',
+                        help='the backend framework, one of numpy, jax, tensorflow, torch or mxnet.')
+    parser.add_argument('--reps', type=int, default=5, help='the number of timed repetitions.')
+    parser.add_argument('--counts', type=int, nargs='+', default=[10, 100, 1000],
+                        help='the numbers of operations in the graph.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.reps, parsed_args.counts)
@@ -0,0 +1,71 @@
+"""
+Benchmark of the compiled graph executors, timing one call of a small elementwise graph for each executor, together
+with the time_inference breakdown of the per-call overhead.
+
+Usage: python scripts/benchmark_graph_executors.py --framework numpy --depth 50 --calls 1000
+"""
+
+# global
+import time
+import argparse
+import numpy as np
+
+# local
+import ivy
+from ivy.graph_compiler import globals as glob
+
+
+def _chain(depth):
+    def fn(x, y):
+        for _ in range(depth):
+            x = ivy.tanh(x * y + 1.)
+        return x
+    return fn
+
+
+def _time_calls(comp_fn, x, y, calls):
+    comp_fn(x, y)
+    start = time.perf_counter()
+    for _ in range(calls):
+        comp_fn(x, y)
+    return (time.perf_counter() - start) / calls
+
+
+def _timing_breakdown(fn, x, y, executor, calls):
+    for k in glob.sum_inference_times:
+        glob.sum_inference_times[k] = 0
+    comp_fn = ivy.compile_graph(fn, x, y, executor=executor, time_inference=True, name=executor)
+    [comp_fn(x, y) for _ in range(calls)]
+    glob.time_inference = False
+    count = glob.sum_inference_times['count']
+    return {k: v / count for k, v in glob.sum_inference_times.items() if k != 'count'}
+
+
+def main(framework, depth, size, calls, executors):
+    ivy.set_framework(framework)
+    fn = _chain(depth)
+    x = ivy.array(np.random.uniform(size=(size,)), 'float32')
+    y = ivy.array(np.random.uniform(size=(size,)), 'float32')
+    times = {executor: _time_calls(ivy.compile_graph(fn, x, y, executor=executor), x, y, calls)
+             for executor in executors}
+    print('{:<12}{:>16}{:>10}'.format('executor', 'per call (us)', 'speedup'))
+    for executor, t in times.items():
+        print('{:<12}{:>16.1f}{:>10.2f}'.format(executor, t * 1e6, times[executors[0]] / t))
+    breakdowns = {executor: _timing_breakdown(fn, x, y, executor, calls) for executor in executors}
+    print('\n{:<26}'.format('time_inference key (us)') + ''.join(['{:>12}'.format(e) for e in executors]))
+    for k in breakdowns[executors[0]]:
+        print('{:<26}'.format(k) + ''.join(['{:>12.1f}'.format(breakdowns[e][k] * 1e6) for e in executors]))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='numpy',
+                        help='the backend framework, one of numpy, jax, tensorflow, torch or mxnet.')
+    parser.add_argument('--depth', type=int, default=50, help='the number of repeated blocks in the graph.')
+    parser.add_argument('--size', type=int, default=16, help='the number of elements in each array.')
+    parser.add_argument('--calls', type=int, default=1000, help='the number of timed calls.')
+    parser.add_argument('--executors', type=str, nargs='+', default=['dict', 'slots', 'wavefront'],
+                        help='the executors to compare, the first is the baseline for the speedup.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.depth, parsed_args.size, parsed_args.calls, parsed_args.executors)
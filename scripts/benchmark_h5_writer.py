@@ -0,0 +1,77 @@
+"""
+Benchmark of writing a stream of container batches to an hdf5 file, either with one call to
+ivy.Container.to_disk_as_hdf5 per batch, which reopens the file each time, or with a single ivy.H5Writer, which keeps
+the file open and writes on a background thread while the next batch is produced. The writer is timed both growing
+the datasets with each batch, and with max_batch_size preallocating them. Each configuration of chunking and
+compression is timed for all three.
+
+Usage: python scripts/benchmark_h5_writer.py --framework numpy --num_batches 200 --batch_size 64
+"""
+
+# global
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+
+# local
+import ivy
+
+
+def _batch(batch_size, work_reps):
+    x = ivy.array(np.random.uniform(size=(batch_size, 512)), 'float32')
+    for _ in range(work_reps):
+        x = ivy.tanh(x)
+    return ivy.Container({'x': x, 'y': {'labels': ivy.array(np.random.randint(0, 10, size=(batch_size,)))}})
+
+
+def _time_to_disk(h5_filepath, num_batches, batch_size, work_reps, chunks, compression):
+    start = time.perf_counter()
+    for i in range(num_batches):
+        _batch(batch_size, work_reps).to_disk_as_hdf5(h5_filepath, starting_index=i * batch_size,
+                                                      max_batch_size=num_batches * batch_size, chunks=chunks,
+                                                      compression=compression)
+    return time.perf_counter() - start
+
+
+def _time_writer(h5_filepath, num_batches, batch_size, work_reps, chunks, compression, max_batch_size=None):
+    start = time.perf_counter()
+    with ivy.H5Writer(h5_filepath, mode='w', max_batch_size=max_batch_size, chunks=chunks,
+                      compression=compression) as writer:
+        for _ in range(num_batches):
+            writer.write(_batch(batch_size, work_reps))
+    return time.perf_counter() - start
+
+
+def _time_preallocated_writer(h5_filepath, num_batches, batch_size, work_reps, chunks, compression):
+    return _time_writer(h5_filepath, num_batches, batch_size, work_reps, chunks, compression,
+                        num_batches * batch_size)
+
+
+def main(framework, num_batches, batch_size, work_reps):
+    ivy.set_framework(framework)
+    print('{:<24}{:>22}{:>16}{:>30}'.format('chunks / compression', 'to_disk_as_hdf5 (ms)', 'H5Writer (ms)',
+                                           'H5Writer max_batch_size (ms)'))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for chunks, compression in [(None, None), (batch_size, None), (batch_size, 'lzf'), (batch_size, 'gzip')]:
+            times = list()
+            for i, time_fn in enumerate([_time_to_disk, _time_writer, _time_preallocated_writer]):
+                h5_filepath = os.path.join(tmp_dir, 'data_{}.hdf5'.format(i))
+                if os.path.exists(h5_filepath):
+                    os.remove(h5_filepath)
+                times.append(time_fn(h5_filepath, num_batches, batch_size, work_reps, chunks, compression))
+            print('{:<24}{:>22.1f}{:>16.1f}{:>30.1f}'.format(
+                '{} / {}'.format(chunks, compression), *[t * 1e3 for t in times]))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='numpy',
+                        help='the backend framework, one of numpy, jax, tensorflow, torch or mxnet.')
+    parser.add_argument('--num_batches', type=int, default=200, help='the number of batches to write.')
+    parser.add_argument('--batch_size', type=int, default=64, help='the number of rows in each batch.')
+    parser.add_argument('--work_reps', type=int, default=10, help='the amount of work done to produce each batch.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.num_batches, parsed_args.batch_size, parsed_args.work_reps)
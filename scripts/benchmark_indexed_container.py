@@ -0,0 +1,67 @@
+"""
+Benchmark of the structural queries on ivy.Container against ivy.IndexedContainer, for wide and deep containers.
+The indexed container builds its key-chain index and its shape and device caches on first use, and serves repeated
+queries from them until an entry is set.
+
+Usage: python scripts/benchmark_indexed_container.py --framework numpy --reps 1000
+"""
+
+# global
+import time
+import argparse
+import numpy as np
+
+# local
+import ivy
+
+
+def _wide(num_leaves):
+    return ivy.Container({'w{}'.format(i): ivy.array(np.zeros((8, 4)), 'float32') for i in range(num_leaves)})
+
+
+def _deep(depth):
+    cont_dict = {'leaf': ivy.array(np.zeros((8, 4)), 'float32')}
+    for i in range(depth):
+        cont_dict = {'d{}'.format(i): cont_dict, 'leaf': ivy.array(np.zeros((8, 4)), 'float32')}
+    return ivy.Container(cont_dict)
+
+
+def _time(fn, reps):
+    fn()
+    start = time.perf_counter()
+    for _ in range(reps):
+        fn()
+    return (time.perf_counter() - start) / reps
+
+
+def _queries(cont):
+    deepest_kc = cont.all_key_chains()[-1]
+    return {'shape': lambda: cont.shape,
+            'dev': lambda: cont.dev,
+            'all_key_chains': lambda: cont.all_key_chains(),
+            'at_key_chain': lambda: cont.at_key_chain(deepest_kc),
+            'has_key_chain': lambda: cont.has_key_chain(deepest_kc),
+            'to_iterator': lambda: list(cont.to_iterator())}
+
+
+def main(framework, reps):
+    ivy.set_framework(framework)
+    print('{:<12}{:<16}{:>18}{:>18}{:>10}'.format('container', 'query', 'Container (us)', 'Indexed (us)', 'speedup'))
+    for name, cont in [('wide', _wide(500)), ('deep', _deep(50))]:
+        plain_queries = _queries(cont)
+        indexed_queries = _queries(cont.indexed())
+        for query in plain_queries:
+            plain = _time(plain_queries[query], reps)
+            indexed = _time(indexed_queries[query], reps)
+            print('{:<12}{:<16}{:>18.2f}{:>18.2f}{:>10.2f}'.format(
+                name, query, plain * 1e6, indexed * 1e6, plain / indexed))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='numpy',
+                        help='the backend framework, one of numpy, jax, tensorflow, torch or mxnet.')
+    parser.add_argument('--reps', type=int, default=1000, help='the number of timed repetitions of each query.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.reps)
@@ -0,0 +1,71 @@
+"""
+Benchmark of the throughput of iterating over an hdf5 file batch by batch with ivy.Container.iter_hdf5, against a loop
+which loads each batch with ivy.Container.from_disk_as_hdf5 and a slice object. A fixed amount of work is done with
+each batch, so the overlap of reading the next batches with using the current one is included in the timings.
+
+Usage: python scripts/benchmark_iter_hdf5.py --framework numpy --rows 100000 --batch_size 256
+"""
+
+# global
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+
+# local
+import ivy
+
+
+def _consume(batch, work_reps):
+    for _ in range(work_reps):
+        [ivy.reduce_sum(ivy.tanh(x)) for _, x in batch.to_iterator()]
+
+
+def _time_epoch(batches, work_reps):
+    start = time.perf_counter()
+    num_rows = 0
+    for batch in batches:
+        _consume(batch, work_reps)
+        num_rows += batch.x.shape[0]
+    return num_rows / (time.perf_counter() - start)
+
+
+def _sliced_loads(h5_filepath, num_rows, batch_size):
+    for start in range(0, num_rows, batch_size):
+        yield ivy.Container.from_disk_as_hdf5(h5_filepath, slice_obj=slice(start, min(start + batch_size, num_rows)))
+
+
+def main(framework, rows, cols, batch_size, work_reps, num_workers):
+    ivy.set_framework(framework)
+    cont = ivy.Container({'x': np.random.uniform(size=(rows, cols)).astype(np.float32),
+                          'y': {'labels': np.random.randint(0, 10, size=(rows,)),
+                                'weights': np.random.uniform(size=(rows, 8)).astype(np.float32)}})
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        h5_filepath = os.path.join(tmp_dir, 'data.hdf5')
+        cont.to_disk_as_hdf5(h5_filepath, mode='w')
+        # one untimed pass, so both loops start from the same page cache state
+        _time_epoch(_sliced_loads(h5_filepath, rows, batch_size), 0)
+        loops = {'from_disk_as_hdf5': lambda: _sliced_loads(h5_filepath, rows, batch_size),
+                 'iter_hdf5': lambda: ivy.Container.iter_hdf5(h5_filepath, batch_size, num_workers=num_workers),
+                 'iter_hdf5 shuffle': lambda: ivy.Container.iter_hdf5(
+                     h5_filepath, batch_size, shuffle=True, num_workers=num_workers)}
+        throughputs = {name: _time_epoch(loop(), work_reps) for name, loop in loops.items()}
+    print('{:<20}{:>16}{:>10}'.format('loop', 'rows per sec', 'speedup'))
+    for name, t in throughputs.items():
+        print('{:<20}{:>16.0f}{:>10.2f}'.format(name, t, t / throughputs['from_disk_as_hdf5']))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='numpy',
+                        help='the backend framework, one of numpy, jax, tensorflow, torch or mxnet.')
+    parser.add_argument('--rows', type=int, default=100000, help='the number of rows in the file.')
+    parser.add_argument('--cols', type=int, default=128, help='the number of columns of the main dataset.')
+    parser.add_argument('--batch_size', type=int, default=256, help='the number of rows in each batch.')
+    parser.add_argument('--work_reps', type=int, default=1, help='the amount of work done with each batch.')
+    parser.add_argument('--num_workers', type=int, default=1, help='the number of reading threads for iter_hdf5.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.rows, parsed_args.cols, parsed_args.batch_size, parsed_args.work_reps,
+         parsed_args.num_workers)
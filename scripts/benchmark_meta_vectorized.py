@@ -0,0 +1,68 @@
+"""
+Benchmark of the task throughput of the meta steps, comparing the for-loop over tasks (batched=False) against the
+vectorized inner loop (vectorized=True), which gives each task its own inner variables as the loop does, for an
+increasing number of tasks. The batched mode, which shares the inner variables across all tasks, is shown for
+reference.
+
+Usage: python scripts/benchmark_meta_vectorized.py --framework torch --step fomaml_step --tasks 8 64 256
+"""
+
+# global
+import time
+import argparse
+import numpy as np
+
+# local
+import ivy
+
+
+def _batch_n_variables(num_tasks, num_examples, size):
+    batch = ivy.Container({'x': ivy.array(np.random.uniform(size=(num_tasks, num_examples, size)), 'float32'),
+                           'y': ivy.array(np.random.uniform(size=(num_tasks, num_examples, 1)), 'float32')})
+    variables = ivy.Container({'w0': ivy.variable(ivy.array(np.random.uniform(size=(size, size)), 'float32')),
+                               'w1': ivy.variable(ivy.array(np.random.uniform(size=(size, 1)), 'float32'))})
+    return batch, variables
+
+
+def _cost(batch, v):
+    return ivy.reduce_mean((ivy.matmul(ivy.tanh(ivy.matmul(batch.x, v.w0)), v.w1) - batch.y) ** 2)
+
+
+def _time(fn, reps):
+    fn()
+    start = time.perf_counter()
+    for _ in range(reps):
+        fn()
+    return (time.perf_counter() - start) / reps
+
+
+def main(framework, step, tasks, num_examples, size, inner_grad_steps, reps):
+    ivy.set_framework(framework)
+    step_fn = getattr(ivy, step)
+    modes = {'for-loop': {'batched': False}, 'vectorized': {'vectorized': True}, 'batched': {'batched': True}}
+    print('{:<8}'.format('tasks') + ''.join(['{:>22}'.format(m + ' (tasks/s)') for m in modes]) +
+          '{:>24}'.format('vectorized speedup'))
+    for num_tasks in tasks:
+        batch, variables = _batch_n_variables(num_tasks, num_examples, size)
+        args = (batch, _cost, variables, inner_grad_steps, 1e-2) if step == 'reptile_step' else \
+            (batch, _cost, None, variables, inner_grad_steps, 1e-2)
+        times = {m: _time(lambda: step_fn(*args, **kwargs), reps) for m, kwargs in modes.items()}
+        print('{:<8}'.format(num_tasks) + ''.join(['{:>22.1f}'.format(num_tasks / t) for t in times.values()]) +
+              '{:>24.2f}'.format(times['for-loop'] / times['vectorized']))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='torch',
+                        help='the backend framework, one of numpy, jax, tensorflow, torch or mxnet.')
+    parser.add_argument('--step', type=str, default='fomaml_step',
+                        help='the meta step, one of fomaml_step, reptile_step or maml_step.')
+    parser.add_argument('--tasks', type=int, nargs='+', default=[8, 64, 256], help='the numbers of tasks.')
+    parser.add_argument('--num_examples', type=int, default=16, help='the number of examples per task.')
+    parser.add_argument('--size', type=int, default=32, help='the feature size of the model.')
+    parser.add_argument('--inner_grad_steps', type=int, default=3, help='the number of inner loop steps.')
+    parser.add_argument('--reps', type=int, default=5, help='the number of timed meta steps.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.step, parsed_args.tasks, parsed_args.num_examples, parsed_args.size,
+         parsed_args.inner_grad_steps, parsed_args.reps)
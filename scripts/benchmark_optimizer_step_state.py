@@ -0,0 +1,81 @@
+"""
+Benchmark of the per-step cost of the optimizer step state, comparing the step count and learning rate schedule kept
+on the host against the device scalars used by compiled graphs. The device path increments the step count on the
+device and reads it back for the adam step, as every step did previously, which forces a device to host sync on GPU
+devices. The bookkeeping alone is timed, and then full Adam steps for a small container of variables.
+
+Usage: python scripts/benchmark_optimizer_step_state.py --framework torch --dev cuda:0 --steps 1000
+"""
+
+# global
+import time
+import argparse
+import numpy as np
+
+# local
+import ivy
+
+
+def _bookkeeping(optimizer):
+    def step():
+        optimizer._increment_step()
+        # adam_step converts the step to a python float, which reads device arrays back to the host
+        step_count = optimizer._get_step()
+        if optimizer._device_scalars:
+            step_count = ivy.to_scalar(step_count)
+        float(step_count)
+        optimizer._get_lr()
+    return step
+
+
+def _adam_step(optimizer, v, grads):
+    state = {'v': v}
+
+    def step():
+        state['v'] = optimizer.step(state['v'], grads)
+        ivy.to_numpy(state['v'].w0)
+    return step
+
+
+def _time(fn, steps):
+    fn()
+    start = time.perf_counter()
+    for _ in range(steps):
+        fn()
+    return (time.perf_counter() - start) / steps
+
+
+def main(framework, dev, num_arrays, size, steps):
+    ivy.set_framework(framework)
+    variables = framework != 'numpy'
+
+    def container():
+        fn = ivy.variable if variables else lambda x: x
+        return ivy.Container({'w{}'.format(i): fn(ivy.array(np.random.uniform(size=(size,)), 'float32', dev))
+                              for i in range(num_arrays)})
+
+    def optimizer(device_scalars):
+        ret = ivy.Adam(lr=ivy.WarmupLR(1e-3, warmup_steps=100, after=ivy.CosineLR(1e-3, 1000)), dev=dev)
+        if device_scalars:
+            ret._use_device_scalars()
+        return ret
+
+    grads = container()
+    print('{:<14}{:>18}{:>20}{:>10}'.format('timed', 'host scalars (us)', 'device scalars (us)', 'speedup'))
+    for name, make_fn in [('bookkeeping', _bookkeeping),
+                          ('adam step', lambda opt: _adam_step(opt, container(), grads))]:
+        host, device = [_time(make_fn(optimizer(device_scalars)), steps) for device_scalars in [False, True]]
+        print('{:<14}{:>18.1f}{:>20.1f}{:>10.2f}'.format(name, host * 1e6, device * 1e6, device / host))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='torch',
+                        help='the backend framework, one of numpy, jax, tensorflow, torch or mxnet.')
+    parser.add_argument('--dev', type=str, default='cpu', help='the device on which to create the arrays.')
+    parser.add_argument('--num_arrays', type=int, default=10, help='the number of variables in the container.')
+    parser.add_argument('--size', type=int, default=1024, help='the number of elements in each variable.')
+    parser.add_argument('--steps', type=int, default=1000, help='the number of timed steps.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.dev, parsed_args.num_arrays, parsed_args.size, parsed_args.steps)
@@ -0,0 +1,73 @@
+"""
+Benchmark of consuming a container built from queues in order, with and without queue_prefetch. Each queue read is
+given a fixed latency, standing in for a data loading process, and a fixed amount of work is done with each batch, so
+the time saved by loading the next containers in the background thread is visible in the timings.
+
+Usage: python scripts/benchmark_queue_prefetch.py --framework numpy --num_queues 50 --load_ms 5 --work_reps 20
+"""
+
+# global
+import time
+import queue
+import argparse
+import numpy as np
+
+# local
+import ivy
+
+
+class _SlowQueue(queue.Queue):
+
+    def __init__(self, load_ms):
+        super().__init__()
+        self._load_ms = load_ms
+
+    def get(self, block=True, timeout=None):
+        time.sleep(self._load_ms / 1e3)
+        return super().get(block, timeout)
+
+
+def _queues(num_queues, batch_size, load_ms):
+    queues = list()
+    for _ in range(num_queues):
+        q = _SlowQueue(load_ms)
+        q.put({'x': np.random.uniform(size=(batch_size, 256)).astype(np.float32),
+               'y': np.random.randint(0, 10, size=(batch_size,))})
+        queues.append(q)
+    return queues
+
+
+def _time_epoch(num_queues, batch_size, load_ms, work_reps, queue_prefetch):
+    queues = _queues(num_queues, batch_size, load_ms)
+    start = time.perf_counter()
+    cont = ivy.Container(queues=queues, queue_load_sizes=[batch_size] * num_queues,
+                         container_combine_method='concat', queue_prefetch=queue_prefetch)
+    for i in range(num_queues):
+        batch = cont[i * batch_size:(i + 1) * batch_size]
+        for _ in range(work_reps):
+            ivy.reduce_sum(ivy.tanh(batch.x))
+    return (time.perf_counter() - start) / num_queues
+
+
+def main(framework, num_queues, batch_size, load_ms, work_reps, prefetches):
+    ivy.set_framework(framework)
+    times = {p: _time_epoch(num_queues, batch_size, load_ms, work_reps, p) for p in [None] + prefetches}
+    print('{:<16}{:>18}{:>10}'.format('queue_prefetch', 'per batch (ms)', 'speedup'))
+    for p, t in times.items():
+        print('{:<16}{:>18.2f}{:>10.2f}'.format(str(p), t * 1e3, times[None] / t))
+    ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='numpy',
+                        help='the backend framework, one of numpy, jax, tensorflow, torch or mxnet.')
+    parser.add_argument('--num_queues', type=int, default=50, help='the number of queues, one batch each.')
+    parser.add_argument('--batch_size', type=int, default=64, help='the number of rows in each batch.')
+    parser.add_argument('--load_ms', type=float, default=5., help='the latency of each queue read in milliseconds.')
+    parser.add_argument('--work_reps', type=int, default=20, help='the amount of work done with each batch.')
+    parser.add_argument('--prefetches', type=int, nargs='+', default=[1, 2, 4],
+                        help='the queue_prefetch values to compare against no prefetching.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.num_queues, parsed_args.batch_size, parsed_args.load_ms,
+         parsed_args.work_reps, parsed_args.prefetches)
@@ -0,0 +1,72 @@
+"""
+Benchmark of sending arrays of 1MB, 100MB and 1GB to a worker process through a multiprocessing queue, either pickled
+through the queue pipe, or through shared memory blocks as used by the device mappers with shared_memory=True. Each
+transfer is timed from the put until the worker has the array ready to use, and has read one element of it.
+
+Usage: python scripts/benchmark_shared_memory_transfer.py --framework numpy --sizes_mb 1 100 1000 --reps 5
+"""
+
+# global
+import time
+import argparse
+import numpy as np
+
+# local
+import ivy
+# noinspection PyProtectedMember
+from ivy.functional.ivy.core.device import _to_shared_memory, _from_shared_memory
+
+
+def _worker_fn(input_queue, output_queue, framework_str):
+    ivy.set_framework(framework_str)
+    while True:
+        item = input_queue.get()
+        if item is None:
+            return
+        shared, x = item
+        if shared:
+            x = _from_shared_memory(x)
+        output_queue.put(float(ivy.to_numpy(x[-1:])[0]))
+        del x
+
+
+def _time_transfer(input_queue, output_queue, x, shared, reps):
+    times = list()
+    for _ in range(reps + 1):
+        start = time.perf_counter()
+        input_queue.put((shared, _to_shared_memory(x) if shared else x))
+        output_queue.get()
+        times.append(time.perf_counter() - start)
+    return min(times[1:])
+
+
+def main(framework, sizes_mb, reps):
+    ivy.set_framework(framework)
+    multiprocessing = ivy.multiprocessing('forkserver')
+    input_queue, output_queue = multiprocessing.Queue(), multiprocessing.Queue()
+    worker = multiprocessing.Process(target=_worker_fn, args=(input_queue, output_queue, framework))
+    worker.start()
+    print('{:<10}{:>14}{:>20}{:>10}'.format('size (MB)', 'pickled (ms)', 'shared memory (ms)', 'speedup'))
+    try:
+        for size_mb in sizes_mb:
+            x = ivy.to_native(ivy.array(np.random.uniform(size=(int(size_mb * 2 ** 20) // 4,)), 'float32'))
+            pickled = _time_transfer(input_queue, output_queue, x, False, reps)
+            shared = _time_transfer(input_queue, output_queue, x, True, reps)
+            print('{:<10}{:>14.1f}{:>20.1f}{:>10.2f}'.format(size_mb, pickled * 1e3, shared * 1e3, pickled / shared))
+            del x
+    finally:
+        input_queue.put(None)
+        worker.join()
+        ivy.unset_framework()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', type=str, default='numpy',
+                        help='the backend framework, one of numpy, jax, tensorflow or mxnet. torch queues already '
+                             'move tensors into shared memory, so shared memory descriptors are not used with torch.')
+    parser.add_argument('--sizes_mb', type=float, nargs='+', default=[1, 100, 1000],
+                        help='the sizes of the transferred arrays in megabytes.')
+    parser.add_argument('--reps', type=int, default=5, help='the number of timed transfers, the fastest is reported.')
+    parsed_args = parser.parse_args()
+    main(parsed_args.framework, parsed_args.sizes_mb, parsed_args.reps)